@@ -5,27 +5,268 @@
 #
 # Usage:
 #   aoc.py 2021 1 --toy --verbose
+#   aoc.py --all --jobs 8
+#   aoc.py --all --jobs 8 --format jsonl > results.jsonl
+#   aoc.py --all --no-cache
+#   aoc.py 2021 15 --bench --reps 20 --warmup 2 --out bench.json
+#   aoc.py 2021 --save-baseline
+#   aoc.py 2021 --compare --threshold 0.25
+#   aoc.py 2021 15 --profile --profile-dir profiles
+#   aoc.py 2021 15 --mem --top 10
+#   aoc.py 2021 --budget 10
+#   aoc.py 2021 --complexity --scale 0.25 --max-seconds 5
+#   aoc.py 2021 --import-profile --top 20
+#   aoc.py --all --prefetch --jobs 8
+#   aoc.py --serve --socket .aoc_daemon.sock
+#   aoc.py 2021 15 --remote --toy
+#   aoc.py 2021 15 --remote --part 2
+#   aoc.py 2021 --watch --toy
 #
 """
 import sys
+import time
 
-from utils.loader import get_all_year_modules, get_opts, get_advents_to_run
+from utils.cache import AnswerCache
+from utils.loader import get_lazy_year_modules, get_opts, get_advents_to_run
+from utils.runner import (
+    failed_day_record,
+    format_error,
+    format_record,
+    run_advent_records,
+    run_advents_in_parallel,
+    solve_day,
+)
+from utils.utils import lazy_import
+
+# Only loaded by the modes that use them, so that plain runs start quickly
+baseline = lazy_import("utils.baseline")
+bench = lazy_import("utils.bench")
+complexity = lazy_import("utils.complexity")
+daemon = lazy_import("utils.daemon")
+harness = lazy_import("utils.harness")
+import_profile = lazy_import("utils.import_profile")
+memory = lazy_import("utils.memory")
+prefetch = lazy_import("utils.prefetch")
+profiling = lazy_import("utils.profiling")
+watch = lazy_import("utils.watch")
 
 # {
-#     2021: [day_1, day_2, ...],
-#     2022: [day_1, day_2, ...],
+#     2021: {1: day_1, 2: day_2, ...},
+#     2022: {1: day_1, 2: day_2, ...},
 # }
-ADVENTS = get_all_year_modules()
+ADVENTS = get_lazy_year_modules()
+
+
+def _advent(year, day, day_function, use_toy_data, verbose, cache=None):
+    print(f"{year} {day:>2}: {solve_day(year, day, day_function, use_toy_data, verbose, cache)}")
+
+
+def _bench(advents_to_run, options):
+    bench_results = []
+    for result, error in bench.bench_days(
+        advents_to_run,
+        options["--toy"],
+        reps=int(options["--reps"] or bench.DEFAULT_REPS),
+        warmup=int(options["--warmup"] or bench.DEFAULT_WARMUP),
+    ):
+        if error is not None:
+            print(error)
+            continue
+        print("\n".join(bench.format_day(result)))
+        bench_results.append(result)
+    bench.write_results(bench_results, options["--out"] or "bench.json")
+
+    baseline_fname = options["--baseline"] or baseline.DEFAULT_BASELINE
+    if options["--compare"]:
+        comparisons = baseline.compare_to_baseline(
+            bench_results,
+            baseline.load_baseline(baseline_fname),
+            threshold=float(options["--threshold"] or baseline.DEFAULT_THRESHOLD),
+        )
+        for comparison in comparisons:
+            print(baseline.format_comparison(comparison))
+        if any(comparison.slower for comparison in comparisons):
+            sys.exit(1)
+    if options["--save-baseline"]:
+        baseline.save_baseline(bench_results, baseline_fname)
+
+
+def _profile(advents_to_run, options):
+    profile_dir = options["--profile-dir"] or profiling.DEFAULT_PROFILE_DIR
+    for year, day, day_function in advents_to_run:
+        try:
+            result = profiling.profile_day(year, day, day_function, options["--toy"], profile_dir)
+            print(f"{year} {day:>2}: {result['answers']}  ({', '.join(result['files'])})")
+        except Exception as e:
+            print(f"{year} {day:>2}: {format_error(e)}")
+
+
+def _mem(advents_to_run, options):
+    mem_results = []
+    top = int(options["--top"] or memory.DEFAULT_TOP)
+    for result, error in memory.measure_days(advents_to_run, options["--toy"], top):
+        if error is not None:
+            print(error)
+            continue
+        print("\n".join(memory.format_day(result)))
+        mem_results.append(result)
+    if options["--out"]:
+        bench.write_results(mem_results, options["--out"])
+
+
+def _budgeted(advents_to_run, options):
+    budget = float(options["--budget"])
+    for year, day, day_function in advents_to_run:
+        for part in day_function.parts:
+            outcome = harness.run_part_with_budget(part, options["--toy"], budget)
+            if outcome.status == harness.OK:
+                message = outcome.answer
+            elif outcome.status == harness.TIMEOUT:
+                message = f"TIMEOUT after {outcome.elapsed:.1f}s"
+            else:
+                message = outcome.error.splitlines()[0]
+            print(f"{year} {day:>2} {part.name}: {message}")
 
 
-def _advent(year, day, day_function, use_toy_data, verbose):
-    print(
-        f"{year} {day:>2}: {day_function(use_toy_data=use_toy_data, verbose=verbose)}"
+def _complexity(advents_to_run, options):
+    print(complexity.format_header())
+    for result, error in complexity.measure_days(
+        advents_to_run,
+        scale=float(options["--scale"] or complexity.DEFAULT_SCALE),
+        max_seconds=float(options["--max-seconds"] or complexity.DEFAULT_MAX_SECONDS),
+    ):
+        print(error if error is not None else complexity.format_result(result))
+
+
+def _import_profile(advents_to_run, options):
+    # aoc.py's own imports, then each day's (numpy etc. count towards the first day to use them)
+    module_names = ["aoc"] + [day_function.module_name for _, _, day_function in advents_to_run]
+    times = import_profile.profile_imports(module_names)
+    top = int(options["--top"] or import_profile.DEFAULT_TOP)
+    print("\n".join(import_profile.format_report(times, top)))
+
+
+def _prefetch(advents_to_run, options):
+    days = [(year, day) for year, day, _ in advents_to_run]
+    concurrency = int(options["--jobs"] or prefetch.DEFAULT_CONCURRENCY)
+    try:
+        results = prefetch.prefetch_inputs(days, concurrency=concurrency)
+    except Exception as e:
+        # e.g. no session token
+        print(format_error(e))
+        sys.exit(1)
+    for year, day, path, error, attempts in results:
+        print(f"{year} {day:>2}: {path if error is None else error}")
+    if any(result.error is not None for result in results):
+        sys.exit(1)
+
+
+def _serve(options):
+    socket_path = options["--socket"] or daemon.SOCKET_PATH
+    print(f"listening on {socket_path}")
+    try:
+        daemon.serve(socket_path)
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        # e.g. another daemon is already running
+        print(format_error(e))
+        sys.exit(1)
+
+
+def _remote(advents_to_run, options):
+    try:
+        part = int(options["--part"]) if options["--part"] else None
+    except ValueError as e:
+        print(format_error(e))
+        sys.exit(1)
+    requests = daemon.make_requests(
+        [(year, day) for year, day, _ in advents_to_run], options["--toy"], part
     )
+    try:
+        responses = daemon.ask(requests, options["--socket"] or daemon.SOCKET_PATH)
+    except OSError as e:
+        print(f"{format_error(e)} (is `aoc.py --serve` running?)")
+        sys.exit(1)
+    for response in responses:
+        answers = response["answers"] if response["error"] is None else response["error"]
+        print(f"{response['year']} {response['day']:>2}: {answers}")
+
+
+def _watch(advents_to_run, options):
+    watcher = watch.Watcher(advents_to_run, options["--toy"])
+    for rerun in watcher.run():
+        print(watch.format_rerun(rerun))
+    print(f"watching {', '.join(watch.WATCHED_PATTERNS)} (ctrl-c to stop)")
+    try:
+        while True:
+            time.sleep(watch.POLL_INTERVAL)
+            changed, reruns = watcher.poll()
+            if changed:
+                print(f"changed: {', '.join(sorted(changed))}")
+            for rerun in reruns:
+                print(watch.format_rerun(rerun))
+    except KeyboardInterrupt:
+        pass
+
+
+def _jsonl(advents_to_run, options, jobs, cache):
+    """One JSON record per part, instead of one line of text per day"""
+    if jobs > 1:
+        results = run_advents_in_parallel(
+            advents_to_run,
+            options["--toy"],
+            options["--verbose"],
+            jobs=jobs,
+            cache=cache,
+            run=run_advent_records,
+        )
+    else:
+        results = (
+            run_advent_records(
+                year, day, day_function, options["--toy"], options["--verbose"], cache
+            )
+            for year, day, day_function in advents_to_run
+        )
+    for year, day, records, error in results:
+        for record in records if error is None else [failed_day_record(year, day, error)]:
+            print(format_record(record), flush=True)
 
 
 if __name__ == "__main__":
     options = get_opts(sys.argv[1:])
+    if options["--serve"]:
+        _serve(options)
+        sys.exit()
     advents_to_run = get_advents_to_run(ADVENTS, sys.argv[1:], options["--all"])
-    for year, day, day_function in advents_to_run:
-        _advent(year, day, day_function, options["--toy"], options["--verbose"])
+    jobs = int(options["--jobs"] or 1)
+    cache = None if options["--no-cache"] else AnswerCache()
+    if options["--remote"]:
+        _remote(advents_to_run, options)
+    elif options["--watch"]:
+        _watch(advents_to_run, options)
+    elif options["--prefetch"]:
+        _prefetch(advents_to_run, options)
+    elif options["--bench"] or options["--save-baseline"] or options["--compare"]:
+        _bench(advents_to_run, options)
+    elif options["--mem"]:
+        _mem(advents_to_run, options)
+    elif options["--complexity"]:
+        _complexity(advents_to_run, options)
+    elif options["--import-profile"]:
+        _import_profile(advents_to_run, options)
+    elif options["--budget"]:
+        _budgeted(advents_to_run, options)
+    elif options["--profile"]:
+        _profile(advents_to_run, options)
+    elif options["--format"] == "jsonl":
+        _jsonl(advents_to_run, options, jobs, cache)
+    elif jobs > 1:
+        results = run_advents_in_parallel(
+            advents_to_run, options["--toy"], options["--verbose"], jobs=jobs, cache=cache
+        )
+        for year, day, answers, error in results:
+            print(f"{year} {day:>2}: {answers if error is None else error}")
+    else:
+        for year, day, day_function in advents_to_run:
+            _advent(year, day, day_function, options["--toy"], options["--verbose"], cache)
@@ -1,10 +1,11 @@
 """
 # https://adventofcode.com/2021/day/1
 """
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-measurements = [int(item) for item in get_line_items("aoc_2021/input/01.txt")]
-toy_measurements = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+input = LazyInput(2021, 1, transform=int)
+toy_input = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
 
 
 def count_increasing_items(items):
@@ -46,6 +47,7 @@ def part_2(measurements, verbose=False):
     return count_increasing_items(sliding_window_sums)
 
 
+@register(2021, 1)
 def day_1(use_toy_data=False, verbose=False):
-    data = toy_measurements if use_toy_data else measurements
+    data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -5,11 +5,12 @@
 """
 from dataclasses import dataclass
 
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
 
-commands = [item for item in get_line_items("aoc_2021/input/02.txt")]
-toy_commands = ["forward 5", "down 5", "forward 8", "up 3", "down 8", "forward 2"]
+input = LazyInput(2021, 2)
+toy_input = ["forward 5", "down 5", "forward 8", "up 3", "down 8", "forward 2"]
 
 
 class Vehicle:
@@ -96,6 +97,7 @@ def part_2(commands, verbose=False):
     return sub.x * sub.depth
 
 
+@register(2021, 2)
 def day_2(use_toy_data=False, verbose=False):
-    data = toy_commands if use_toy_data else commands
+    data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -3,14 +3,15 @@
 #
 # https://adventofcode.com/2021/day/3
 """
+from utils.registry import register
 from utils.utils import (
     two_d_array_from_digit_strings,
     digits_to_int,
-    get_line_items,
+    LazyInput,
     vertical_slice,
 )
 
-toy_data = [
+toy_input = [
     "00100",
     "11110",
     "10110",
@@ -25,7 +26,7 @@ toy_data = [
     "01010",
 ]
 
-data = [item for item in get_line_items("aoc_2021/input/03.txt")]
+input = LazyInput(2021, 3)
 
 
 def calc_gamma_digits(digits):
@@ -93,6 +94,7 @@ def part_2(data, verbose=False):
     return oxy_rating * scrubber_rating
 
 
+@register(2021, 3)
 def day_3(use_toy_data=False, verbose=False):
-    _data = toy_data if use_toy_data else data
+    _data = toy_input if use_toy_data else input
     return [part_1(_data, verbose), part_2(_data, verbose)]
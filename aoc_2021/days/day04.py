@@ -4,9 +4,10 @@
 import time
 
 from collections import defaultdict
-from utils.utils import get_line_items, BOLD, CLEAR
+from utils.registry import register
+from utils.utils import LazyInput, BOLD, CLEAR
 
-input = list(get_line_items("aoc_2021/input/04.txt"))
+input = LazyInput(2021, 4)
 toy_input = [
     "7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1",
     "",
@@ -174,6 +175,7 @@ def part_2(input, verbose=False):
             time.sleep(1)
 
 
+@register(2021, 4)
 def day_4(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -1,10 +1,11 @@
 """
 # https://adventofcode.com/2021/day/5
 """
-import pytest
-from utils.utils import get_line_items
+from utils.parsed import parse_once
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2021/input/05.txt"))
+input = LazyInput(2021, 5)
 toy_input = [
     "0,9 -> 5,9",
     "8,0 -> 0,8",
@@ -33,7 +34,7 @@ expected_maps = {
 }
 
 
-def parse_input(lines):
+def parse(lines):
     """
     return pairs of tuples for each line
     e.g.
@@ -70,22 +71,6 @@ def interpolate(a, b):
     return [(x, f(x)) for x in range(a[0], b[0] + step, step)]
 
 
-@pytest.mark.parametrize(
-    "a,b,expected",
-    [
-        [(0, 0), (2, 2), [(0, 0), (1, 1), (2, 2)]],
-        [(2, 2), (0, 0), [(0, 0), (1, 1), (2, 2)]],
-        [(0, 2), (2, 0), [(0, 2), (1, 1), (2, 0)]],
-        [(2, 0), (0, 2), [(0, 2), (1, 1), (2, 0)]],
-        [(0, 0), (2, 0), [(0, 0), (1, 0), (2, 0)]],
-        # vertical:
-        [(0, 0), (0, 2), [(0, 0), (0, 1), (0, 2)]],
-    ],
-)
-def test_interpolate(a, b, expected):
-    assert sorted(interpolate(a, b)) == expected
-
-
 def is_vertical_or_horizontal(line):
     a, b = line
     return (a[0] == b[0]) or (a[1] == b[1])
@@ -164,7 +149,7 @@ def part_2(input, verbose=False):
     return grid.score(min_overlap=2)
 
 
+@register(2021, 5)
 def day_5(use_toy_data=False, verbose=False):
-    data = toy_input if use_toy_data else input
-    data = parse_input(data)
+    data = parse_once(parse, toy_input if use_toy_data else input)
     return [part_1(data, verbose), part_2(data, verbose)]
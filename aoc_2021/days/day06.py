@@ -3,12 +3,19 @@
 """
 from collections import defaultdict
 
-from utils.utils import get_line_items, parse_one_line_input
+from utils.parsed import parse_once
+from utils.registry import register
+from utils.utils import LazyInput, parse_one_line_input
 
-input = list(get_line_items("aoc_2021/input/06.txt"))
+input = LazyInput(2021, 6)
 toy_input = ["3,4,3,1,2"]
 
 
+def parse(input):
+    """["3,4,3,1,2"] -> [3, 4, 3, 1, 2]"""
+    return parse_one_line_input(input)
+
+
 def init_fish_buckets(input, max_cd=8):
     """
     Make a list of fish-counts, bucketed by their spawn cooldown,
@@ -58,7 +65,7 @@ def part_2(input, verbose=False):
     return sum(final_fish)
 
 
+@register(2021, 6)
 def day_6(use_toy_data=False, verbose=False):
-    data = toy_input if use_toy_data else input
-    data = parse_one_line_input(data)
+    data = parse_once(parse, toy_input if use_toy_data else input)
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -1,12 +1,12 @@
 """
 # https://adventofcode.com/2021/day/7
 """
-import pytest
 from statistics import mean, median
 
-from utils.utils import get_line_items, parse_one_line_input
+from utils.registry import register
+from utils.utils import LazyInput, parse_one_line_input
 
-input = list(get_line_items("aoc_2021/input/07.txt"))
+input = LazyInput(2021, 7)
 toy_input = ["16,1,2,0,4,2,7,1,2,14"]
 
 # ---- Part 1: One fuel per move
@@ -45,27 +45,6 @@ def pos_from_cost(desired_cost, cost_fn):
     return d - 1
 
 
-@pytest.mark.parametrize(
-    "distance,expected",
-    [
-        [0, 0],
-        # from toy example:
-        [abs(16 - 5), 66],
-        [abs(1 - 5), 10],
-        [abs(2 - 5), 6],
-        [abs(0 - 5), 15],
-        [abs(4 - 5), 1],
-        [abs(2 - 5), 6],
-        [abs(7 - 5), 3],
-        [abs(1 - 5), 10],
-        [abs(2 - 5), 6],
-        [abs(14 - 5), 45],
-    ],
-)
-def test_exponential_fuel_cost(distance, expected):
-    assert expected == exponential_fuel_cost(distance)
-
-
 def part_2(input, verbose=False):
     crabs = list(parse_one_line_input(input))
 
@@ -208,6 +187,7 @@ def part_2(input, verbose=False):
     return brute_force_min_fuel_costs(crabs, min_pos, max_pos)
 
 
+@register(2021, 7)
 def day_7(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -1,10 +1,11 @@
 """
 # https://adventofcode.com/2021/day/8
 """
-from utils.utils import two_d_array_from_digit_strings, digits_to_int, get_line_items
+from utils.registry import register
+from utils.utils import two_d_array_from_digit_strings, digits_to_int, LazyInput
 
 
-input = list(get_line_items("aoc_2021/input/08.txt"))
+input = LazyInput(2021, 8)
 toy_input = [
     "be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe",
     "edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc",
@@ -246,6 +247,7 @@ def part_2(input, verbose=False):
     )
 
 
+@register(2021, 8)
 def day_8(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
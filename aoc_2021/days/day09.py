@@ -1,12 +1,15 @@
 """
 # https://adventofcode.com/2021/day/9
 """
-from typing import Callable, Dict, Optional, Set, Tuple
-from colors import none, bold, cyan, red, green, blue, magenta, yellow  # type: ignore
+from typing import Callable, Dict, Optional, Set
 
-from utils.utils import Coord, get_line_items, neighbors, two_d_array_from_digit_strings
+from utils.parsed import parse_once
+from utils.registry import register
+from utils.utils import ByteGrid, LazyInput, lazy_import, neighbor_table
 
-input = list(get_line_items("aoc_2021/input/09.txt"))
+colors = lazy_import("colors")
+
+input = LazyInput(2021, 9)
 toy_input = [
     # lines input
     "2199943210",
@@ -17,19 +20,19 @@ toy_input = [
 ]
 
 
-def render(grid, color_coords: Optional[Dict[Callable, Set[Coord]]] = None):
-    """Print a 2d grid with some coordinates in colors"""
+def render(grid: ByteGrid, color_coords: Optional[Dict[Callable, Set[int]]] = None):
+    """Print a 2d grid with some cells (by grid.index()) in colors"""
     color_coords = color_coords or {}
 
     def render_cell(row: int, col: int) -> str:
-        number = grid[row][col]
+        number = grid[row, col]
         for color_fn, coords in color_coords.items():  # type: ignore
-            if (row, col) in coords:
+            if grid.index(row, col) in coords:
                 return color_fn(f"{number:1}")
         return f"{number:1}"
 
-    grid_rows = len(grid)
-    grid_cols = len(grid[0])
+    grid_rows = grid.height
+    grid_cols = grid.width
     row_strings = [
         "".join([render_cell(row_index, col_index) for col_index in range(grid_cols)])
         for row_index in range(grid_rows)
@@ -37,30 +40,15 @@ def render(grid, color_coords: Optional[Dict[Callable, Set[Coord]]] = None):
     return "\n".join(row_strings)
 
 
-def find_local_minima(grid):
-    """Get the set of grid coordinates that are local minima"""
-    min_row = min_col = 0
-    max_row = len(grid) - 1
-    max_col = len(grid[0]) - 1
-
-    def is_minima(row, col):
-        # cell value is smaller than all its neighbors
+def find_local_minima(grid: ByteGrid) -> Set[int]:
+    """Get the set of grid cells (flat indexes) that are local minima"""
+    table = neighbor_table(grid.width, grid.height, include_diagonals=False)
 
-        # fmt: off
-        return (
-                (row == min_row or grid[row][col] < grid[row - 1][col])
-            and (row == max_row or grid[row][col] < grid[row + 1][col])
-            and (col == min_col or grid[row][col] < grid[row][col - 1])
-            and (col == max_col or grid[row][col] < grid[row][col + 1])
-        )
-        # fmt: on
-
-    # Look at every cell
+    # Look at every cell: its value is smaller than all its neighbors
     return set(
-        (row, col)
-        for row in range(len(grid))
-        for col in range(len(grid[row]))
-        if is_minima(row, col)
+        index
+        for index, height in enumerate(grid)
+        if all(height < grid[neighbor] for neighbor in table[index])
     )
 
 
@@ -69,19 +57,20 @@ def find_local_minima(grid):
 # --------------------------
 
 
-def part_1(input, verbose=False):
-    grid = two_d_array_from_digit_strings(input)
+def parse(input) -> ByteGrid:
+    return ByteGrid.from_digit_strings(input)
+
 
+def part_1(grid: ByteGrid, verbose=False):
     local_minima = find_local_minima(grid)
 
     if verbose:
         print(">>> Part 1 Minima:")
-        print(render(grid, {bold: local_minima}))
+        print(render(grid, {colors.bold: local_minima}))
 
-    def risk(coord):
+    def risk(index):
         # The risk level of a low point is 1 plus its height"
-        row, col = coord
-        return 1 + grid[row][col]
+        return 1 + grid[index]
 
     return sum(map(risk, local_minima))
 
@@ -91,14 +80,10 @@ def part_1(input, verbose=False):
 # --------------------------
 
 
-def fill_basin(grid, starting_minimum: Tuple[int, int]) -> Set[Tuple[int, int]]:
+def fill_basin(grid: ByteGrid, starting_minimum: int) -> Set[int]:
     # expand until we are no longer going uphill, or encounter a Nine
     basin = {starting_minimum}
-    max_row = len(grid) - 1
-    max_col = len(grid[0]) - 1
-
-    def _grid(coord):
-        return grid[coord[0]][coord[1]]
+    table = neighbor_table(grid.width, grid.height, include_diagonals=False)
 
     queue = [starting_minimum]
     while len(queue):
@@ -106,17 +91,16 @@ def fill_basin(grid, starting_minimum: Tuple[int, int]) -> Set[Tuple[int, int]]:
         item = queue.pop(0)
         # print(f"  item: {item}")
 
-        current_val = _grid(item)
-        # nbcs = neighbors(item, max_row, max_col)
-        # print(f" -- neighbors: {nbcs}")
-        for coord in neighbors(item, max_row, max_col, include_diagonals=False):
-            # print(f"neighbor: {coord}")
-            val = _grid(coord)
+        current_val = grid[item]
+        # print(f" -- neighbors: {list(table[item])}")
+        for neighbor in table[item]:
+            # print(f"neighbor: {grid.coord(neighbor)}")
+            val = grid[neighbor]
             # print(f"  cur: {current_val} < {val} ?")
-            if val < 9 and val >= current_val and coord not in basin:
-                # print(f"  Adding {coord} to basin")
-                basin.add(coord)
-                queue.append(coord)
+            if val < 9 and val >= current_val and neighbor not in basin:
+                # print(f"  Adding {neighbor} to basin")
+                basin.add(neighbor)
+                queue.append(neighbor)
 
     # print(f"basin: {basin}")
     return basin
@@ -127,9 +111,9 @@ def colorize_items(items):
     # TODO: Use color constants instead of functions
     #       so that we can use gradient scaling for pretty rendering
     # colors = ["cyan", "red", "green", "blue", "magenta", "yellow"]
-    colors = [cyan, red, green, blue, magenta, yellow]
-    n_colors = len(colors)
-    return [(colors[index % n_colors], item) for index, item in enumerate(items)]
+    palette = [colors.cyan, colors.red, colors.green, colors.blue, colors.magenta, colors.yellow]
+    n_colors = len(palette)
+    return [(palette[index % n_colors], item) for index, item in enumerate(items)]
 
 
 def combine_dicts_of_sets(kv_pairs):
@@ -143,7 +127,7 @@ def combine_dicts_of_sets(kv_pairs):
     return d
 
 
-def part_2(input, verbose=False):
+def part_2(grid: ByteGrid, verbose=False):
     """
     A basin is all locations that eventually flow downward to a single low point.
     Therefore, every low point has a basin, although some basins are very small.
@@ -160,24 +144,17 @@ def part_2(input, verbose=False):
     8767896789
     9899965678
     """
-    grid = two_d_array_from_digit_strings(input)
-
     if verbose:
         print("--- Day 9 Part 2 ---")
 
     local_minima = find_local_minima(grid)
 
     if verbose:
-        print(f"Local minima: {local_minima}")
+        print(f"Local minima: {sorted(map(grid.coord, local_minima))}")
 
-    nines = set(
-        (row, col)
-        for row in range(len(grid))
-        for col in range(len(grid[row]))
-        if grid[row][col] == 9
-    )
+    nines = set(index for index, height in enumerate(grid) if height == 9)
 
-    # sets of coords
+    # sets of flat indexes
     basins = [fill_basin(grid, minimum) for minimum in local_minima]
     basin_sizes = list(reversed(sorted(len(basin) for basin in basins)))
 
@@ -189,7 +166,7 @@ def part_2(input, verbose=False):
         # (color_fn, coords) tuples
         # colors are NOT unique so we can't make a dict directly
         colorized_basins = combine_dicts_of_sets(colorize_items(basins))
-        color_coords = {**colorized_basins, none: local_minima, bold: nines}
+        color_coords = {**colorized_basins, colors.none: local_minima, colors.bold: nines}
         print(">>> Part 2 basins:")
         # TODO: render height gradient with shading of any given color
         print(render(grid, color_coords=color_coords))
@@ -198,6 +175,7 @@ def part_2(input, verbose=False):
     return score
 
 
+@register(2021, 9)
 def day_9(use_toy_data=False, verbose=False):
-    data = toy_input if use_toy_data else input
+    data = parse_once(parse, toy_input if use_toy_data else input)
     return [part_1(data, verbose), part_2(data, verbose)]
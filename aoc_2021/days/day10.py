@@ -2,9 +2,10 @@
 # https://adventofcode.com/2021/day/10
 """
 from typing import List
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2021/input/10.txt"))
+input = LazyInput(2021, 10)
 toy_input: List[str] = [
     "[({(<(())[]>[[{[]{<()<>>",
     "[(()[<>])]({[<{<<[]>>(",
@@ -157,6 +158,7 @@ def part_2(input, verbose=False):
     return middle_score
 
 
+@register(2021, 10)
 def day_10(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -2,18 +2,20 @@
 # Dumbo Octopus
 # https://adventofcode.com/2021/day/11
 """
-from copy import deepcopy
-from typing import List, Set, Tuple, Union
+from typing import List, Set
+from utils.parsed import parse_once
+from utils.registry import register
 from utils.utils import (
-    Coord,
-    Grid,
-    get_line_items,
-    two_d_array_from_digit_strings,
-    neighbors,
+    ByteGrid,
+    LazyInput,
+    NeighborTable,
+    lazy_import,
+    neighbor_table,
 )
-from colors import bold, none
 
-input = list(get_line_items("aoc_2021/input/11.txt"))
+colors = lazy_import("colors")
+
+input = LazyInput(2021, 11)
 toy_input: List[str] = [
     "5483143223",
     "2745854711",
@@ -35,58 +37,24 @@ toy_input: List[str] = [
 # ]
 
 
-class NicerGrid:
-    """A 2d array that can be a"""
-
-    def __init__(self, data):
-        self.data = deepcopy(data)
-        self.n_rows = len(data)
-        self.n_cols = len(data[0])
-        self.max_row = self.n_rows - 1
-        self.max_col = self.n_cols - 1
-        self.coords = [
-            (row, col) for row in range(self.n_rows) for col in range(self.n_cols)
-        ]
-
-    def __getitem__(self, index: Union[int, Coord]) -> int:
-        """
-        Let is do grid[coord], e.g. grid[(3, 4)] instead of having to deconstruct them all the time
-        """
-        if type(index) is int:
-            return self.data[index]
-        if type(index) is tuple and len(index) == 2:
-            return self.data[index[0]][index[1]]
-        raise IndexError
-
-    def __setitem__(self, index: Union[int, Coord], value):
-        """
-        Let is do grid[coord], e.g. grid[(3, 4)] instead of having to deconstruct them all the time
-        """
-        if type(index) is tuple and len(index) == 2:
-            self.data[index[0]][index[1]] = value
-            return self.data[index[0]][index[1]]
-
-    def __str__(self):
-        """Render grid with bold zeros"""
-        grid = self.data
-
-        def render_cell(row: int, col: int) -> str:
-            number = grid[row][col]
-            n_str = f"{number:1}"
-            return bold(n_str) if number == 0 else n_str
-
-        grid_rows = self.n_rows
-        grid_cols = self.n_cols
-        row_strings = [
-            "".join(
-                [render_cell(row_index, col_index) for col_index in range(grid_cols)]
-            )
-            for row_index in range(grid_rows)
-        ]
-        return "\n".join(row_strings)
-
-
-def flash(neighbor: Coord, grid: NicerGrid, flashed: Set[Coord]) -> int:
+def render(grid: ByteGrid) -> str:
+    """Render grid with bold zeros"""
+
+    def render_cell(number: int) -> str:
+        n_str = f"{number:1}"
+        return colors.bold(n_str) if number == 0 else n_str
+
+    return "\n".join(
+        "".join(render_cell(number) for number in grid.row(row_index))
+        for row_index in range(grid.height)
+    )
+
+
+# every energy level + 1, for the whole grid at once
+PLUS_ONE = bytes((n + 1) % 256 for n in range(256))
+
+
+def flash(neighbor: int, grid: ByteGrid, flashed: Set[int], table: NeighborTable) -> int:
     # print(f" --- flash {neighbor}")
     # if neighbor in flashed:
     #     # this one already flashed once
@@ -95,10 +63,10 @@ def flash(neighbor: Coord, grid: NicerGrid, flashed: Set[Coord]) -> int:
     if neighbor not in flashed:
         flash_count = 1
         flashed.add(neighbor)
-        for neighbor in neighbors(neighbor, grid.max_row, grid.max_col):
+        for neighbor in table[neighbor]:
             grid[neighbor] += 1
             if neighbor not in flashed and grid[neighbor] > 9:
-                flash_count += flash(neighbor, grid, flashed)
+                flash_count += flash(neighbor, grid, flashed, table)
 
     return flash_count
 
@@ -113,57 +81,63 @@ def flash(neighbor: Coord, grid: NicerGrid, flashed: Set[Coord]) -> int:
 # - (An octopus can only flash at most once per step.)
 # - Finally, any octopus that flashed during this step has its energy level set to 0
 #
-def step(grid: NicerGrid, verbose=False):
-    flashed = set()
+def step(grid: ByteGrid, verbose=False):
+    # octopi are flat indexes into grid, rather than (row, col)
+    table = neighbor_table(grid.width, grid.height)
+    flashed: Set[int] = set()
     # increase all energy levels by one
     if verbose:
         print(">>> increase all by one")
-    for coord in grid.coords:
-        grid[coord] += 1
+    grid.cells[:] = grid.cells.translate(PLUS_ONE)
 
     # flash each octopus with energy > 9
-    gt_nines = {c for c in grid.coords if grid[c] > 9}
+    gt_nines = {index for index, energy in enumerate(grid) if energy > 9}
     if verbose:
-        print(f">>> GT 9: {gt_nines}")
+        print(f">>> GT 9: {sorted(map(grid.coord, gt_nines))}")
 
-    flash_count = sum(flash(coord, grid, flashed) for coord in gt_nines)
+    flash_count = sum(flash(index, grid, flashed, table) for index in gt_nines)
 
     if verbose:
-        print(f">>> flashed {flashed}")
-    for coord in flashed:
-        if grid[coord] > 9:
+        print(f">>> flashed {sorted(map(grid.coord, flashed))}")
+    for index in flashed:
+        if grid[index] > 9:
             if verbose:
-                print(f"--- zeroing {coord}")
-            grid[coord] = 0
+                print(f"--- zeroing {grid.coord(index)}")
+            grid[index] = 0
 
     if verbose:
-        print(grid)
+        print(render(grid))
 
     return flash_count
 
 
-def part_1(input, verbose=False):
+def parse(input) -> ByteGrid:
+    return ByteGrid.from_digit_strings(input)
+
+
+def part_1(octopi: ByteGrid, verbose=False):
     """
     How many total flashes are there after 100 steps?
     """
-    grid = NicerGrid(two_d_array_from_digit_strings(input))
+    grid = octopi.copy()
 
     return sum(step(grid, verbose=verbose) for i in range(100))
 
 
-def part_2(input, verbose=False):
-    grid = NicerGrid(two_d_array_from_digit_strings(input))
-    grid_size = grid.n_rows * grid.n_cols
+def part_2(octopi: ByteGrid, verbose=False):
+    grid = octopi.copy()
+    grid_size = len(grid)
 
     step_number = 0
     while True:
         step_number += 1
         n_flashed = step(grid, verbose=verbose)
         if n_flashed == grid_size:
-            # and {0} == set(grid[coord] for coord in grid.coords):
+            # and {0} == set(grid)
             return step_number
 
 
+@register(2021, 11)
 def day_11(use_toy_data=False, verbose=False):
-    data = toy_input if use_toy_data else input
+    data = parse_once(parse, toy_input if use_toy_data else input)
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -4,9 +4,10 @@
 """
 from collections import Counter
 from typing import Dict, List
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2021/input/12.txt"))
+input = LazyInput(2021, 12)
 toy_input: List[str] = [
     # 10 paths:
     #      start
@@ -195,6 +196,7 @@ def sort_paths_in_place_by_length_before_alphabet(paths):
     return paths
 
 
+@register(2021, 12, slow=True)
 def day_12(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -1,13 +1,17 @@
 """
 # https://adventofcode.com/2021/day/13
 """
-import numpy as np
-from numpy.typing import ArrayLike, NDArray
 from pprint import pprint
-from typing import Dict, List, Tuple
-from utils.utils import get_line_items
+from typing import TYPE_CHECKING, Dict, List, Tuple
+from utils.registry import register
+from utils.utils import LazyInput, lazy_import
 
-input = list(get_line_items("aoc_2021/input/13.txt"))
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+np = lazy_import("numpy")
+
+input = LazyInput(2021, 13)
 toy_input: List[str] = [
     # x,y => col, row
     "6,10",
@@ -49,7 +53,7 @@ def parse_marks_and_instructions(input: List[str]) -> Tuple[List[List[int]], Lis
     return mark_positions, instructions
 
 
-def create_np_grid(marks: List[List[int]]) -> ArrayLike:
+def create_np_grid(marks: List[List[int]]) -> "ArrayLike":
     # A grid of booleans would be more efficiency
     max_rows = 1 + max(mark[1] for mark in marks)
     max_cols = 1 + max(mark[0] for mark in marks)
@@ -62,7 +66,7 @@ def create_np_grid(marks: List[List[int]]) -> ArrayLike:
 
 
 class Paper:
-    def __init__(self, grid: ArrayLike):
+    def __init__(self, grid: "ArrayLike"):
         self.grid = grid
         self.rendered = None
 
@@ -187,12 +191,7 @@ def part_2(input, verbose=False):
     return "CPZLPFZL"  # FIXME
 
 
+@register(2021, 13)
 def day_13(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
-
-
-# debugging aids
-marks, instructions = parse_marks_and_instructions(input)
-grid = create_np_grid(marks)
-paper = Paper(grid)
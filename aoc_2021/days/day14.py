@@ -1,13 +1,13 @@
 """
 # https://adventofcode.com/2021/day/14
 """
-import pytest
 from collections import Counter, defaultdict
 from math import ceil
 from typing import Dict, List, Tuple
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2021/input/14.txt"))
+input = LazyInput(2021, 14)
 toy_input: List[str] = [
     "NNCB",  # starting polymer
     "",
@@ -326,38 +326,6 @@ def insert_replacements(polymer: Dict[str, int], rules: Dict[str, str]):
         polymer[pair] += count
 
 
-@pytest.fixture
-def toy_rules():
-    # rules as parsed from toy data
-    return {
-        # fmt: off
-        "BB": "N", "BC": "B", "BH": "H", "BN": "B", "CB": "H",
-        "CC": "N", "CH": "B", "CN": "C", "HB": "C", "HC": "B",
-        "HH": "N", "HN": "C", "NB": "B", "NC": "B", "NH": "C",
-        "NN": "C",
-        # fmt: on
-    }
-
-
-@pytest.mark.parametrize(
-    "polymer,expected",
-    [
-        [get_polymer("NNCB"), get_polymer("NCNBCHB")],
-        [get_polymer("NCNBCHB"), get_polymer("NBCCNBBBCBHCB")],
-        [get_polymer("NBCCNBBBCBHCB"), get_polymer("NBBBCNCCNBBNBNBBCHBHHBCHB")],
-        [
-            get_polymer("NBBBCNCCNBBNBNBBCHBHHBCHB"),
-            get_polymer("NBBNBNBBCCNBCNCCNBBNBBNBBBNBBNBBCBHCBHHNHCBBCBHCB"),
-        ],
-    ],
-)
-def test_insert_replacements(polymer, expected, toy_rules):
-    insert_replacements(polymer, toy_rules)
-    assert (
-        normalize_counts(polymer) == expected
-    )  # default dict vs regular dict is still OK
-
-
 def count_chars(polymer):
     char_counts = defaultdict(int)
     for pair, count in polymer.items():
@@ -368,17 +336,6 @@ def count_chars(polymer):
     return Counter({char: ceil(count / 2) for char, count in char_counts.items()})
 
 
-def test_count_chars():
-    polymer = {
-        # fmt: off
-        "NC": 42, "CB": 115, "CN": 102, "NB": 796, "BC": 120, "CH": 21,
-        "HB": 26, "CC": 60, "BB": 812, "BH": 81, "HC": 76,
-        "BN": 735, "HH": 32, "HN": 27, "NH": 27,
-        # fmt: on
-    }
-    assert count_chars(polymer) == {"N": 865, "C": 298, "B": 1749, "H": 161}
-
-
 def part_2(input, verbose=False, n_iterations=40):
     """
     Same as above, but with 40 iterations.
@@ -411,12 +368,7 @@ def part_2(input, verbose=False, n_iterations=40):
     return most_common - least_common
 
 
-@pytest.mark.parametrize("n_iterations", list(range(1, 19)))
-def test_same_answers(n_iterations):
-    data = toy_input
-    assert part_1(data, False, n_iterations) == part_2(data, False, n_iterations)
-
-
+@register(2021, 14)
 def day_14(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
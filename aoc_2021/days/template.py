@@ -2,9 +2,10 @@
 # https://adventofcode.com/2021/day/N
 """
 from typing import List
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2021/input/NN.txt"))
+input = LazyInput(2021, N)
 toy_input: List[str] = []
 
 
@@ -16,6 +17,7 @@ def part_2(input, verbose=False):
     pass
 
 
+@register(2021, N)
 def day_N(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
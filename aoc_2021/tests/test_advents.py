@@ -5,18 +5,13 @@
 #
 import pytest
 
-from utils.loader import get_all_year_modules
+from utils.harness import OK, TIMEOUT, run_part_with_budget
+from utils.loader import get_lazy_year_modules
 
-ADVENTS = get_all_year_modules()
+ADVENTS = get_lazy_year_modules()
 YEAR = 2021
 
 
-class SkipTest:
-    def __init__(self, reason, expected):
-        self.reason = reason
-        self.expected = expected
-
-
 TOY_EXPECTED = {
     YEAR: {
         1: [7, 5],
@@ -50,43 +45,48 @@ EXPECTED = {
         9: [452, 1263735],
         10: [367059, 1952146692],
         11: [1691, 216],
-        12: [4549, SkipTest("execution takes too long", 120535)],
+        12: [4549, 120535],
         13: [607, "CPZLPFZL"],
         14: [3143, 4110215602456],
-        15: [619, SkipTest("execution takes too long", 2922)],
+        15: [619, 2922],
     }
 }
 
 
 def _advent(day_index, use_toy_data=False, verbose=False):
-    return ADVENTS[YEAR][day_index - 1](use_toy_data=use_toy_data, verbose=verbose)
+    return ADVENTS[YEAR][day_index](use_toy_data=use_toy_data, verbose=verbose)
+
+
+def _part(day_index, part_index):
+    return ADVENTS[YEAR][day_index].parts[part_index - 1]
+
+
+def _expected_parts(expected_by_day):
+    return [
+        (day_number, part_number, expected)
+        for day_number in sorted(ADVENTS[YEAR])
+        for part_number, expected in enumerate(expected_by_day[YEAR][day_number], start=1)
+    ]
 
 
 @pytest.mark.parametrize(
     "key,expected",
     [
         (day_number, TOY_EXPECTED[YEAR][day_number])
-        for day_number in range(1, 1 + len(ADVENTS[YEAR]))
+        for day_number in sorted(ADVENTS[YEAR])
     ],
 )
 def test_toy_answers(key, expected):
     assert expected == _advent(key, use_toy_data=True)
 
 
-@pytest.mark.parametrize(
-    "key,expected",
-    [
-        (day_number, EXPECTED[YEAR][day_number])
-        for day_number in range(1, 1 + len(ADVENTS[YEAR]))
-    ],
-)
-def test_answers(key, expected):
-    # Running these directly for every item is dumb, in that
-    # we don't have the granularity to do part 1 + 2 skips separately,
-    # but since I'm not actively working on this, I don't really care a ton.
+@pytest.mark.parametrize("day,part,expected", _expected_parts(EXPECTED))
+def test_answers(day, part, expected):
+    # Each part runs on its own, in a child process, with a time budget
+    # ($AOC_PART_BUDGET): slow parts are checked whenever they fit in it.
     assert expected is not None
-    if SkipTest not in map(type, expected):
-        # This will skip anything that's too long,
-        assert expected == _advent(key, use_toy_data=False)
-    else:
-        pytest.skip("Test skipped")
+    outcome = run_part_with_budget(_part(day, part), use_toy_data=False)
+    if outcome.status == TIMEOUT:
+        pytest.skip(f"execution took longer than {outcome.elapsed:.0f}s")
+    assert outcome.status == OK, outcome.error
+    assert expected == outcome.answer
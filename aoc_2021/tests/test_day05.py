@@ -0,0 +1,21 @@
+"""
+# https://adventofcode.com/2021/day/5
+"""
+import pytest
+from aoc_2021.days.day05 import interpolate
+
+
+@pytest.mark.parametrize(
+    "a,b,expected",
+    [
+        [(0, 0), (2, 2), [(0, 0), (1, 1), (2, 2)]],
+        [(2, 2), (0, 0), [(0, 0), (1, 1), (2, 2)]],
+        [(0, 2), (2, 0), [(0, 2), (1, 1), (2, 0)]],
+        [(2, 0), (0, 2), [(0, 2), (1, 1), (2, 0)]],
+        [(0, 0), (2, 0), [(0, 0), (1, 0), (2, 0)]],
+        # vertical:
+        [(0, 0), (0, 2), [(0, 0), (0, 1), (0, 2)]],
+    ],
+)
+def test_interpolate(a, b, expected):
+    assert sorted(interpolate(a, b)) == expected
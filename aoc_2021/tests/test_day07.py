@@ -0,0 +1,26 @@
+"""
+# https://adventofcode.com/2021/day/7
+"""
+import pytest
+from aoc_2021.days.day07 import exponential_fuel_cost
+
+
+@pytest.mark.parametrize(
+    "distance,expected",
+    [
+        [0, 0],
+        # from toy example:
+        [abs(16 - 5), 66],
+        [abs(1 - 5), 10],
+        [abs(2 - 5), 6],
+        [abs(0 - 5), 15],
+        [abs(4 - 5), 1],
+        [abs(2 - 5), 6],
+        [abs(7 - 5), 3],
+        [abs(1 - 5), 10],
+        [abs(2 - 5), 6],
+        [abs(14 - 5), 45],
+    ],
+)
+def test_exponential_fuel_cost(distance, expected):
+    assert expected == exponential_fuel_cost(distance)
@@ -0,0 +1,60 @@
+"""
+# https://adventofcode.com/2021/day/14
+"""
+import pytest
+from aoc_2021.days.day14 import (
+    count_chars,
+    get_polymer,
+    insert_replacements,
+    normalize_counts,
+    part_1,
+    part_2,
+    toy_input,
+)
+
+
+@pytest.fixture
+def toy_rules():
+    # rules as parsed from toy data
+    return {
+        # fmt: off
+        "BB": "N", "BC": "B", "BH": "H", "BN": "B", "CB": "H",
+        "CC": "N", "CH": "B", "CN": "C", "HB": "C", "HC": "B",
+        "HH": "N", "HN": "C", "NB": "B", "NC": "B", "NH": "C",
+        "NN": "C",
+        # fmt: on
+    }
+
+
+@pytest.mark.parametrize(
+    "polymer,expected",
+    [
+        [get_polymer("NNCB"), get_polymer("NCNBCHB")],
+        [get_polymer("NCNBCHB"), get_polymer("NBCCNBBBCBHCB")],
+        [get_polymer("NBCCNBBBCBHCB"), get_polymer("NBBBCNCCNBBNBNBBCHBHHBCHB")],
+        [
+            get_polymer("NBBBCNCCNBBNBNBBCHBHHBCHB"),
+            get_polymer("NBBNBNBBCCNBCNCCNBBNBBNBBBNBBNBBCBHCBHHNHCBBCBHCB"),
+        ],
+    ],
+)
+def test_insert_replacements(polymer, expected, toy_rules):
+    insert_replacements(polymer, toy_rules)
+    assert normalize_counts(polymer) == expected  # default dict vs regular dict is still OK
+
+
+def test_count_chars():
+    polymer = {
+        # fmt: off
+        "NC": 42, "CB": 115, "CN": 102, "NB": 796, "BC": 120, "CH": 21,
+        "HB": 26, "CC": 60, "BB": 812, "BH": 81, "HC": 76,
+        "BN": 735, "HH": 32, "HN": 27, "NH": 27,
+        # fmt: on
+    }
+    assert count_chars(polymer) == {"N": 865, "C": 298, "B": 1749, "H": 161}
+
+
+@pytest.mark.parametrize("n_iterations", list(range(1, 19)))
+def test_same_answers(n_iterations):
+    data = toy_input
+    assert part_1(data, False, n_iterations) == part_2(data, False, n_iterations)
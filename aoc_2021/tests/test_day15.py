@@ -0,0 +1,35 @@
+"""
+# https://adventofcode.com/2021/day/15
+"""
+import numpy as np
+
+from aoc_2021.days.day15 import parse, part_1, part_2, toy_input
+from utils.utils import Grid, TiledGrid, tile_grid
+
+
+def create_tiled_map(grid, n_tiles=5) -> Grid:
+    """The whole tiled map, all at once: what part_2's TiledGrid should look like"""
+    return tile_grid(np.array(grid, dtype=np.uint8), n_tiles).tolist()
+
+
+def test_create_tiled_map():
+    orig = [[8]]
+    tiled = create_tiled_map(orig, 5)
+    assert tiled == [
+        [8, 9, 1, 2, 3],
+        [9, 1, 2, 3, 4],
+        [1, 2, 3, 4, 5],
+        [2, 3, 4, 5, 6],
+        [3, 4, 5, 6, 7],
+    ]
+
+
+def test_tiled_grid_matches_create_tiled_map():
+    grid = parse(toy_input)
+    assert TiledGrid(grid, 5).to_lists() == create_tiled_map(grid.to_lists(), 5)
+
+
+def test_parts_toy():
+    grid = parse(toy_input)
+    assert part_1(grid) == 40
+    assert part_2(grid) == 315
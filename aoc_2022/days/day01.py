@@ -2,9 +2,10 @@
 # https://adventofcode.com/2022/day/1
 """
 from typing import List
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2022/input/01.txt"))
+input = LazyInput(2022, 1)
 toy_input: List[str] = [
     "1000",
     "2000",
@@ -55,6 +56,7 @@ def part_2(input, verbose=False):
     return sum([sum(elf) for elf in sorted_elves[:3]])
 
 
+@register(2022, 1)
 def day_1(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
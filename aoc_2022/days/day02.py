@@ -6,9 +6,10 @@
 """
 from enum import Enum
 from typing import Callable, Dict, List, Tuple
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2022/input/02.txt"))
+input = LazyInput(2022, 2)
 toy_input: List[str] = [
     # fmt: off
     "A Y",
@@ -152,6 +153,7 @@ def part_2(input, verbose=False):
     return sum(score(my_move, opp_move) for opp_move, my_move in cheatsheet)
 
 
+@register(2022, 2)
 def day_2(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -4,9 +4,10 @@
 from functools import reduce
 from itertools import islice
 from typing import List, Tuple, Set
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2022/input/03.txt"))
+input = LazyInput(2022, 3)
 toy_input: List[str] = [
     "vJrwpWtwJgWrhcsFMMfFFhFp",
     "jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL",
@@ -136,6 +137,7 @@ def part_2(input, verbose=False):
     return sum(map(calc_priority, map(get_common_item, groups)))
 
 
+@register(2022, 3)
 def day_3(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
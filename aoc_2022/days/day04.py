@@ -2,9 +2,10 @@
 # https://adventofcode.com/2022/day/4
 """
 from typing import List
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2022/input/04.txt"))
+input = LazyInput(2022, 4)
 toy_input: List[str] = [
     # fmt: off
     "2-4,6-8",
@@ -60,6 +61,7 @@ def part_2(input, verbose=False):
     return sum([1 if a.overlaps(b) else 0 for a, b in pairs])
 
 
+@register(2022, 4)
 def day_4(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -5,9 +5,10 @@ import itertools
 import re
 from collections import defaultdict
 from typing import List
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2022/input/05.txt"))
+input = LazyInput(2022, 5)
 toy_input: List[str] = [
     # fmt: off
     "    [D]",
@@ -141,6 +142,7 @@ def part_2(input, verbose=False):
     return "".join(last_in_each_stack)
 
 
+@register(2022, 5)
 def day_5(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -2,9 +2,10 @@
 # https://adventofcode.com/2022/day/6
 """
 from typing import List, Sequence
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2022/input/06.txt"))
+input = LazyInput(2022, 6)
 toy_input: List[str] = [
     # fmt: off
     "mjqjpqmgbljsphdztnvjfqwrcgsmlb"
@@ -74,6 +75,7 @@ def find_message_start(stream):
     return find_n_unique_chars(14, stream)
 
 
+@register(2022, 6)
 def day_6(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -5,9 +5,11 @@ import functools
 import re
 from typing import Iterable
 
-from utils.utils import get_line_items
+from utils.parsed import parse_once
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2022/input/07.txt"))
+input = LazyInput(2022, 7)
 toy_input: list[str] = [
     # fmt: off
     "$ cd /",
@@ -275,13 +277,16 @@ def parse_line(raw_input: str, current_node=None) -> ParsedItem:
     raise Exception(f"Cannot match input: {raw_input}")
 
 
+parse = parse_input
+
+
 # ----------------------------------------
 # Part 1:   Find all of the directories with a total size of at most 100000,
 #           then calculate the sum of their total sizes.
 # ----------------------------------------
 
 
-def part_1(input, verbose=False):
+def part_1(root: RootDirNode, verbose=False):
     """
     Given the commands and output in the example above, you can determine that
     the filesystem looks visually like this:
@@ -325,7 +330,6 @@ def part_1(input, verbose=False):
          157 ..
 
     """
-    root = parse_input(input)
     if verbose:
         print(">>> Part 1:")
         print(root.render(2))
@@ -342,7 +346,7 @@ def part_1(input, verbose=False):
     return sum(item.size for item in small_dirs)
 
 
-def part_2(input, verbose=False):
+def part_2(root: RootDirNode, verbose=False):
     """
     max space is 70000000
     You need unused space of at least 30000000.
@@ -368,7 +372,6 @@ def part_2(input, verbose=False):
     # The device is already TOO FULL, so we know that orig_free < min_free (!)
     # So, we need to find the smallest directory that is >= min_deletable_size
 
-    root = parse_input(input)
     orig_size = root.size
     orig_free = max_space - orig_size
     min_deletable_size = min_free - orig_free
@@ -403,6 +406,7 @@ def part_2(input, verbose=False):
     return smallest_deletable_dir.size
 
 
+@register(2022, 7)
 def day_7(use_toy_data=False, verbose=False):
-    data = toy_input if use_toy_data else input
+    data = parse_once(parse, toy_input if use_toy_data else input)
     return [part_1(data, verbose), part_2(data, verbose)]
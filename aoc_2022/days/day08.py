@@ -3,8 +3,10 @@
 """
 from functools import reduce
 from typing import Callable, List
+from utils.parsed import parse_once
+from utils.registry import register
 from utils.utils import (
-    get_line_items,
+    LazyInput,
     two_d_array_from_digit_strings,
     vertical_slice,
     grid_at,
@@ -16,7 +18,7 @@ from utils.utils import (
     right,
 )
 
-input = list(get_line_items("aoc_2022/input/08.txt"))
+input = LazyInput(2022, 8)
 toy_input: List[str] = [
     # fmt: off
     "30373",
@@ -106,14 +108,17 @@ def count_visible(vis_grid: VisGrid) -> int:
     return sum(sum(1 for item in row if item) for row in vis_grid)
 
 
-def part_1(input, verbose=False):
+def parse(input) -> Grid:
+    return two_d_array_from_digit_strings(input)
+
+
+def part_1(grid: Grid, verbose=False):
     """
     With 16 trees visible on the edge and another 5 visible in the interior,
     a total of 21 trees are visible in this arrangement.
 
     Consider your map; how many trees are visible from outside the grid?
     """
-    grid = two_d_array_from_digit_strings(input)
     vis_grid = build_vis_grid(grid)
     n_visible = count_visible(vis_grid)
     return n_visible
@@ -162,7 +167,7 @@ def scenic_score(distances: List[int]) -> int:
     return reduce(lambda a, b: a * b, distances)
 
 
-def part_2(input, verbose=False):
+def part_2(grid: Grid, verbose=False):
     """
     Consider each tree on your map. What is the highest scenic score possible for any tree?
 
@@ -171,7 +176,6 @@ def part_2(input, verbose=False):
         or at the first tree that is the same height or taller than the tree under consideration.
     Scenic score: multiply viewing distance in each direction
     """
-    grid = two_d_array_from_digit_strings(input)
     max_score = 0
     for row in range(len(grid)):
         for col in range(len(grid[0])):
@@ -182,6 +186,7 @@ def part_2(input, verbose=False):
     return max_score
 
 
+@register(2022, 8)
 def day_8(use_toy_data=False, verbose=False):
-    data = toy_input if use_toy_data else input
+    data = parse_once(parse, toy_input if use_toy_data else input)
     return [part_1(data, verbose), part_2(data, verbose)]
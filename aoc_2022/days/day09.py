@@ -7,11 +7,11 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 import functools
-import pytest
 
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2022/input/09.txt"))
+input = LazyInput(2022, 9)
 toy_input: list[str] = [
     # fmt: off
     "R 4",
@@ -346,6 +346,7 @@ def part_2(input, verbose=False):
     return len(visited)
 
 
+@register(2022, 9)
 def day_9(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -4,9 +4,10 @@
 import itertools
 import math
 from dataclasses import dataclass
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2022/input/10.txt"))
+input = LazyInput(2022, 10)
 toy_input: list[str] = [
     # fmt: off
     "addx 15",
@@ -336,6 +337,7 @@ def part_2(input, verbose=False):
     return "PZBGZEJB"
 
 
+@register(2022, 10)
 def day_10(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
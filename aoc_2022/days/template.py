@@ -1,9 +1,10 @@
 """
 # https://adventofcode.com/2022/day/N
 """
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2022/input/NN.txt"))
+input = LazyInput(2022, N)
 toy_input: list[str] = [
     # fmt: off
     # fmt: on
@@ -18,6 +19,7 @@ def part_2(input, verbose=False):
     pass
 
 
+@register(2022, N)
 def day_N(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -3,9 +3,9 @@
 #
 import pytest
 
-from utils.loader import get_all_year_modules
+from utils.loader import get_lazy_year_modules
 
-ADVENTS = get_all_year_modules()
+ADVENTS = get_lazy_year_modules()
 YEAR = 2022
 
 
@@ -53,7 +53,7 @@ EXPECTED = {
 
 
 def _advent(day_index, use_toy_data=False, verbose=False):
-    return ADVENTS[YEAR][day_index - 1](use_toy_data=use_toy_data, verbose=verbose)
+    return ADVENTS[YEAR][day_index](use_toy_data=use_toy_data, verbose=verbose)
 
 
 @pytest.mark.parametrize(
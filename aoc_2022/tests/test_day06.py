@@ -9,6 +9,8 @@ from aoc_2022.days.day06 import (
     find_packet_start,
     find_message_start,
 )
+from utils.generators import generate
+from utils.utils import mapped_input
 
 
 def test_find_packet_start():
@@ -36,6 +38,16 @@ def test_find_message_start():
         assert expected == find_message_start(stream)
 
 
+def test_markers_in_a_mapped_file(tmp_path):
+    # the stream doesn't need to be read into a str first
+    stream = generate(2022, 6, scale=50)[0]
+    fname = tmp_path / "06.txt"
+    fname.write_text(stream + "\n")
+    with mapped_input(fname) as mapped:
+        assert find_packet_start(mapped) == find_packet_start(stream)
+        assert find_message_start(mapped) == find_message_start(stream)
+
+
 def test_part_1_toy():
     assert part_1(toy_input) == 7
 
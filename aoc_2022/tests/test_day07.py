@@ -7,6 +7,7 @@ from typing import Union
 from aoc_2022.days.day07 import (
     input,
     toy_input,
+    parse,
     part_1,
     part_2,
     parse_line,
@@ -125,16 +126,16 @@ def test_traverse(expected_toy_tree):
 
 
 def test_part_1_toy():
-    assert part_1(toy_input) == 95437
+    assert part_1(parse(toy_input)) == 95437
 
 
 def test_part_1_real():
-    assert part_1(input) == 1844187
+    assert part_1(parse(input)) == 1844187
 
 
 def test_part_2_toy():
-    assert part_2(toy_input) == 24933642
+    assert part_2(parse(toy_input)) == 24933642
 
 
 def test_part_2_real():
-    assert part_2(input) == 4978279
+    assert part_2(parse(input)) == 4978279
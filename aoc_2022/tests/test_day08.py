@@ -6,6 +6,7 @@ import pytest
 from aoc_2022.days.day08 import (
     input,
     toy_input,
+    parse,
     part_1,
     part_2,
     build_vis_grid,
@@ -52,16 +53,16 @@ def test_score(coord: Coord, expected: int, toy_grid):
 
 
 def test_part_1_toy():
-    assert part_1(toy_input) == 21
+    assert part_1(parse(toy_input)) == 21
 
 
 def test_part_1_real():
-    assert part_1(input) == 1845
+    assert part_1(parse(input)) == 1845
 
 
 def test_part_2_toy():
-    assert part_2(toy_input) == 8
+    assert part_2(parse(toy_input)) == 8
 
 
 def test_part_2_real():
-    assert part_2(input) == 230112
+    assert part_2(parse(input)) == 230112
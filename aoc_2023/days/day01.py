@@ -3,9 +3,10 @@
 """
 import re
 
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2023/input/01.txt"))
+input = LazyInput(2023, 1)
 toy_input: list[str] = [
     # fmt: off
     "1abc2",
@@ -100,6 +101,7 @@ def part_2(input, verbose=False):
     return sum(calibration_values)
 
 
+@register(2023, 1)
 def day_1(use_toy_data=False, verbose=False):
     data1 = toy_input if use_toy_data else input
     data2 = toy_input_2 if use_toy_data else input
@@ -1,9 +1,10 @@
 """
 # https://adventofcode.com/2023/day/2
 """
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2023/input/02.txt"))
+input = LazyInput(2023, 2)
 toy_input: list[str] = [
     # fmt: off
     "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green",
@@ -102,6 +103,7 @@ def part_2(input, verbose=False):
     return sum(min_powers_per_pull)
 
 
+@register(2023, 2)
 def day_2(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
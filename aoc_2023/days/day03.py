@@ -7,9 +7,10 @@ import functools
 from dataclasses import dataclass
 from typing import Iterable
 
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2023/input/03.txt"))
+input = LazyInput(2023, 3)
 toy_input: list[str] = [
     # fmt: off
     "467..114..",
@@ -236,6 +237,7 @@ def part_2(input, verbose=False):
     return sum(ratios)
 
 
+@register(2023, 3)
 def day_3(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -3,9 +3,10 @@
 """
 from dataclasses import dataclass
 from typing import Callable
-from utils.utils import get_line_items
+from utils.registry import register
+from utils.utils import LazyInput
 
-input = list(get_line_items("aoc_2023/input/04.txt"))
+input = LazyInput(2023, 4)
 toy_input: list[str] = [
     # fmt: off
     #        (winning)      | (your card numbers)
@@ -123,6 +124,7 @@ def part_2(input, verbose=False):
     return count
 
 
+@register(2023, 4)
 def day_4(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
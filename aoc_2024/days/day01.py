@@ -1,11 +1,12 @@
 """
 # https://adventofcode.com/2024/day/1
 """
-from aocd import get_data
 from collections import Counter
 
-# input = list(get_line_items("aoc_2024/input/01.txt"))
-input = get_data(day=1, year=2024).split("\n")
+from utils.registry import register
+from utils.utils import LazyInput
+
+input = LazyInput(2024, 1)
 
 toy_input: list[str] = [
     # fmt: off
@@ -71,6 +72,7 @@ def part_2(input, verbose=False):
     return total_similarities
 
 
+@register(2024, 1)
 def day_1(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
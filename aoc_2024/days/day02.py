@@ -3,10 +3,12 @@
 """
 from collections import Counter
 from typing import Generator
-from aocd import get_data
 
-# input = list(get_line_items("aoc_2024/input/02.txt"))
-input = get_data(day=2, year=2024).split("\n")
+from utils.parsed import parse_once
+from utils.registry import register
+from utils.utils import LazyInput
+
+input = LazyInput(2024, 2)
 
 toy_input: list[str] = [
     # fmt: off
@@ -28,6 +30,9 @@ def parse_reports(input: list[str]) -> list[list[int]]:
     return [[int(item) for item in line.split()] for line in input]
 
 
+parse = parse_reports
+
+
 def sign(n: int) -> int:
     if n == 0:
         return 0
@@ -63,14 +68,13 @@ def is_safe(report, max_bad=0, min_step=1, max_step=3, verbose=False):
     return True
 
 
-def part_1(input, verbose=False):
+def part_1(reports, verbose=False):
     """
     - Each report is a list of numbers called levels that are separated by spaces.
     - safe if both:
         - The levels are either all increasing or all decreasing.
         - Any two adjacent levels differ by at least one and at most three.
     """
-    reports = parse_reports(input)
     safe_counter = Counter([is_safe(report, verbose=verbose) for report in reports])
     return safe_counter[True]
 
@@ -111,13 +115,13 @@ def generate_corrected_report_candidates(report: list[int]) -> list[list[int]]:
     return [report] + [report[:index] + report[index + 1 :] for index in range(len(report))]
 
 
-def part_2(input, verbose=False):
+def part_2(reports, verbose=False):
     """tolerate a single bad level"""
-    reports = parse_reports(input)
     safe_counter = Counter([has_safe_report_mutation(report) for report in reports])
     return safe_counter[True]
 
 
+@register(2024, 2)
 def day_2(use_toy_data=False, verbose=False):
-    data = toy_input if use_toy_data else input
+    data = parse_once(parse, toy_input if use_toy_data else input)
     return [part_1(data, verbose), part_2(data, verbose)]
@@ -1,10 +1,10 @@
 """
 # https://adventofcode.com/2024/day/N
 """
-from aocd import get_data
+from utils.registry import register
+from utils.utils import LazyInput
 
-# input = list(get_line_items("aoc_2024/input/NN.txt"))
-input = get_data(day=N, year=2024).split("\n")
+input = LazyInput(2024, N)
 
 toy_input: list[str] = [
     # fmt: off
@@ -20,6 +20,7 @@ def part_2(input, verbose=False):
     pass
 
 
+@register(2024, N)
 def day_N(use_toy_data=False, verbose=False):
     data = toy_input if use_toy_data else input
     return [part_1(data, verbose), part_2(data, verbose)]
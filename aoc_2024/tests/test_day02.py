@@ -1,20 +1,20 @@
 """
 # https://adventofcode.com/2024/day/2
 """
-from aoc_2024.days.day02 import input, toy_input, part_1, part_2
+from aoc_2024.days.day02 import input, toy_input, parse, part_1, part_2
 
 
 def test_part_1_toy():
-    assert part_1(toy_input) == 2
+    assert part_1(parse(toy_input)) == 2
 
 
 def test_part_1_real():
-    assert part_1(input) == 321
+    assert part_1(parse(input)) == 321
 
 
 def test_part_2_toy():
-    assert part_2(toy_input) == 4
+    assert part_2(parse(toy_input)) == 4
 
 
 def test_part_2_real():
-    assert part_2(input) == 386
+    assert part_2(parse(input)) == 386
@@ -17,6 +17,6 @@ cp "aoc_${YEAR}/tests/template.py" "${NEW_TEST_FILE}"
 sed -i '' "s/NN/${NN}/g; s/N/${N}/g;" "${NEW_FILE}"
 sed -i '' "s/{NN}/${NN}/g; s/{N}/${N}/g;" "${NEW_TEST_FILE}"
 
-# Pre-get input data so we can read it and look at it, but 
-# 2024+ will now just use aocd directly in the day module.
+# Pre-get input data so we can read it and look at it.
+# (LazyInput would otherwise fetch + save it the first time a day runs.)
 aocd "${YEAR}" "${N}" > "aoc_${YEAR}/input/${NN}.txt"
\ No newline at end of file
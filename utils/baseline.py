@@ -0,0 +1,144 @@
+"""
+#
+# baseline.py
+#
+# Keep benchmark samples around, and tell us when a part gets slower
+#
+#   aoc.py 2021 --save-baseline        # bench, and remember the timings
+#   aoc.py 2021 --compare              # bench, and compare against them
+#   aoc.py 2021 --compare --threshold 0.25 --baseline other.json
+#
+"""
+import json
+import math
+import os
+import statistics
+
+from typing import Any, Dict, List, NamedTuple
+
+from utils.bench import format_seconds
+
+DEFAULT_BASELINE = ".aoc_baseline.json"
+# flag parts whose median got this much slower (10%) ...
+DEFAULT_THRESHOLD = 0.10
+# ... when the difference is unlikely to be noise
+DEFAULT_ALPHA = 0.05
+
+
+class Comparison(NamedTuple):
+    key: str  # e.g. "2021/15/part_2"
+    baseline_median: float
+    current_median: float
+    p_value: float
+    slower: bool
+
+    @property
+    def change(self) -> float:
+        if self.baseline_median == 0:
+            # e.g. a cached part, or a timer too coarse to see it
+            return 0.0 if self.current_median == 0 else math.inf
+        return self.current_median / self.baseline_median - 1
+
+
+def part_key(year: int, day: int, part: str) -> str:
+    return f"{year}/{day}/{part}"
+
+
+def load_baseline(fname=DEFAULT_BASELINE) -> Dict[str, List[float]]:
+    if not os.path.exists(fname):
+        return {}
+    with open(fname) as f:
+        return json.load(f)
+
+
+def save_baseline(results: List[Dict[str, Any]], fname=DEFAULT_BASELINE):
+    """Add (or replace) the timings for these days, keeping any others"""
+    baseline = load_baseline(fname)
+    for result in results:
+        for part, stats in result["parts"].items():
+            baseline[part_key(result["year"], result["day"], part)] = stats["times"]
+    with open(fname, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+
+def ranks(values: List[float]) -> List[float]:
+    """1-based ranks, with ties sharing the average of their ranks"""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    result = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            result[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return result
+
+
+def mann_whitney_p(before: List[float], after: List[float]) -> float:
+    """
+    One-sided Mann-Whitney U test: how likely are we to see `after`
+    be this much larger than `before` if they're really the same?
+    Uses the normal approximation (with a tie correction), which is
+    good enough for the 10-ish samples we take of each part.
+    """
+    n1, n2 = len(before), len(after)
+    n = n1 + n2
+    all_ranks = ranks(before + after)
+    u = sum(all_ranks[n1:]) - n2 * (n2 + 1) / 2
+    mean = n1 * n2 / 2
+
+    tie_counts: Dict[float, int] = {}
+    for value in before + after:
+        tie_counts[value] = tie_counts.get(value, 0) + 1
+    ties = sum(t**3 - t for t in tie_counts.values())
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    # -0.5: continuity correction
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_part(
+    key: str,
+    before: List[float],
+    after: List[float],
+    threshold=DEFAULT_THRESHOLD,
+    alpha=DEFAULT_ALPHA,
+) -> Comparison:
+    baseline_median = statistics.median(before)
+    current_median = statistics.median(after)
+    p_value = mann_whitney_p(before, after)
+    slower = current_median > baseline_median * (1 + threshold) and p_value < alpha
+    return Comparison(key, baseline_median, current_median, p_value, slower)
+
+
+def compare_to_baseline(
+    results: List[Dict[str, Any]],
+    baseline: Dict[str, List[float]],
+    threshold=DEFAULT_THRESHOLD,
+    alpha=DEFAULT_ALPHA,
+) -> List[Comparison]:
+    """Compare every part that has a baseline; parts without one are skipped"""
+    comparisons = []
+    for result in results:
+        for part, stats in result["parts"].items():
+            key = part_key(result["year"], result["day"], part)
+            if key in baseline:
+                comparisons.append(
+                    compare_part(key, baseline[key], stats["times"], threshold, alpha)
+                )
+    return comparisons
+
+
+def format_comparison(comparison: Comparison) -> str:
+    status = "SLOWER" if comparison.slower else "ok"
+    change = "from 0" if math.isinf(comparison.change) else f"{comparison.change:+.0%}"
+    return (
+        f"{comparison.key:<16} {status:<6}"
+        f" median {format_seconds(comparison.baseline_median)}"
+        f" -> {format_seconds(comparison.current_median)}"
+        f" ({change}, p={comparison.p_value:.3f})"
+    )
@@ -0,0 +1,139 @@
+"""
+#
+# bench.py
+#
+# Time each part of a day separately, for aoc.py --bench
+#
+#   aoc.py 2021 --bench --reps 20 --warmup 2 --out bench.json
+#
+"""
+import copy
+import json
+import math
+import statistics
+import time
+
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.loader import get_parts
+from utils.parsed import ParseCache, default_parse_cache
+from utils.runner import format_error
+from utils.utils import LazyInput
+
+DEFAULT_REPS = 10
+DEFAULT_WARMUP = 1
+
+
+def percentile(times: List[float], pct: float) -> float:
+    """nearest-rank percentile, which is plenty for a handful of samples"""
+    ordered = sorted(times)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def summarize(times: List[float]) -> Dict[str, Any]:
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "p95": percentile(times, 95),
+        "times": times,
+    }
+
+
+def load_inputs(module: ModuleType) -> float:
+    """Read every LazyInput a module has, and return how long that took"""
+    start = time.perf_counter()
+    for value in list(vars(module).values()):
+        if isinstance(value, LazyInput):
+            value.lines
+    return time.perf_counter() - start
+
+
+def time_calls(function: Callable, args, reps: int, warmup: int) -> Tuple[List[float], Any]:
+    """Time `reps` calls (after `warmup` untimed ones), and return the times and the answer"""
+    times = []
+    answer = None
+    for i in range(warmup + reps):
+        # parts get to mutate their input; copy it outside of the timed region
+        call_args = copy.deepcopy(args)
+        start = time.perf_counter()
+        answer = function(*call_args)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            times.append(elapsed)
+    return times, answer
+
+
+def bench_day(
+    year: int,
+    day: int,
+    day_function: Callable,
+    use_toy_data=False,
+    reps=DEFAULT_REPS,
+    warmup=DEFAULT_WARMUP,
+) -> Dict[str, Any]:
+    """
+    Time one day:
+        load:   reading (or fetching) the input
+        part_N: each part on its own, `reps` times after `warmup` runs, and
+                (separately) how long getting its parsed input took
+    The day's parse() hook runs once, and the parts share its result: so part_2's
+    parse time is usually ~0, and with AOC_PERSIST_PARSED=1 a repeated run only
+    loads what the last one parsed.
+    Days without a parse() hook parse inside their parts, which counts as solving.
+    """
+    parts = get_parts(year, day, day_function)
+    load = 0.0 if use_toy_data or not parts else load_inputs(parts[0].module)
+
+    # (a fresh one, so that parsing done before we started doesn't count)
+    parse_cache = ParseCache(default_parse_cache().cache_dir)
+    result: Dict[str, Any] = {"year": year, "day": day, "load": load, "parts": {}}
+    for part in parts:
+        start = time.perf_counter()
+        data = part.parse_input(use_toy_data, parse_cache)
+        parse = time.perf_counter() - start
+        times, answer = time_calls(part.solve, (data,), reps, warmup)
+        result["parts"][part.name] = {"answer": answer, "parse": parse, **summarize(times)}
+    return result
+
+
+def bench_days(
+    advents_to_run: List[Tuple[int, int, Callable]],
+    use_toy_data=False,
+    reps=DEFAULT_REPS,
+    warmup=DEFAULT_WARMUP,
+) -> Iterable[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """(result, error) for each day, one after another (in parallel would skew timings)"""
+    for year, day, day_function in advents_to_run:
+        try:
+            yield bench_day(year, day, day_function, use_toy_data, reps, warmup), None
+        except Exception as e:
+            yield None, f"{year} {day:>2}: {format_error(e)}"
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:8.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:8.2f}ms"
+    return f"{seconds:8.3f}s "
+
+
+def format_day(result: Dict[str, Any]) -> List[str]:
+    prefix = f"{result['year']} {result['day']:>2}"
+    lines = [f"{prefix} load   {format_seconds(result['load'])}"]
+    for name, stats in result["parts"].items():
+        lines.append(
+            f"{prefix} {name} parse {format_seconds(stats['parse'])}"
+            f"  min {format_seconds(stats['min'])}"
+            f"  median {format_seconds(stats['median'])}"
+            f"  p95 {format_seconds(stats['p95'])}"
+        )
+    return lines
+
+
+def write_results(results: List[Dict[str, Any]], fname: str):
+    with open(fname, "w") as f:
+        # answers can be anything; str() whatever json doesn't understand
+        json.dump(results, f, indent=2, default=str)
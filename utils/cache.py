@@ -0,0 +1,97 @@
+"""
+#
+# cache.py
+#
+# Remember answers, so that re-running days whose code and input haven't
+# changed is instant. Answers are keyed by:
+#
+#   (year, day, part, hash of the input lines, hash of the day's source and of the utils it imports)
+#
+# and stored one small json file each under .aoc_cache/, with the least
+# recently used ones evicted once the cache gets bigger than max_bytes.
+#
+#   aoc.py --all              # cached
+#   aoc.py --all --no-cache   # recompute everything
+#
+"""
+import hashlib
+import json
+import os
+
+from typing import Any, Tuple
+
+from utils.loader import Part
+from utils.parsed import hash_lines, hash_source
+
+CACHE_DIR = ".aoc_cache"
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+
+class AnswerCache:
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, part: Part, use_toy_data=False) -> str:
+        input_hash = hash_lines(part.get_input(use_toy_data))
+        parts = [str(part.year), str(part.day), part.name, input_hash, hash_source(part.module)]
+        return hashlib.sha256("/".join(parts).encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(hit, answer)"""
+        path = self.path(key)
+        try:
+            with open(path) as f:
+                answer = json.load(f)["answer"]
+        except (FileNotFoundError, ValueError, KeyError):
+            return False, None
+        # mtime is our "last used" time
+        os.utime(path)
+        return True, answer
+
+    def put(self, key: str, part: Part, answer: Any):
+        try:
+            data = json.dumps(
+                {"year": part.year, "day": part.day, "part": part.name, "answer": answer}
+            )
+        except TypeError:
+            # not an answer we know how to store; just recompute it next time
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        # write + rename, so that parallel runs never see half of a file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used answers until we fit in max_bytes"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # another process got to it first
+                pass
+            total -= size
+
+    def solve(self, part: Part, use_toy_data=False) -> Tuple[Any, bool]:
+        """(answer, hit): the cached answer if we have one, else compute and remember it"""
+        key = self.key(part, use_toy_data)
+        hit, answer = self.get(key)
+        if not hit:
+            answer = part(use_toy_data=use_toy_data)
+            self.put(key, part, answer)
+        return answer, hit
@@ -0,0 +1,171 @@
+"""
+#
+# complexity.py
+#
+# How does each part's running time grow with the size of its input?
+# Times parts on generated inputs at sizes N, 2N, 4N, 8N, and fits
+#
+#   time ~ size ** exponent
+#
+# (a straight line on a log-log plot), so ~1 is linear, ~2 is quadratic.
+#
+#   aoc.py 2021 --complexity --scale 0.25 --max-seconds 5
+#
+# Each size is run in a child process (see harness.py), which is stopped
+# if it takes far longer than --max-seconds, or dies if it runs out of
+# memory, without taking the rest of the report with it.
+#
+"""
+import copy
+import math
+import time
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils import harness
+from utils.bench import format_seconds
+from utils.generators import GENERATORS, as_input, generate
+from utils.loader import Part, get_parts
+from utils.parsed import freeze
+from utils.runner import format_error
+
+DEFAULT_SCALE = 0.25
+MULTIPLIERS = (1, 2, 4, 8)
+# stop growing a part's input once one run takes this long
+DEFAULT_MAX_SECONDS = 5.0
+# ... and stop a size outright once it has taken this many times that: enough
+# for a quadratic part's next size, after one that came in just under it
+STEP_BUDGET_FACTOR = 4
+# exponents above this are worth a look
+SUPER_LINEAR = 1.3
+# keep re-running fast parts until this much time has passed, to beat the noise
+MIN_TOTAL_SECONDS = 0.05
+MAX_REPS = 50
+
+
+def fit_exponent(points: List[Tuple[float, float]]) -> Optional[float]:
+    """least-squares slope of log(time) against log(size)"""
+    points = [(size, seconds) for size, seconds in points if size > 0 and seconds > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(seconds) for _, seconds in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def time_solve(part: Part, data) -> float:
+    """min time of a few runs (just one, if it's slow)"""
+    best = math.inf
+    total = 0.0
+    for _ in range(MAX_REPS):
+        call_data = copy.deepcopy(data)
+        start = time.perf_counter()
+        part.solve(call_data)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        if total >= MIN_TOTAL_SECONDS:
+            break
+    return best
+
+
+def time_step(module_name: str, year: int, day: int, number: int, size: float, seed: int):
+    """(in a child) time a part on a generated input of this size"""
+    part = harness.find_part(module_name, year, day, number)
+    data = as_input(part.module, generate(year, day, size, seed))
+    parsed = data if part.parse is None else freeze(part.parse(data))
+    return time_solve(part, parsed)
+
+
+def measure_part(
+    part: Part, scale=DEFAULT_SCALE, max_seconds=DEFAULT_MAX_SECONDS, seed=0
+) -> Dict[str, Any]:
+    """
+    Time a part at each size. Sizes are the generators' scales, rather than
+    e.g. characters of input: only some of an input grows with scale
+    (2021 day 14's rules don't), and that's the part we care about.
+
+    A size that takes longer than max_seconds * STEP_BUDGET_FACTOR is
+    stopped, and recorded as "timeout" (that budget); one that fails
+    (or runs out of memory) stops the part, with its "error".
+    """
+    points: List[Tuple[float, float]] = []
+    timeout = error = None
+    budget = max_seconds * STEP_BUDGET_FACTOR
+    for multiplier in MULTIPLIERS:
+        size = scale * multiplier
+        args = (part.module.__name__, part.year, part.day, part.number, size, seed)
+        outcome = harness.run_with_budget(time_step, args, budget)
+        if outcome.status == harness.TIMEOUT:
+            timeout = budget
+            break
+        if outcome.status == harness.ERROR:
+            # (just "ERROR Type: message", without the child's traceback)
+            error = outcome.error.splitlines()[0]
+            break
+        points.append((size, outcome.answer))
+        if outcome.answer > max_seconds:
+            break
+    return {
+        "year": part.year,
+        "day": part.day,
+        "part": part.name,
+        "points": points,
+        "exponent": fit_exponent(points),
+        "timeout": timeout,
+        "error": error,
+    }
+
+
+def measure_days(
+    advents_to_run: List[Tuple[int, int, Callable]],
+    scale=DEFAULT_SCALE,
+    max_seconds=DEFAULT_MAX_SECONDS,
+):
+    """(result, error) for each part of each day that has a generator"""
+    for year, day, day_function in advents_to_run:
+        if (year, day) not in GENERATORS:
+            yield None, f"{year} {day:>2}: no input generator"
+            continue
+        try:
+            parts = get_parts(year, day, day_function)
+        except Exception as e:
+            # e.g. the module doesn't import
+            yield None, f"{year} {day:>2}: {format_error(e)}"
+            continue
+        for part in parts:
+            try:
+                result = measure_part(part, scale, max_seconds)
+            except Exception as e:
+                yield None, f"{year} {day:>2} {part.name}: {format_error(e)}"
+                continue
+            if result["error"] is not None:
+                yield None, f"{year} {day:>2} {part.name}: {result['error']}"
+            else:
+                yield result, None
+
+
+def format_header() -> str:
+    sizes = "".join(f"{f'{m}N':>11}" for m in MULTIPLIERS)
+    return f"{'':<14}{sizes}  exponent"
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    times = "".join(f" {format_seconds(seconds)}" for _, seconds in result["points"])
+    columns = len(result["points"])
+    if result["timeout"] is not None:
+        # stopped after this long, without an answer
+        times += f" >{format_seconds(result['timeout'])[1:]}"
+        columns += 1
+    times += " " * 11 * (len(MULTIPLIERS) - columns)
+    exponent = result["exponent"]
+    if exponent is None:
+        verdict = "    ?"
+    else:
+        verdict = f"{exponent:5.2f}" + ("  super-linear" if exponent > SUPER_LINEAR else "")
+    return f"{result['year']} {result['day']:>2} {result['part']}{times}  {verdict}"
@@ -0,0 +1,190 @@
+"""
+#
+# daemon.py
+#
+# A long-lived worker that keeps day modules (and their parsed inputs) warm,
+# so that asking for the same day again doesn't pay for starting python,
+# importing, and parsing all over again:
+#
+#   aoc.py --serve &                    # listens on .aoc_daemon.sock
+#   aoc.py 2021 15 --remote --toy       # asks it, instead of solving it here
+#
+# Requests and responses are one JSON object per line:
+#
+#   {"year": 2021, "day": 15, "part": 1, "toy": true}
+#   {"year": 2021, "day": 15, "answers": [40], "error": null, "elapsed": 0.001, "reloaded": false}
+#
+# Leave out "part" to get every part's answer. Before each request, whatever
+# changed since the last one (a day, its input, or a utils module it imports)
+# is importlib.reload()ed, like --watch does, so an edit-run loop doesn't
+# need to restart the daemon.
+#
+"""
+import json
+import os
+import socket
+import socketserver
+import sys
+
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils import utils, watch
+from utils.loader import LazyDay, get_lazy_year_modules
+from utils.parsed import default_parse_cache
+from utils.runner import format_error
+
+SOCKET_PATH = ".aoc_daemon.sock"
+
+
+class Worker:
+    """Solves requests in this process, so that whatever it loads stays loaded"""
+
+    def __init__(
+        self,
+        advents: Optional[Dict[int, Dict[int, LazyDay]]] = None,
+        patterns: Iterable[str] = watch.WATCHED_PATTERNS,
+    ):
+        self.advents = get_lazy_year_modules() if advents is None else advents
+        self.patterns = patterns
+        self.mtimes = watch.snapshot(patterns)
+
+    def refresh(self) -> Set[str]:
+        """
+        Reload whatever changed since we last looked, and whatever imports it
+        (dependencies first); the names of the modules that were reloaded
+        """
+        mtimes = watch.snapshot(self.patterns)
+        changed = watch.changed_files(self.mtimes, mtimes)
+        if not changed:
+            return set()
+        dependencies = watch.DependencyMap(mtimes)
+        modules, _ = dependencies.affected(changed)
+        if any(watch.day_of_input(path) is not None for path in changed):
+            utils.get_input.cache_clear()
+        # (ones that aren't loaded yet will be imported fresh, when they're needed)
+        names = [name for name in dependencies.reload_order(modules) if name in sys.modules]
+        errors = watch.reload_modules(names)
+        if errors:
+            # leave self.mtimes alone, so that the next request tries again
+            name, error = next(iter(errors.items()))
+            raise ImportError(f"couldn't reload {name}: {error.removeprefix('ERROR ')}")
+        self.mtimes = mtimes
+        for name in names:
+            # reloading re-runs @register(), and gives it new parse/part functions
+            default_parse_cache().forget(name)
+        return set(names)
+
+    def solve(self, year: int, day: int, part: Optional[int] = None, toy=False) -> Dict[str, Any]:
+        lazy_day = self.advents[year][day]
+        reloaded = lazy_day.module_name in self.refresh()
+        parts = lazy_day.parts
+        if part is not None:
+            # (parts[part - 1] would happily answer part 0 or -1 with the last part)
+            if type(part) is not int or not 1 <= part <= len(parts):
+                raise ValueError(f"{year} day {day} has no part {part!r}")
+            parts = [parts[part - 1]]
+        start = perf_counter()
+        answers = [p(toy) for p in parts]
+        return {
+            "year": year,
+            "day": day,
+            "answers": answers,
+            "error": None,
+            "elapsed": perf_counter() - start,
+            "reloaded": reloaded,
+        }
+
+    def handle(self, request: Any) -> Dict[str, Any]:
+        if not isinstance(request, dict):
+            error = TypeError(f"a request is a JSON object, not {type(request).__name__}")
+            return error_response({}, error)
+        try:
+            return self.solve(
+                request["year"], request["day"], request.get("part"), request.get("toy", False)
+            )
+        except Exception as e:
+            return error_response(request, e)
+
+
+def error_response(request: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+    return {
+        "year": request.get("year"),
+        "day": request.get("day"),
+        "answers": None,
+        "error": format_error(error),
+        "elapsed": None,
+        "reloaded": False,
+    }
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # a client can send as many requests as it likes on one connection
+        for line in self.rfile:
+            try:
+                response = self.server.worker.handle(json.loads(line))
+            except json.JSONDecodeError as e:
+                response = {"answers": None, "error": format_error(e)}
+            # answers that JSON doesn't know about (e.g. a day's own classes) are sent as str()
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    # one request at a time: reloading a module while another request uses it isn't safe
+    def __init__(self, socket_path: str, worker: Worker):
+        super().__init__(socket_path, RequestHandler)
+        self.worker = worker
+
+
+def is_running(socket_path=SOCKET_PATH) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+            return True
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+
+
+def make_server(socket_path=SOCKET_PATH, worker: Optional[Worker] = None) -> DaemonServer:
+    if is_running(socket_path):
+        raise RuntimeError(f"a daemon is already listening on {socket_path}")
+    if os.path.exists(socket_path):
+        os.remove(socket_path)  # left behind by one that didn't shut down cleanly
+    return DaemonServer(socket_path, worker or Worker())
+
+
+def serve(socket_path=SOCKET_PATH):
+    """Answer requests until interrupted"""
+    with make_server(socket_path) as server:
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+def make_requests(
+    days: Iterable[Tuple[int, int]], toy=False, part: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """What to ask() for, e.g. from aoc.py 2021 15 --remote --part 2 --toy"""
+    requests = []
+    for year, day in days:
+        request: Dict[str, Any] = {"year": year, "day": day, "toy": toy}
+        if part is not None:
+            request["part"] = part
+        requests.append(request)
+    return requests
+
+
+def ask(requests: List[Dict[str, Any]], socket_path=SOCKET_PATH) -> List[Dict[str, Any]]:
+    """Send requests to a running daemon, and return its responses (in the same order)"""
+    responses = []
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rwb") as f:
+            for request in requests:
+                f.write(json.dumps(request).encode() + b"\n")
+                f.flush()
+                responses.append(json.loads(f.readline()))
+    return responses
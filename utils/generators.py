@@ -0,0 +1,624 @@
+"""
+#
+# generators.py
+#
+# Make up valid puzzle inputs, at any size, for every day we've solved,
+# so that we can see how solutions scale past the one real input we have.
+#
+#   lines = generate(2021, 15, scale=10, seed=1)   # ~10x a real input
+#
+# `scale` is roughly "how many real inputs' worth of data": 1 is about the
+# size of a real puzzle input, and it multiplies the number of lines
+# (or for grids, the number of cells). The same (scale, seed) always
+# makes the same input. Lines look exactly like a real input file's would.
+#
+"""
+import math
+import random
+import string
+
+from typing import Callable, Dict, List, Tuple
+
+Generator = Callable[[float, int], List[str]]
+
+# {(2021, 15): generate_2021_15, ...}
+GENERATORS: Dict[Tuple[int, int], Generator] = {}
+
+
+def generator(year: int, day: int):
+    def register(fn: Generator) -> Generator:
+        GENERATORS[(year, day)] = fn
+        return fn
+
+    return register
+
+
+def generate(year: int, day: int, scale: float = 1, seed: int = 0) -> List[str]:
+    if (year, day) not in GENERATORS:
+        raise KeyError(f"No input generator for {year} day {day}")
+    return GENERATORS[(year, day)](scale, seed)
+
+
+def as_input(module, lines: List[str]) -> List:
+    """What a day module's `input` would hold, if `lines` were its input file"""
+    transform = getattr(module.input, "transform", None)
+    return lines if transform is None else [transform(line) for line in lines]
+
+
+# -------
+# helpers
+# -------
+
+
+def _count(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def _side(base: int, scale: float) -> int:
+    """grid side length, so that the number of cells scales with `scale`"""
+    return max(2, round(base * math.sqrt(scale)))
+
+
+def _digit_grid(rng: random.Random, rows: int, cols: int, digits="0123456789") -> List[str]:
+    return ["".join(rng.choice(digits) for _ in range(cols)) for _ in range(rows)]
+
+
+# ----
+# 2021
+# ----
+
+
+@generator(2021, 1)
+def generate_2021_01(scale, seed):
+    # sonar depths: a random walk that's mostly getting deeper
+    rng = random.Random(seed)
+    depth = rng.randint(100, 200)
+    lines = []
+    for _ in range(_count(2000, scale)):
+        depth = max(0, depth + rng.randint(-10, 20))
+        lines.append(str(depth))
+    return lines
+
+
+@generator(2021, 2)
+def generate_2021_02(scale, seed):
+    # With "down" and "up" equally likely, aim (and depth) random-walks below
+    # zero about half the time, which makes part 2's answer 0 or negative.
+    # Going down more often than up keeps the submarine under water, like a real input's.
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(['forward', 'forward', 'down', 'down', 'up'])} {rng.randint(1, 9)}"
+        for _ in range(_count(1000, scale))
+    ]
+
+
+def _rating_survivors(numbers: List[str], most_common: bool) -> int:
+    """how many numbers are left after 2021 day 3's part 2 filtering (0 is bad)"""
+    for col in range(len(numbers[0])):
+        if len(numbers) == 1:
+            break
+        ones = sum(1 for number in numbers if number[col] == "1")
+        keep = "1" if (ones >= len(numbers) / 2) == most_common else "0"
+        numbers = [number for number in numbers if number[col] == keep]
+    return len(numbers)
+
+
+@generator(2021, 3)
+def generate_2021_03(scale, seed):
+    # Part 2 keeps filtering on the most (or least) common bit until there's
+    # one number left. That breaks if all the remaining numbers agree on a
+    # bit (the least common bit then matches nothing), so try until it doesn't.
+    rng = random.Random(seed)
+    n_numbers = max(2, _count(1000, scale))
+    width = max(12, math.ceil(math.log2(n_numbers * 2)))
+    while True:
+        numbers = [f"{n:0{width}b}" for n in rng.sample(range(2**width), n_numbers)]
+        if _rating_survivors(numbers, True) == _rating_survivors(numbers, False) == 1:
+            return numbers
+
+
+@generator(2021, 4)
+def generate_2021_04(scale, seed):
+    # Every number gets drawn, so every board wins eventually. A board that
+    # wins on a 0 would score 0 (which reads as "hasn't won"), so draw 0 first.
+    rng = random.Random(seed)
+    draws = list(range(1, 100))
+    rng.shuffle(draws)
+    draws.insert(0, 0)
+    lines = [",".join(map(str, draws))]
+    for _ in range(_count(100, scale)):
+        numbers = rng.sample(range(100), 25)
+        lines.append("")
+        for row in range(5):
+            lines.append(" ".join(f"{n:>2}" for n in numbers[row * 5 : row * 5 + 5]))
+    return lines
+
+
+@generator(2021, 5)
+def generate_2021_05(scale, seed):
+    # horizontal, vertical, or 45 degree lines on a 1000x1000 sea floor
+    rng = random.Random(seed)
+    lines = []
+    directions = [(1, 0), (0, 1), (1, 1), (1, -1), (-1, 0), (0, -1), (-1, -1), (-1, 1)]
+    while len(lines) < _count(500, scale):
+        x1, y1 = rng.randint(0, 999), rng.randint(0, 999)
+        dx, dy = rng.choice(directions)
+        # how far we can go in that direction without falling off
+        room = min(
+            999 - x1 if dx > 0 else x1 if dx < 0 else 999,
+            999 - y1 if dy > 0 else y1 if dy < 0 else 999,
+        )
+        if room == 0:
+            continue
+        length = rng.randint(1, min(room, 300))
+        lines.append(f"{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}")
+    return lines
+
+
+@generator(2021, 6)
+def generate_2021_06(scale, seed):
+    rng = random.Random(seed)
+    return [",".join(str(rng.randint(1, 5)) for _ in range(_count(300, scale)))]
+
+
+@generator(2021, 7)
+def generate_2021_07(scale, seed):
+    rng = random.Random(seed)
+    return [",".join(str(rng.randint(0, 1999)) for _ in range(_count(1000, scale)))]
+
+
+SEGMENTS = {
+    0: "abcefg",
+    1: "cf",
+    2: "acdeg",
+    3: "acdfg",
+    4: "bcdf",
+    5: "abdfg",
+    6: "abdefg",
+    7: "acf",
+    8: "abcdefg",
+    9: "abcdfg",
+}
+
+
+@generator(2021, 8)
+def generate_2021_08(scale, seed):
+    # each display has its wires crossed differently
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(_count(200, scale)):
+        wires = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+
+        def scrambled(digit):
+            letters = [wires[segment] for segment in SEGMENTS[digit]]
+            rng.shuffle(letters)
+            return "".join(letters)
+
+        patterns = [scrambled(digit) for digit in rng.sample(range(10), 10)]
+        outputs = [scrambled(rng.randint(0, 9)) for _ in range(4)]
+        lines.append(f"{' '.join(patterns)} | {' '.join(outputs)}")
+    return lines
+
+
+@generator(2021, 9)
+def generate_2021_09(scale, seed):
+    rng = random.Random(seed)
+    side = _side(100, scale)
+    return _digit_grid(rng, side, side)
+
+
+BRACKETS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+@generator(2021, 10)
+def generate_2021_10(scale, seed):
+    # every line is either corrupted or incomplete, and there's an odd
+    # number of incomplete lines, so that there's a middle score
+    rng = random.Random(seed)
+    n_lines = _count(100, scale)
+    n_incomplete = n_lines // 2 | 1
+    kinds = ["incomplete"] * n_incomplete + ["corrupted"] * (n_lines - n_incomplete)
+    rng.shuffle(kinds)
+    lines = []
+    for kind in kinds:
+        stack: List[str] = []
+        chars = []
+        for _ in range(rng.randint(20, 110)):
+            if stack and rng.random() < 0.45:
+                chars.append(BRACKETS[stack.pop()])
+            else:
+                opener = rng.choice("([{<")
+                stack.append(opener)
+                chars.append(opener)
+        if kind == "corrupted":
+            # close the innermost chunk with the wrong character
+            if not stack:
+                stack.append(rng.choice("([{<"))
+                chars.append(stack[-1])
+            wrong = [closer for closer in BRACKETS.values() if closer != BRACKETS[stack[-1]]]
+            chars.append(rng.choice(wrong))
+        elif not stack:
+            chars.append(rng.choice("([{<"))
+        lines.append("".join(chars))
+    return lines
+
+
+@generator(2021, 11)
+def generate_2021_11(scale, seed):
+    # part 2 waits for every octopus to flash at once, which only happens
+    # if we make it: start from a nearly-synchronized grid (everyone at the
+    # same energy) with a random patch, so that part 1 has something to do.
+    rng = random.Random(seed)
+    side = _side(10, scale)
+    level = rng.randint(0, 9)
+    grid = [[level] * side for _ in range(side)]
+    patch = max(2, side // 3)
+    top, left = rng.randint(0, side - patch), rng.randint(0, side - patch)
+    for row in range(top, top + patch):
+        for col in range(left, left + patch):
+            grid[row][col] = rng.randint(0, 9)
+    return ["".join(map(str, row)) for row in grid]
+
+
+@generator(2021, 12)
+def generate_2021_12(scale, seed):
+    # Caves: big caves (which may be revisited) never connect to each other,
+    # or there'd be infinitely many paths. The number of paths grows
+    # exponentially with the number of caves, so the caves only grow with
+    # log(scale): each doubling adds a cave or two (4, 5, 6, 8, 10, 13 small
+    # caves for scales 0.25 .. 8), rather than 5 per scale (scale 4 took minutes)
+    rng = random.Random(seed)
+    n_small = 3 + round(3 * math.log2(1 + scale))
+    names = [a + b for a in string.ascii_lowercase for b in string.ascii_lowercase]
+    small = rng.sample(names, n_small)
+    big = ["AA", "BB"]
+    edges = set()
+    # a chain through the small caves, so that start reaches end
+    chain = ["start"] + small + ["end"]
+    edges.update(zip(chain, chain[1:]))
+    for cave in big:
+        for neighbor in rng.sample(small, min(3, len(small))):
+            edges.add((cave, neighbor))
+    edges.add((rng.choice(big), "end"))
+    edges.add(("start", rng.choice(big)))
+    for _ in range(n_small // 2):
+        a, b = rng.sample(small, 2)
+        edges.add((a, b))
+    return [f"{a}-{b}" for a, b in sorted(edges)]
+
+
+@generator(2021, 13)
+def generate_2021_13(scale, seed):
+    # Paper that folds (always exactly in half) down to 40x6, like a real input.
+    # A dot in the far corner makes sure the paper is as big as the folds say.
+    rng = random.Random(seed)
+    widths, heights = [40], [6]
+    for _ in range(5):
+        widths.append(widths[-1] * 2 + 1)
+    for _ in range(7):
+        heights.append(heights[-1] * 2 + 1)
+    width, height = widths[-1], heights[-1]
+    fold_cols = set(widths[:-1])
+    fold_rows = set(heights[:-1])
+
+    dots = {(width - 1, height - 1)}
+    for _ in range(_count(800, scale)):
+        x, y = rng.randrange(width), rng.randrange(height)
+        # dots are never on a fold line
+        if x not in fold_cols and y not in fold_rows:
+            dots.add((x, y))
+    lines = [f"{x},{y}" for x, y in sorted(dots, key=lambda dot: rng.random())]
+    lines.append("")
+    folds = [f"fold along x={col}" for col in reversed(widths[:-1])]
+    folds += [f"fold along y={row}" for row in reversed(heights[:-1])]
+    # the x and y folds can happen in any order, as long as each axis goes big to small
+    xs, ys = folds[:5], folds[5:]
+    while xs or ys:
+        source = xs if (xs and (not ys or rng.random() < 0.5)) else ys
+        lines.append(source.pop(0))
+    return lines
+
+
+@generator(2021, 14)
+def generate_2021_14(scale, seed):
+    # a rule for every pair of elements, so every pair can grow
+    rng = random.Random(seed)
+    elements = rng.sample(string.ascii_uppercase, 10)
+    template_length = max(2, _count(20, scale))
+    lines = ["".join(rng.choice(elements) for _ in range(template_length)), ""]
+    for a in elements:
+        for b in elements:
+            lines.append(f"{a}{b} -> {rng.choice(elements)}")
+    return lines
+
+
+@generator(2021, 15)
+def generate_2021_15(scale, seed):
+    rng = random.Random(seed)
+    side = _side(100, scale)
+    return _digit_grid(rng, side, side, digits="123456789")
+
+
+# ----
+# 2022
+# ----
+
+
+@generator(2022, 1)
+def generate_2022_01(scale, seed):
+    rng = random.Random(seed)
+    lines = []
+    for elf in range(_count(250, scale)):
+        if elf:
+            lines.append("")
+        lines.extend(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+    return lines
+
+
+@generator(2022, 2)
+def generate_2022_02(scale, seed):
+    rng = random.Random(seed)
+    return [f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(_count(2500, scale))]
+
+
+@generator(2022, 3)
+def generate_2022_03(scale, seed):
+    # Groups of three rucksacks, which share exactly one item type (their badge),
+    # and each rucksack has exactly one item type in both compartments.
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(_count(100, scale)):
+        items = list(string.ascii_letters)
+        rng.shuffle(items)
+        badge, items = items[0], items[1:]
+        # 17 items each, that only that rucksack may use
+        for pool in (items[:17], items[17:34], items[34:51]):
+            shared, left_only, right_only = pool[0], pool[1:9], pool[9:]
+            size = rng.randint(6, 16)
+            left = [shared, badge] + [rng.choice(left_only) for _ in range(size - 2)]
+            right = [shared] + [rng.choice(right_only) for _ in range(size - 1)]
+            rng.shuffle(left)
+            rng.shuffle(right)
+            lines.append("".join(left + right))
+    return lines
+
+
+@generator(2022, 4)
+def generate_2022_04(scale, seed):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(_count(1000, scale)):
+        a, b = sorted(rng.randint(1, 99) for _ in range(2))
+        c, d = sorted(rng.randint(1, 99) for _ in range(2))
+        lines.append(f"{a}-{b},{c}-{d}")
+    return lines
+
+
+@generator(2022, 5)
+def generate_2022_05(scale, seed):
+    # 9 stacks of crates; moves never empty a stack, so there's always a top crate
+    rng = random.Random(seed)
+    n_stacks = 9
+    stacks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(rng.randint(1, 8))]
+        for _ in range(n_stacks)
+    ]
+    height = max(len(stack) for stack in stacks)
+    lines = []
+    for level in reversed(range(height)):
+        row = " ".join(f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks)
+        lines.append(row.rstrip())
+    lines.append(" ".join(f" {n} " for n in range(1, n_stacks + 1)).rstrip())
+    lines.append("")
+
+    for _ in range(_count(500, scale)):
+        sources = [i for i, stack in enumerate(stacks) if len(stack) > 1]
+        source = rng.choice(sources)
+        dest = rng.choice([i for i in range(n_stacks) if i != source])
+        n_crates = rng.randint(1, len(stacks[source]) - 1)
+        moved = stacks[source][-n_crates:]
+        del stacks[source][-n_crates:]
+        stacks[dest].extend(moved)
+        lines.append(f"move {n_crates} from {source + 1} to {dest + 1}")
+    return lines
+
+
+@generator(2022, 6)
+def generate_2022_06(scale, seed):
+    # Noise made of only 3 letters can't contain a start-of-packet marker
+    # (4 different characters), so both markers come at the very end.
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    chars = [rng.choice(letters[:3]) for _ in range(_count(4096, scale))]
+    chars.extend(rng.sample(letters, 14))
+    return ["".join(chars)]
+
+
+@generator(2022, 7)
+def generate_2022_07(scale, seed):
+    # A random directory tree, explored depth-first with cd/ls, with file sizes
+    # picked so that the disk is between 40M and 70M full (part 2 needs both).
+    rng = random.Random(seed)
+    n_dirs = _count(180, scale)
+    # children[0] is "/"
+    children: List[List[int]] = [[]]
+    for index in range(1, n_dirs):
+        children[rng.randrange(len(children))].append(index)
+        children.append([])
+    files = [
+        [
+            (f"{rng.choice(string.ascii_lowercase * 2)}{i}.dat", rng.randint(1, 300_000))
+            for i in range(rng.randint(0, 5))
+        ]
+        for _ in range(n_dirs)
+    ]
+    total = sum(size for dir_files in files for _, size in dir_files) or 1
+    target = rng.randint(41_000_000, 69_000_000)
+    files = [
+        [(name, max(1, size * target // total)) for name, size in dir_files] for dir_files in files
+    ]
+
+    lines = ["$ cd /"]
+
+    def visit(index):
+        lines.append("$ ls")
+        for child in children[index]:
+            lines.append(f"dir d{child}")
+        for name, size in files[index]:
+            lines.append(f"{size} {name}")
+        for child in children[index]:
+            lines.append(f"$ cd d{child}")
+            visit(child)
+            lines.append("$ cd ..")
+
+    visit(0)
+    return lines
+
+
+@generator(2022, 8)
+def generate_2022_08(scale, seed):
+    rng = random.Random(seed)
+    side = _side(99, scale)
+    return _digit_grid(rng, side, side)
+
+
+@generator(2022, 9)
+def generate_2022_09(scale, seed):
+    rng = random.Random(seed)
+    return [f"{rng.choice('UDLR')} {rng.randint(1, 20)}" for _ in range(_count(2000, scale))]
+
+
+@generator(2022, 10)
+def generate_2022_10(scale, seed):
+    # The CPU only runs 240 cycles, so anything past ~140 lines is only parsed.
+    rng = random.Random(seed)
+    lines = []
+    x = 1
+    for _ in range(_count(140, scale)):
+        if rng.random() < 0.25:
+            lines.append("noop")
+        else:
+            # keep the sprite (x) on screen
+            value = rng.randint(-10, 10)
+            value = value if 0 <= x + value <= 39 else -value
+            x += value
+            lines.append(f"addx {value}")
+    return lines
+
+
+# ----
+# 2023
+# ----
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+@generator(2023, 1)
+def generate_2023_01(scale, seed):
+    # every line has at least one real digit (part 1 ignores spelled-out ones)
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(_count(1000, scale)):
+        pieces = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 6)):
+            pieces.append(
+                rng.choice(
+                    [
+                        str(rng.randint(1, 9)),
+                        rng.choice(DIGIT_WORDS),
+                        "".join(rng.choice(string.ascii_lowercase) for _ in range(3)),
+                    ]
+                )
+            )
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+    return lines
+
+
+@generator(2023, 2)
+def generate_2023_02(scale, seed):
+    rng = random.Random(seed)
+    lines = []
+    for game in range(1, _count(100, scale) + 1):
+        pulls = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            pulls.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game}: {'; '.join(pulls)}")
+    return lines
+
+
+@generator(2023, 3)
+def generate_2023_03(scale, seed):
+    # numbers (1-3 digits) and symbols scattered on a "." grid
+    rng = random.Random(seed)
+    side = _side(140, scale)
+    grid = [["."] * side for _ in range(side)]
+    for row in range(side):
+        col = rng.randint(0, 4)
+        while col < side:
+            if rng.random() < 0.3:
+                grid[row][col] = rng.choice("*#+$/@=%&-")
+                col += rng.randint(2, 6)
+            else:
+                number = str(rng.randint(1, 999))
+                if col + len(number) > side:
+                    break
+                grid[row][col : col + len(number)] = number
+                col += len(number) + rng.randint(1, 6)
+    return ["".join(row) for row in grid]
+
+
+@generator(2023, 4)
+def generate_2023_04(scale, seed):
+    # Each card wins copies of the next (# of matches) cards, but never past
+    # the last card. Matches are mostly 0 or 1: with more, the number of
+    # cards to deal with grows exponentially, rather than linearly.
+    rng = random.Random(seed)
+    n_cards = _count(200, scale)
+    lines = []
+    for card in range(1, n_cards + 1):
+        n_matches = rng.choices([0, 1, 2, 3], weights=[60, 25, 10, 5])[0]
+        n_matches = min(n_matches, n_cards - card)
+        numbers = rng.sample(range(1, 100), 35)
+        winning = numbers[:10]
+        yours = winning[:n_matches] + numbers[10 : 35 - n_matches]
+        rng.shuffle(yours)
+        lines.append(
+            f"Card {card:>3}: {' '.join(f'{n:>2}' for n in winning)}"
+            f" | {' '.join(f'{n:>2}' for n in yours)}"
+        )
+    return lines
+
+
+# ----
+# 2024
+# ----
+
+
+@generator(2024, 1)
+def generate_2024_01(scale, seed):
+    rng = random.Random(seed)
+    return [
+        f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}"
+        for _ in range(_count(1000, scale))
+    ]
+
+
+@generator(2024, 2)
+def generate_2024_02(scale, seed):
+    # about half the reports are (nearly) safe: gently increasing or decreasing
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(_count(1000, scale)):
+        level = rng.randint(1, 90)
+        direction = rng.choice([-1, 1])
+        report = [level]
+        for _ in range(rng.randint(4, 7)):
+            if rng.random() < 0.9:
+                level += direction * rng.randint(1, 3)
+            else:
+                level += rng.randint(-5, 5)
+            report.append(level)
+        lines.append(" ".join(map(str, report)))
+    return lines
@@ -0,0 +1,112 @@
+"""
+#
+# harness.py
+#
+# Run one part of a day (or anything else) in a child process, with a
+# wall-clock budget, so a slow part can be stopped cleanly instead of
+# hanging everything.
+#
+#   AOC_PART_BUDGET=120 pytest aoc_2021/   # give slow parts longer
+#   aoc.py 2021 12 --budget 10
+#
+"""
+import importlib
+import multiprocessing
+import os
+import time
+import traceback
+
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+from utils.loader import Part, get_day_parts
+from utils.runner import format_error
+
+BUDGET_ENV_VAR = "AOC_PART_BUDGET"
+DEFAULT_BUDGET = 30.0  # seconds
+
+OK = "ok"
+TIMEOUT = "timeout"
+ERROR = "error"
+
+
+class PartOutcome(NamedTuple):
+    status: str  # OK, TIMEOUT or ERROR
+    answer: Any = None
+    error: Optional[str] = None  # e.g. "ERROR ValueError: oops", plus the traceback
+    elapsed: float = 0.0
+
+
+def get_budget() -> float:
+    return float(os.environ.get(BUDGET_ENV_VAR) or DEFAULT_BUDGET)
+
+
+def _call(function: Callable, args: Tuple, conn):
+    """(in the child) call function(*args), and send back how it went"""
+    start = time.perf_counter()
+    try:
+        result = function(*args)
+        conn.send(PartOutcome(OK, result, None, time.perf_counter() - start))
+    except Exception as e:
+        error = f"{format_error(e)}\n{traceback.format_exc()}"
+        conn.send(PartOutcome(ERROR, None, error, time.perf_counter() - start))
+    finally:
+        conn.close()
+
+
+def run_with_budget(
+    function: Callable, args: Tuple, budget: Optional[float] = None
+) -> PartOutcome:
+    """
+    Call function(*args) in a child process. If it hasn't returned within
+    `budget` seconds (default: $AOC_PART_BUDGET, or 30s), it's terminated
+    (then killed, if it won't stop) and reported as a TIMEOUT; exceptions
+    (and children that die without answering, e.g. when they run out of
+    memory) are reported as ERROR.
+    """
+    budget = get_budget() if budget is None else budget
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_call, args=(function, args, sender), daemon=True)
+    start = time.perf_counter()
+    process.start()
+    # only the child writes to this end
+    sender.close()
+    try:
+        if receiver.poll(budget):
+            try:
+                return receiver.recv()
+            except EOFError:
+                process.join()
+                return PartOutcome(
+                    ERROR,
+                    error=f"ERROR child exited with {process.exitcode}",
+                    elapsed=time.perf_counter() - start,
+                )
+        return PartOutcome(TIMEOUT, elapsed=time.perf_counter() - start)
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.terminate()
+            process.join(1)
+            if process.is_alive():
+                process.kill()
+        process.join()
+
+
+def find_part(module_name: str, year: int, day: int, number: int) -> Part:
+    """(in a child) a Part again, from what can be sent to the child"""
+    module = importlib.import_module(module_name)
+    [part] = [part for part in get_day_parts(module, year, day) if part.number == number]
+    return part
+
+
+def _solve_part(module_name: str, year: int, day: int, number: int, use_toy_data):
+    return find_part(module_name, year, day, number)(use_toy_data=use_toy_data)
+
+
+def run_part_with_budget(
+    part: Part, use_toy_data=False, budget: Optional[float] = None
+) -> PartOutcome:
+    """Run `part` in a child process, like run_with_budget()"""
+    return run_with_budget(
+        _solve_part, (part.module.__name__, part.year, part.day, part.number, use_toy_data), budget
+    )
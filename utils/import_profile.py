@@ -0,0 +1,68 @@
+"""
+#
+# import_profile.py
+#
+# How long importing each module takes, from `python -X importtime`.
+# This runs in a fresh interpreter, since anything we've already imported
+# here would otherwise look free.
+#
+"""
+import subprocess
+import sys
+
+from typing import List, NamedTuple
+
+DEFAULT_TOP = 20
+
+
+class ImportTime(NamedTuple):
+    name: str
+    self_us: int  # microseconds spent in the module itself
+    cumulative_us: int  # ... plus everything it imported first
+    depth: int  # 0 for modules imported directly
+
+
+def parse_importtime(stderr: str) -> List[ImportTime]:
+    """
+    -X importtime lines look like:
+
+        import time: self [us] | cumulative | imported package
+        import time:       341 |      11514 | colors
+        import time:       156 |        156 |   colors.palette
+    """
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times.append(ImportTime(name.strip(), int(self_us), int(cumulative_us), depth))
+    return times
+
+
+def profile_imports(module_names: List[str]) -> List[ImportTime]:
+    """Import module_names (in order) in a new interpreter, and time it"""
+    code = "\n".join(f"import {name}" for name in module_names)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise ImportError(process.stderr.strip().splitlines()[-1])
+    return parse_importtime(process.stderr)
+
+
+def format_report(times: List[ImportTime], top=DEFAULT_TOP) -> List[str]:
+    """The slowest imports, and how long everything took"""
+    total_us = sum(t.cumulative_us for t in times if t.depth == 0)
+    slowest = sorted(times, key=lambda t: t.cumulative_us, reverse=True)[:top]
+    lines = [f"{'cumulative':>12} {'self':>10}  module"]
+    lines += [
+        f"{t.cumulative_us / 1000:>10.1f}ms {t.self_us / 1000:>8.1f}ms  {'  ' * t.depth}{t.name}"
+        for t in slowest
+    ]
+    lines.append(f"{total_us / 1000:>10.1f}ms total, {len(times)} modules")
+    return lines
@@ -11,13 +11,19 @@ import os
 import re
 
 from collections import defaultdict
-from typing import Dict, List, Tuple, Callable
+from typing import Any, Dict, List, Optional, Tuple, Callable
 from types import ModuleType
 
+from utils.parsed import ParseCache, default_parse_cache
+from utils.registry import RegisteredDay, expected_cost, get_registered_day, read_hints
+from utils.utils import lazy_import
+
+inspect = lazy_import("inspect")
+
 
 DAY_PATTERN = re.compile(r"^day\d+.py$")
 YEAR_PATTERN = re.compile(r"^aoc_(\d+)$")
-DAY_FUNCTION_PATTERN = re.compile(r"^day(_\d+)?$")  # "day" or "day_N"
+PART_FUNCTION_PATTERN = re.compile(r"^part_(\d+)$")  # "part_1", "part_2"
 
 
 def get_year_dirs() -> List[Tuple[str, str]]:
@@ -39,26 +45,186 @@ def get_day_names(year_dir) -> List[str]:
     ]
 
 
-def get_day_module(day_fname, year_dir) -> ModuleType:
+def get_day_number(day_fname) -> int:
+    return int(day_fname[3:-3])  # "day01.py" -> 1
+
+
+def get_day_module_name(day_fname, year_dir) -> str:
     # e.g "aoc_2021.days.day01"
-    day_path = ".".join([year_dir, "days", day_fname[:-3]])
-    return importlib.import_module(day_path)
+    return ".".join([year_dir, "days", day_fname[:-3]])
+
+
+def get_day_module(day_fname, year_dir) -> ModuleType:
+    return importlib.import_module(get_day_module_name(day_fname, year_dir))
+
+
+def get_registered(day_fname, year_dir) -> RegisteredDay:
+    """Import a day's module, which @register()s its day_N() as it loads"""
+    module = get_day_module(day_fname, year_dir)
+    year = int(YEAR_PATTERN.match(year_dir).group(1))
+    registered = get_registered_day(year, get_day_number(day_fname))
+    if registered.module_name != module.__name__:
+        raise LookupError(f"{module.__name__} registered {registered.module_name} instead")
+    return registered
+
+
+class Part:
+    """
+    One part of a day, which can be run (or timed, cached, skipped) on its own.
+    Day modules don't need to do anything special, beyond these conventions:
+
+        input = LazyInput(2021, 5)      # real input
+        toy_input = [...]               # example input
+        toy_input_2 = [...]             # (optional) part 2 has its own example
+
+        def parse(input): ...           # (optional) input -> what the parts want
+        def part_1(data, verbose=False): ...
+        def part_2(data, verbose=False): ...
+
+    which are what day_N() already uses to call part_1() and part_2().
+    """
 
+    def __init__(self, year: int, day: int, number: int, module: ModuleType):
+        self.year = year
+        self.day = day
+        self.number = number  # 1 or 2
+        self.module = module
 
-def get_day_function(day_module: ModuleType):
-    """find the day() or day_\\d+"""
-    keys = [k for k in day_module.__dict__ if DAY_FUNCTION_PATTERN.match(k)]
-    assert 1 == len(keys)
-    day_func: Callable = getattr(day_module, keys[0])
-    return day_func
+    @property
+    def name(self) -> str:
+        return f"part_{self.number}"
 
+    @property
+    def function(self) -> Callable:
+        return getattr(self.module, self.name)
 
-def get_all_year_modules() -> Dict[int, List[Callable]]:
+    @property
+    def parse(self) -> Optional[Callable]:
+        return getattr(self.module, "parse", None)
+
+    def get_input(self, use_toy_data=False):
+        if use_toy_data:
+            return getattr(self.module, f"toy_input_{self.number}", self.module.toy_input)
+        return self.module.input
+
+    def parse_input(self, use_toy_data=False, parse_cache: Optional[ParseCache] = None):
+        """The day's parse() of our input, which is shared with (and frozen for) the other parts"""
+        data = self.get_input(use_toy_data)
+        if self.parse is None:
+            return data
+        return (parse_cache or default_parse_cache()).parse(self.parse, data)[0]
+
+    def solve(self, data, verbose=False):
+        """Run the part on already-parsed data"""
+        return self.function(data, verbose)
+
+    def __call__(self, use_toy_data=False, verbose=False):
+        return self.solve(self.parse_input(use_toy_data), verbose)
+
+    def __repr__(self):
+        return f"<Part {self.year} day {self.day} {self.name}>"
+
+
+def get_day_parts(day_module: ModuleType, year: int, day: int) -> List[Part]:
+    """find part_1(), part_2() (and any other part_N()), in order"""
+    numbers = sorted(
+        int(m.group(1))
+        for m in map(PART_FUNCTION_PATTERN.match, day_module.__dict__)
+        if m is not None
+    )
+    return [Part(year, day, number, day_module) for number in numbers]
+
+
+def get_parts(year: int, day: int, day_function: Callable) -> List[Part]:
+    """The parts of whatever module a day_N() (or LazyDay) lives in"""
+    module = getattr(day_function, "module", None) or inspect.getmodule(day_function)
+    return get_day_parts(module, year, day)
+
+
+def get_all_year_modules() -> Dict[int, Dict[int, Callable]]:
     return {
-        int(year): [
-            get_day_function(get_day_module(fname, year_dir))
+        int(year): {
+            get_day_number(fname): get_registered(fname, year_dir).function
             for fname in get_day_names(year_dir)
-        ]
+        }
+        for year_dir, year in get_year_dirs()
+    }
+
+
+class LazyDay:
+    """
+    A day's day_N() function, which is only imported the first time
+    it's called. Listing the days of every year only looks at filenames,
+    so running one day doesn't import (and load input for) all the others.
+    """
+
+    def __init__(self, day_fname: str, year_dir: str):
+        self.day_fname = day_fname  # e.g. "day01.py"
+        self.year_dir = year_dir  # e.g. "aoc_2021"
+
+    @property
+    def day(self) -> int:
+        return get_day_number(self.day_fname)
+
+    @property
+    def year(self) -> int:
+        return int(YEAR_PATTERN.match(self.year_dir).group(1))
+
+    @property
+    def module_name(self) -> str:
+        return get_day_module_name(self.day_fname, self.year_dir)
+
+    @property
+    def source_path(self) -> str:
+        return os.path.join(self.year_dir, "days", self.day_fname)
+
+    @property
+    def module(self) -> ModuleType:
+        # importlib keeps its own cache in sys.modules
+        return get_day_module(self.day_fname, self.year_dir)
+
+    @property
+    def registered(self) -> RegisteredDay:
+        return get_registered(self.day_fname, self.year_dir)
+
+    @property
+    def function(self) -> Callable:
+        return self.registered.function
+
+    @property
+    def slow(self) -> bool:
+        return self.registered.slow
+
+    @property
+    def expected_cost(self) -> float:
+        """
+        From the day's @register() hints, read from its source rather than
+        importing it: scheduling days (e.g. for --jobs) shouldn't import them
+        all up front, and a day that doesn't import should fail by itself
+        when it's run, not stop the others from being scheduled
+        """
+        try:
+            return expected_cost(*read_hints(self.source_path))
+        except (OSError, SyntaxError, ValueError):
+            return 0.0
+
+    @property
+    def parts(self) -> List[Part]:
+        return get_day_parts(self.module, self.year, self.day)
+
+    def __call__(self, *args, **kwargs):
+        return self.function(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<LazyDay {self.year_dir}/days/{self.day_fname}>"
+
+
+def get_lazy_year_modules() -> Dict[int, Dict[int, LazyDay]]:
+    """Same shape as get_all_year_modules(), but nothing is imported yet"""
+    return {
+        int(year): {
+            get_day_number(fname): LazyDay(fname, year_dir) for fname in get_day_names(year_dir)
+        }
         for year_dir, year in get_year_dirs()
     }
 
@@ -68,36 +234,67 @@ def get_all_year_modules() -> Dict[int, List[Callable]]:
 # ------------------
 
 
+# options that take a value, e.g. "--jobs 4" or "--jobs=4"
+VALUE_OPTIONS = {
+    "--jobs",
+    "--reps",
+    "--warmup",
+    "--out",
+    "--baseline",
+    "--threshold",
+    "--profile-dir",
+    "--top",
+    "--budget",
+    "--scale",
+    "--max-seconds",
+    "--socket",
+    "--format",
+    "--part",
+}
+
+
 def get_int_args(argv):
     args = []
+    is_option_value = False
     for arg in argv:
+        if is_option_value:
+            is_option_value = False
+            continue
+        if arg in VALUE_OPTIONS:
+            # the next arg is this option's value, not a year or a day
+            is_option_value = True
+            continue
         try:
             args.append(int(arg))
-        except:
+        except ValueError:
             pass
     return args
 
 
-def get_opts(argv: List[str]) -> Dict[str, bool]:
-    options = [item for item in argv if item.startswith("--")]
-    return defaultdict(bool, {opt: True for opt in options})
+def get_opts(argv: List[str]) -> Dict[str, Any]:
+    options: Dict[str, Any] = defaultdict(bool)
+    args = iter(argv)
+    for arg in args:
+        if not arg.startswith("--"):
+            continue
+        name, has_value, value = arg.partition("=")
+        if name in VALUE_OPTIONS:
+            options[name] = value if has_value else next(args, "")
+        else:
+            options[name] = True
+    return options
 
 
 def get_advents_to_run(advents, argv, use_all=False):
-    year, *days = get_int_args(argv)
-    # import ipdb; ipdb.set_trace()###REMOVE
     if use_all:
         return [
             # fmt: off
-            (year, index + 1, day)
+            (year, day, advents[year][day])
             for year in sorted(advents.keys())
-            for index, day in enumerate(advents[year])
+            for day in sorted(advents[year].keys())
             # fmt: on
         ]
+    year, *days = get_int_args(argv)
     if len(days) == 0:
-        days = range(1, len(advents[year]) + 1)
-    return [
-        # input is 1-indexed ;)
-        (year, day, advents[year][day - 1])
-        for day in days
-    ]
+        days = sorted(advents[year].keys())
+    return [(year, day, advents[year][day]) for day in days]
@@ -0,0 +1,162 @@
+"""
+#
+# memory.py
+#
+# Measure how much memory each part of a day allocates, for aoc.py --mem
+#
+#   aoc.py 2021 15 --mem --top 10
+#
+"""
+import copy
+import os
+import signal
+import tracemalloc
+
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.loader import get_parts
+from utils.runner import format_error
+
+DEFAULT_TOP = 5
+# seconds of CPU time between checks for a new peak
+DEFAULT_CHECK_INTERVAL = 0.005
+
+
+class PeakSnapshots:
+    """
+    tracemalloc tells us the peak size, but not what was allocated at the
+    peak: by the time a part returns, its temporaries are gone. So every
+    `interval` seconds of CPU time (SIGPROF), take a snapshot whenever
+    traced memory is meaningfully higher than at our last snapshot.
+
+    Only works in the main thread, on platforms that have setitimer().
+    Short parts may finish before the first check; callers fall back to
+    a snapshot of whatever is still allocated at the end.
+    """
+
+    def __init__(self, interval=DEFAULT_CHECK_INTERVAL, growth=1.25):
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = 0
+        self._previous_handler: Any = None
+        self._busy = False
+
+    @staticmethod
+    def is_supported() -> bool:
+        return hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF")
+
+    def _check(self, signum, frame):
+        if self._busy:
+            # a big snapshot can take longer than the interval
+            return
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * self.growth:
+            self._busy = True
+            try:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+            finally:
+                self._busy = False
+
+    def start(self):
+        self._previous_handler = signal.signal(signal.SIGPROF, self._check)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+
+
+# our own bookkeeping isn't interesting
+IGNORED_FILES = {tracemalloc.__file__, copy.__file__, __file__}
+
+
+def site_stats(snapshot: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+    """Allocations grouped by file:line, biggest first"""
+    # group first (fast), then drop what we don't care about:
+    # Snapshot.filter_traces() is far too slow for big snapshots
+    return [
+        {
+            "site": f"{os.path.relpath(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+            "size": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")
+        if stat.traceback[0].filename not in IGNORED_FILES
+    ]
+
+
+def measure_part(part_function: Callable, args, kwargs, top=DEFAULT_TOP) -> Dict[str, Any]:
+    """
+    Run a part once with tracemalloc on, and return:
+        peak:   the most memory it had allocated at once, in bytes
+        blocks: how many allocations were alive at (roughly) that peak
+        top:    where the biggest of those came from
+    """
+    args, kwargs = copy.deepcopy((args, kwargs))
+    watcher = PeakSnapshots() if PeakSnapshots.is_supported() else None
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        if watcher is not None:
+            watcher.start()
+        try:
+            answer = part_function(*args, **kwargs)
+        finally:
+            if watcher is not None:
+                watcher.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = (
+            watcher.snapshot if watcher and watcher.snapshot else tracemalloc.take_snapshot()
+        )
+    finally:
+        tracemalloc.stop()
+
+    sites = site_stats(snapshot)
+    return {
+        "answer": answer,
+        "peak": peak - baseline,
+        "blocks": sum(site["count"] for site in sites),
+        "top": sites[:top],
+    }
+
+
+def measure_day(
+    year: int, day: int, day_function: Callable, use_toy_data=False, top=DEFAULT_TOP
+) -> Dict[str, Any]:
+    """Measure each part of a day on its own, after its input is loaded and parsed"""
+    result: Dict[str, Any] = {"year": year, "day": day, "parts": {}}
+    for part in get_parts(year, day, day_function):
+        data = part.parse_input(use_toy_data)
+        result["parts"][part.name] = measure_part(part.solve, (data,), {}, top)
+    return result
+
+
+def measure_days(advents_to_run, use_toy_data=False, top=DEFAULT_TOP):
+    """(result, error) for each day"""
+    for year, day, day_function in advents_to_run:
+        try:
+            yield measure_day(year, day, day_function, use_toy_data, top), None
+        except Exception as e:
+            yield None, f"{year} {day:>2}: {format_error(e)}"
+
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:7.1f}{unit}"
+        size /= 1024
+    return f"{size:7.1f}GiB"
+
+
+def format_day(result: Dict[str, Any]) -> List[str]:
+    prefix = f"{result['year']} {result['day']:>2}"
+    lines = []
+    for name, stats in result["parts"].items():
+        lines.append(
+            f"{prefix} {name} peak {format_bytes(stats['peak'])}  blocks {stats['blocks']:>9}"
+        )
+        for site in stats["top"]:
+            lines.append(f"    {format_bytes(site['size'])} {site['count']:>9}  {site['site']}")
+    return lines
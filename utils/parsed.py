@@ -0,0 +1,233 @@
+"""
+#
+# parsed.py
+#
+# Parse each day's input once. part_1 and part_2 are both handed the same
+# result of the day's parse() hook, frozen (lists become tuples, etc) so that
+# neither part can change it under the other. Whatever can't be frozen (dicts,
+# a day's own classes) is copied for each part instead.
+#
+# With AOC_PERSIST_PARSED=1, parsed inputs are also pickled under .aoc_parsed/,
+# keyed by the hash of the input (and of the day's source, and of the project
+# modules it imports, however indirectly), so that repeated
+# runs, e.g. of --bench, skip parsing entirely:
+#
+#   AOC_PERSIST_PARSED=1 aoc.py 2021 --bench
+#
+"""
+import ast
+import copy
+import functools
+import hashlib
+import os
+import pickle
+
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils import utils
+from utils.utils import lazy_import
+
+inspect = lazy_import("inspect")
+
+PARSED_DIR = ".aoc_parsed"
+PERSIST_ENV_VAR = "AOC_PERSIST_PARSED"
+
+
+def hash_lines(lines: Iterable) -> str:
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(str(line).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def imported_names(path: str) -> Set[str]:
+    """Every module (or module.name) that path imports, without importing it"""
+    try:
+        with open(path) as f:
+            tree = ast.parse(f.read(), path)
+    except (FileNotFoundError, SyntaxError):
+        # half-way through an edit; reloading it will say what's wrong
+        return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module is not None:
+            # "from utils import utils" imports utils.utils
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+        elif (
+            isinstance(node, ast.Call)
+            and getattr(node.func, "id", None) == "lazy_import"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+        ):
+            names.add(node.args[0].value)
+    return names
+
+
+# the directory that utils/ and aoc_*/ are in
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(utils.__file__)))
+
+
+def project_path(name: str, roots: Tuple[str, ...]) -> Optional[str]:
+    """The file that module name (e.g. "utils.search") is, if it's under one of roots"""
+    for root in roots:
+        base = os.path.join(root, *name.split("."))
+        for path in (base + ".py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def imported_paths(path: str, mtime_ns: int, roots: Tuple[str, ...]) -> Set[str]:
+    """Our modules that path imports (by mtime, so that an edited file is read again)"""
+    found = (project_path(name, roots) for name in imported_names(path))
+    return {imported for imported in found if imported is not None}
+
+
+def source_files(module: ModuleType) -> List[str]:
+    """The day's source, and every module of ours it imports, however indirectly"""
+    source = os.path.abspath(inspect.getsourcefile(module))
+    # "aoc_2021.days.day15" is three levels below the directory it's imported from
+    root = source
+    for _ in module.__name__.split("."):
+        root = os.path.dirname(root)
+    roots = tuple(dict.fromkeys([PROJECT_DIR, root]))
+    found = {source}
+    pending = [source]
+    while pending:
+        path = pending.pop()
+        for imported in imported_paths(path, os.stat(path).st_mtime_ns, roots) - found:
+            found.add(imported)
+            pending.append(imported)
+    return sorted(found)
+
+
+def hash_source(module: ModuleType) -> str:
+    """
+    The day's own source, plus that of everything of ours it uses (utils
+    modules, and their imports): a fix to any of them changes the answer
+    """
+    digest = hashlib.sha256()
+    for fname in source_files(module):
+        digest.update(os.path.relpath(fname, PROJECT_DIR).encode())
+        with open(fname, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def freeze(value: Any) -> Any:
+    """
+    Lists (and tuples) become tuples, sets become frozensets, all the way down,
+    and ByteGrids and numpy arrays are made read-only. Anything else (dicts, a day's own
+    classes) is handed over as it is: see is_frozen()
+    """
+    if type(value) in (list, tuple):
+        return tuple(freeze(item) for item in value)
+    if type(value) in (set, frozenset):
+        return frozenset(freeze(item) for item in value)
+    if isinstance(value, utils.ByteGrid):
+        return value.frozen()
+    if hasattr(value, "setflags"):
+        value.setflags(write=False)
+    return value
+
+
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, range)
+
+
+def is_frozen(value: Any) -> bool:
+    """Whether nothing in (a freeze()d) value can be changed, so the parts can share it"""
+    if isinstance(value, IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_frozen(item) for item in value)
+    if isinstance(value, utils.ByteGrid):
+        return isinstance(value.cells, bytes)
+    flags = getattr(value, "flags", None)
+    if flags is not None and hasattr(value, "setflags"):
+        return not flags.writeable and value.dtype != object
+    return False
+
+
+def is_persisted() -> bool:
+    return os.environ.get(PERSIST_ENV_VAR, "") not in ("", "0")
+
+
+class ParseCache:
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir  # None: only remember parsed inputs in memory
+        # (parsed, whether it's frozen, or has to be copied for each part)
+        self.parsed: Dict[Tuple[Callable, str], Tuple[Any, bool]] = {}
+
+    def key(self, parse: Callable, input_hash: str) -> str:
+        module = inspect.getmodule(parse)
+        parts = [parse.__module__, parse.__qualname__, input_hash, hash_source(module)]
+        return hashlib.sha256("/".join(parts).encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pickle")
+
+    def load(self, key: str) -> Tuple[bool, Any]:
+        """(hit, parsed)"""
+        try:
+            with open(self.path(key), "rb") as f:
+                return True, freeze(pickle.load(f))
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return False, None
+
+    def save(self, key: str, parsed: Any):
+        try:
+            data = pickle.dumps(parsed)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            # not something we know how to store; just parse it again next time
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        # write + rename, so that parallel runs never see half of a file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def parse(self, parse: Callable, data) -> Tuple[Any, bool]:
+        """
+        (parsed, hit): parse(data), frozen, unless we've already parsed this input.
+        If it can't all be frozen, each call gets its own copy of it.
+        """
+        input_hash = hash_lines(data)
+        hit = (parse, input_hash) in self.parsed
+        if not hit and self.cache_dir is not None:
+            key = self.key(parse, input_hash)
+            hit, parsed = self.load(key)
+            if hit:
+                self.parsed[(parse, input_hash)] = parsed, is_frozen(parsed)
+        if not hit:
+            parsed = freeze(parse(data))
+            if self.cache_dir is not None:
+                self.save(key, parsed)
+            self.parsed[(parse, input_hash)] = parsed, is_frozen(parsed)
+        parsed, frozen = self.parsed[(parse, input_hash)]
+        return (parsed if frozen else copy.deepcopy(parsed)), hit
+
+    def forget(self, module_name: str):
+        """Drop what a module's parse() made, e.g. because the module was reloaded"""
+        for key in [key for key in self.parsed if key[0].__module__ == module_name]:
+            del self.parsed[key]
+
+
+@functools.cache
+def default_parse_cache() -> ParseCache:
+    return ParseCache(PARSED_DIR if is_persisted() else None)
+
+
+def parse_once(parse: Callable, data) -> Any:
+    """
+    What day_N() and the runner call, instead of parse(data). Each call gets
+    its own copy of anything that couldn't be frozen.
+    """
+    return default_parse_cache().parse(parse, data)[0]
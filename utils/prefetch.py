@@ -0,0 +1,148 @@
+"""
+#
+# prefetch.py
+#
+# Download every missing input for some days at once, concurrently, instead of
+# one at a time as each day first runs:
+#
+#   aoc.py 2021 --prefetch --jobs 8
+#
+# Requests share one connection pool, at most `concurrency` run at a time, and
+# ones that fail in a way that might not happen again (connection errors,
+# 429s, 5xxs) are retried with exponential backoff.
+# Set AOC_BASE_URL to fetch from somewhere other than adventofcode.com.
+#
+"""
+import asyncio
+import os
+
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from utils.runner import format_error
+from utils.utils import input_path, lazy_import, save_input
+
+urllib3 = lazy_import("urllib3")
+
+BASE_URL_ENV_VAR = "AOC_BASE_URL"
+DEFAULT_BASE_URL = "https://adventofcode.com"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5  # seconds before the first retry, doubling after that
+TIMEOUT = 30.0
+USER_AGENT = "github.com/gknoy/aoc prefetch"
+
+# worth trying again; anything else (e.g. a 404 for a day that isn't out yet) isn't
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class StatusError(Exception):
+    def __init__(self, url: str, status: int):
+        super().__init__(f"{url} returned {status}")
+        self.status = status
+
+
+class Fetched(NamedTuple):
+    year: int
+    day: int
+    path: Optional[str]  # where the input was saved
+    error: Optional[str]
+    attempts: int
+
+
+def get_base_url() -> str:
+    return os.environ.get(BASE_URL_ENV_VAR, "") or DEFAULT_BASE_URL
+
+
+def get_session_token() -> str:
+    """The same token that aocd uses ($AOC_SESSION, or ~/.config/aocd/token)"""
+    from aocd.models import default_user
+
+    return default_user().token
+
+
+def input_url(base_url: str, year: int, day: int) -> str:
+    return f"{base_url.rstrip('/')}/{year}/day/{day}/input"
+
+
+def missing_inputs(days: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    return [(year, day) for year, day in days if not os.path.exists(input_path(year, day))]
+
+
+def download_input(pool, base_url: str, token: str, year: int, day: int) -> str:
+    """Fetch and save one input; this blocks, so it's run in a worker thread"""
+    url = input_url(base_url, year, day)
+    response = pool.request(
+        "GET",
+        url,
+        headers={"Cookie": f"session={token}", "User-Agent": USER_AGENT},
+        retries=False,
+        timeout=TIMEOUT,
+    )
+    if response.status != 200:
+        raise StatusError(url, response.status)
+    return save_input(year, day, response.data.decode())
+
+
+async def fetch_one(
+    pool,
+    semaphore: asyncio.Semaphore,
+    base_url: str,
+    token: str,
+    year: int,
+    day: int,
+    retries=DEFAULT_RETRIES,
+    backoff=DEFAULT_BACKOFF,
+) -> Fetched:
+    error: Optional[Exception] = None
+    attempt = 0
+    while attempt <= retries:
+        attempt += 1
+        async with semaphore:
+            try:
+                path = await asyncio.to_thread(download_input, pool, base_url, token, year, day)
+                return Fetched(year, day, path, None, attempt)
+            except StatusError as e:
+                error = e
+                if e.status not in RETRY_STATUSES:
+                    break
+            except urllib3.exceptions.HTTPError as e:
+                error = e
+            except Exception as e:
+                # e.g. an input that isn't text, or can't be saved: report it, and don't
+                # let it take every other day's result down with it
+                error = e
+                break
+        if attempt <= retries:
+            # (without holding our slot, so other days can use it meanwhile)
+            await asyncio.sleep(backoff * 2 ** (attempt - 1))
+    return Fetched(year, day, None, format_error(error), attempt)
+
+
+async def prefetch(
+    days: List[Tuple[int, int]],
+    base_url: Optional[str] = None,
+    token: Optional[str] = None,
+    concurrency=DEFAULT_CONCURRENCY,
+    retries=DEFAULT_RETRIES,
+    backoff=DEFAULT_BACKOFF,
+) -> List[Fetched]:
+    """Fetch each of days' inputs, and report how each one went (in the same order)"""
+    base_url = base_url or get_base_url()
+    token = token or get_session_token()
+    semaphore = asyncio.Semaphore(concurrency)
+    # one pool for every request, with a connection for each one in flight
+    with urllib3.PoolManager(maxsize=concurrency, block=True) as pool:
+        return await asyncio.gather(
+            *(
+                fetch_one(pool, semaphore, base_url, token, year, day, retries, backoff)
+                for year, day in days
+            )
+        )
+
+
+def prefetch_inputs(days: Iterable[Tuple[int, int]], **kwargs) -> List[Fetched]:
+    """Fetch whichever of days' inputs we don't have yet"""
+    missing = missing_inputs(days)
+    if not missing:
+        return []
+    return asyncio.run(prefetch(missing, **kwargs))
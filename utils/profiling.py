@@ -0,0 +1,111 @@
+"""
+#
+# profiling.py
+#
+# Profile whole days, without editing them, for aoc.py --profile
+#
+#   aoc.py 2021 15 --profile --profile-dir profiles
+#
+#   python -m pstats profiles/2021_15.pstats           # poke at the cProfile stats
+#   flamegraph.pl profiles/2021_15.collapsed > 15.svg   # or speedscope, etc.
+#
+"""
+import cProfile
+import os
+import signal
+import sys
+
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_PROFILE_DIR = "profiles"
+# seconds of CPU time between samples
+DEFAULT_SAMPLE_INTERVAL = 0.001
+
+
+def frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    # ";" separates frames in the collapsed format
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(
+        ";", ":"
+    )
+
+
+class StackSampler:
+    """
+    A tiny sampling profiler: every `interval` seconds of CPU time, SIGPROF
+    interrupts us and we count the current stack. Frames at or above
+    `root` (i.e. the profiler's own callers) are left out.
+
+    Only works in the main thread, on platforms that have setitimer().
+    """
+
+    def __init__(self, interval=DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.root: Optional[FrameType] = None
+        self._previous_handler: Any = None
+
+    @staticmethod
+    def is_supported() -> bool:
+        return hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF")
+
+    def _sample(self, signum, frame: Optional[FrameType]):
+        stack = []
+        while frame is not None and frame is not self.root:
+            stack.append(frame_label(frame))
+            frame = frame.f_back
+        if stack:
+            self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self.root = sys._getframe(1)
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+
+    def collapsed(self) -> List[str]:
+        """Brendan Gregg's collapsed stack format: "root;child;leaf count" """
+        return [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
+
+
+def profile_day(
+    year: int,
+    day: int,
+    day_function: Callable,
+    use_toy_data=False,
+    profile_dir=DEFAULT_PROFILE_DIR,
+    interval=DEFAULT_SAMPLE_INTERVAL,
+) -> Dict[str, Any]:
+    """
+    Run one day under cProfile (and the stack sampler, where supported),
+    and write {year}_{NN}.pstats and {year}_{NN}.collapsed to profile_dir.
+    The profiles are written even if the day raises.
+    """
+    os.makedirs(profile_dir, exist_ok=True)
+    base = os.path.join(profile_dir, f"{year}_{day:02}")
+    profiler = cProfile.Profile()
+    sampler = StackSampler(interval) if StackSampler.is_supported() else None
+    result: Dict[str, Any] = {"year": year, "day": day, "files": []}
+
+    if sampler is not None:
+        sampler.start()
+    profiler.enable()
+    try:
+        result["answers"] = day_function(use_toy_data=use_toy_data, verbose=False)
+    finally:
+        profiler.disable()
+        if sampler is not None:
+            sampler.stop()
+
+        profiler.dump_stats(f"{base}.pstats")
+        result["files"].append(f"{base}.pstats")
+        if sampler is not None:
+            with open(f"{base}.collapsed", "w") as f:
+                f.writelines(f"{line}\n" for line in sampler.collapsed())
+            result["files"].append(f"{base}.collapsed")
+    return result
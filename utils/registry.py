@@ -0,0 +1,92 @@
+"""
+#
+# registry.py
+#
+# Days say which (year, day) they solve, instead of us guessing
+# from filenames and function names:
+#
+#     @register(2021, 12, slow=True)
+#     def day_12(use_toy_data=False, verbose=False):
+#         ...
+#
+"""
+import ast
+import sys
+
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+from types import ModuleType
+
+# a rough guess at how long a slow=True day takes, when it doesn't give a cost
+SLOW_COST = 10.0
+
+
+def expected_cost(slow=False, cost: Optional[float] = None) -> float:
+    """What to sort by, when scheduling the slowest days first"""
+    if cost is not None:
+        return cost
+    return SLOW_COST if slow else 0.0
+
+
+class RegisteredDay(NamedTuple):
+    year: int
+    day: int
+    function: Callable  # day_N()
+    module_name: str  # e.g. "aoc_2021.days.day15"
+    slow: bool = False
+    cost: Optional[float] = None  # roughly how many seconds the real input takes
+
+    @property
+    def module(self) -> ModuleType:
+        return sys.modules[self.module_name]
+
+    @property
+    def expected_cost(self) -> float:
+        return expected_cost(self.slow, self.cost)
+
+
+REGISTRY: Dict[Tuple[int, int], RegisteredDay] = {}
+
+
+def register(year: int, day: int, slow=False, cost: Optional[float] = None):
+    """
+    Record a day_N() function as the solution for year/day.
+    Registering the same day again (e.g. after importlib.reload())
+    replaces the old entry.
+    """
+
+    def decorator(day_function: Callable) -> Callable:
+        REGISTRY[(year, day)] = RegisteredDay(
+            year, day, day_function, day_function.__module__, slow, cost
+        )
+        return day_function
+
+    return decorator
+
+
+def read_hints(path: str) -> Tuple[bool, Optional[float]]:
+    """
+    (slow, cost) from the @register(...) in a day's source, without importing
+    it (which would load its input, and might fail). Hints that aren't plain
+    constants count as not given.
+    """
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "register":
+            # register(year, day, slow, cost), by position or by name
+            hints = dict(zip(["slow", "cost"], node.args[2:]))
+            hints.update((keyword.arg, keyword.value) for keyword in node.keywords)
+            values = {
+                name: value.value
+                for name, value in hints.items()
+                if isinstance(value, ast.Constant)
+            }
+            return bool(values.get("slow", False)), values.get("cost")
+    return False, None
+
+
+def get_registered_day(year: int, day: int) -> RegisteredDay:
+    try:
+        return REGISTRY[(year, day)]
+    except KeyError:
+        raise LookupError(f"nothing is registered for {year} day {day}") from None
@@ -0,0 +1,190 @@
+"""
+#
+# runner.py
+#
+# Run a batch of advents, optionally spread across a pool of processes
+#
+"""
+import json
+import sys
+
+from time import perf_counter, process_time
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from utils.cache import AnswerCache
+from utils.loader import Part, get_parts
+from utils.parsed import hash_lines
+from utils.utils import lazy_import
+
+# only --jobs needs a process pool
+futures = lazy_import("concurrent.futures")
+resource = lazy_import("resource")
+
+# (year, day, answers, error)
+AdventResult = Tuple[int, int, Optional[List[Any]], Optional[str]]
+
+
+class PartRecord(NamedTuple):
+    """How one part went, for --format jsonl"""
+
+    year: int
+    day: int
+    part: Optional[int]  # None: the day failed before any of its parts ran
+    answer: Any
+    error: Optional[str]
+    wall: Optional[float]  # seconds
+    cpu: Optional[float]  # seconds of CPU time, in the process that ran it
+    # bytes that process's peak RSS went up by while the part ran: 0 if it stayed
+    # under an earlier peak (ru_maxrss is all a process gets, and it never goes down)
+    peak_rss_growth: Optional[int]
+    cache_hit: Optional[bool]  # None: not cached (--no-cache, or --verbose)
+    input_hash: Optional[str]
+
+
+def format_error(error: BaseException) -> str:
+    return f"ERROR {type(error).__name__}: {error}"
+
+
+def solve_day(
+    year: int,
+    day: int,
+    day_function: Callable,
+    use_toy_data=False,
+    verbose=False,
+    cache: Optional[AnswerCache] = None,
+) -> List[Any]:
+    """
+    A day's answers. With a cache, each part is looked up (or solved
+    and remembered) on its own; verbose runs skip the cache, since the
+    point of those is to watch the work.
+    """
+    if cache is None or verbose:
+        return day_function(use_toy_data=use_toy_data, verbose=verbose)
+    return [cache.solve(part, use_toy_data)[0] for part in get_parts(year, day, day_function)]
+
+
+def run_advent(
+    year: int,
+    day: int,
+    day_function: Callable,
+    use_toy_data=False,
+    verbose=False,
+    cache: Optional[AnswerCache] = None,
+) -> AdventResult:
+    """Run one day, reporting an exception instead of raising it"""
+    try:
+        answers = solve_day(year, day, day_function, use_toy_data, verbose, cache)
+        return (year, day, answers, None)
+    except Exception as e:
+        return (year, day, None, format_error(e))
+
+
+def peak_rss() -> int:
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB everywhere else
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def solve_part(
+    part: Part, use_toy_data=False, verbose=False, cache: Optional[AnswerCache] = None
+) -> PartRecord:
+    """Solve one part, timing it, and reporting an exception instead of raising it"""
+    answer = error = cache_hit = input_hash = None
+    wall = cpu = None
+    start_rss = peak_rss()
+    try:
+        # (outside the timings: every part gets the same input)
+        input_hash = hash_lines(part.get_input(use_toy_data))
+        start_wall, start_cpu = perf_counter(), process_time()
+        try:
+            if cache is None or verbose:
+                answer = part(use_toy_data, verbose)
+            else:
+                answer, cache_hit = cache.solve(part, use_toy_data)
+        finally:
+            wall, cpu = perf_counter() - start_wall, process_time() - start_cpu
+    except Exception as e:
+        error = format_error(e)
+    return PartRecord(
+        part.year,
+        part.day,
+        part.number,
+        answer,
+        error,
+        wall,
+        cpu,
+        peak_rss() - start_rss,
+        cache_hit,
+        input_hash,
+    )
+
+
+def failed_day_record(year: int, day: int, error: str) -> PartRecord:
+    return PartRecord(year, day, None, None, error, None, None, None, None, None)
+
+
+def run_advent_records(
+    year: int,
+    day: int,
+    day_function: Callable,
+    use_toy_data=False,
+    verbose=False,
+    cache: Optional[AnswerCache] = None,
+) -> Tuple[int, int, Optional[List[PartRecord]], Optional[str]]:
+    """Like run_advent(), but with a PartRecord for each part instead of just its answer"""
+    try:
+        parts = get_parts(year, day, day_function)
+    except Exception as e:
+        # e.g. the module doesn't import
+        return (year, day, None, format_error(e))
+    return (year, day, [solve_part(part, use_toy_data, verbose, cache) for part in parts], None)
+
+
+def format_record(record: PartRecord) -> str:
+    # answers that JSON doesn't know about (e.g. a day's own classes) are written as str()
+    return json.dumps(record._asdict(), default=str)
+
+
+def expected_cost(day_function: Callable) -> float:
+    """A LazyDay knows its @register(..., slow=True, cost=...) hints; anything else is cheap"""
+    try:
+        return getattr(day_function, "expected_cost", 0.0)
+    except Exception:
+        # it'll fail again when it's run, which is where we report it
+        return 0.0
+
+
+def run_advents_in_parallel(
+    advents_to_run: List[Tuple[int, int, Callable]],
+    use_toy_data=False,
+    verbose=False,
+    jobs=2,
+    cache: Optional[AnswerCache] = None,
+    run: Callable = run_advent,
+) -> Iterable[AdventResult]:
+    """
+    Run days in a process pool, yielding results in the same (year, day)
+    order that they were requested in, as soon as each one is ready.
+    The slowest days are started first, so that one of them isn't left
+    running alone at the end while the other workers sit idle.
+    A day that raises (or kills its worker) doesn't stop the others.
+    Each day is run with run(): run_advent(), or e.g. run_advent_records().
+    """
+    by_cost = sorted(
+        range(len(advents_to_run)),
+        key=lambda index: expected_cost(advents_to_run[index][2]),
+        reverse=True,
+    )
+    with futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        submitted = {}
+        for index in by_cost:
+            year, day, day_function = advents_to_run[index]
+            submitted[index] = pool.submit(
+                run, year, day, day_function, use_toy_data, verbose, cache
+            )
+        for index, (year, day, _) in enumerate(advents_to_run):
+            future = submitted[index]
+            try:
+                yield future.result()
+            except Exception as e:
+                yield (year, day, None, format_error(e))
@@ -0,0 +1,151 @@
+"""
+#
+# search.py
+#
+# Cheapest paths through graphs whose nodes are ints (e.g. a grid's flat
+# indexes), using a heap of candidates instead of scanning all of them for
+# the cheapest one each time:
+#
+#   table = neighbor_table(grid.width, grid.height, include_diagonals=False)
+#   result = shortest_path(start, goal, len(grid), table.__getitem__, grid.__getitem__)
+#   result.cost
+#
+# Without a heuristic this is Dijkstra's algorithm; with one, it's A*.
+#
+# For grids there's a shortcut, from the top left to the bottom right by
+# default, which works out neighbors as it goes instead of from a table:
+#
+#   shortest_grid_path(grid).cost
+#
+# grid can be anything with width, height and flat indexes, including a
+# TiledGrid, whose cells are only worked out as the search reaches them.
+#
+"""
+import heapq
+
+from array import array
+from math import inf
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+from utils.utils import orthogonal_neighbors
+
+NO_NODE = -1
+
+
+class SearchResult(NamedTuple):
+    cost: Optional[int]  # None: there's no way to get to the goal
+    path: Optional[List[int]]  # start ... goal, when asked for
+    visited: int  # how many nodes we had to settle on the way
+
+
+def reconstruct_path(prev: array, goal: int) -> List[int]:
+    path = [goal]
+    while prev[path[-1]] != NO_NODE:
+        path.append(prev[path[-1]])
+    return path[::-1]
+
+
+def cheapest_cost(
+    start: int,
+    goal: int,
+    n_nodes: int,
+    neighbors: Callable[[int], Iterable[int]],
+    cost: Callable[[int], int],
+) -> SearchResult:
+    """
+    shortest_path(), without a heuristic or a path: the same loop, minus the
+    checks for them on every step, which is about a third quicker
+    """
+    dist = [inf] * n_nodes
+    dist[start] = 0
+    candidates = [start]  # so_far * n_nodes + node, as in shortest_path()
+    heappop, heappush = heapq.heappop, heapq.heappush
+    visited = 0
+    while candidates:
+        so_far, node = divmod(heappop(candidates), n_nodes)
+        if so_far > dist[node]:
+            continue
+        visited += 1
+        if node == goal:
+            return SearchResult(so_far, None, visited)
+        for neighbor in neighbors(node):
+            new_cost = so_far + cost(neighbor)
+            if new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                heappush(candidates, new_cost * n_nodes + neighbor)
+    return SearchResult(None, None, visited)
+
+
+def shortest_path(
+    start: int,
+    goal: int,
+    n_nodes: int,
+    neighbors: Callable[[int], Iterable[int]],
+    cost: Callable[[int], int],
+    heuristic: Optional[Callable[[int], int]] = None,
+    with_path=False,
+) -> SearchResult:
+    """
+    The cheapest way from start to goal, where nodes are 0 .. n_nodes - 1,
+    neighbors(node) are the nodes we can go to next, and cost(node) is what
+    it costs (an int, >= 0) to go to (enter) node; the start itself costs nothing.
+
+    heuristic(node), if given, is a guess of the cost from node to the goal,
+    which must never be more than the real cost (e.g. manhattan distance,
+    when every step costs at least 1), or the answer might not be the cheapest.
+    """
+    if heuristic is None and not with_path:
+        return cheapest_cost(start, goal, n_nodes, neighbors, cost)
+    dist = [inf] * n_nodes
+    dist[start] = 0
+    prev = array("l", [NO_NODE]) * n_nodes if with_path else None
+    # Each candidate is one int, estimate * n_nodes + node (where estimate is
+    # the cost so far, plus the heuristic's guess at the rest): ints are far
+    # quicker to push, pop and compare than (estimate, node) tuples.
+    candidates = [(heuristic(start) if heuristic else 0) * n_nodes + start]
+    heappop, heappush = heapq.heappop, heapq.heappush
+    visited = 0
+    while candidates:
+        estimate, node = divmod(heappop(candidates), n_nodes)
+        so_far = estimate - heuristic(node) if heuristic else estimate
+        if so_far > dist[node]:
+            # we've found a cheaper way to node since this was pushed: rather
+            # than finding (and removing) it then, we skip it now
+            continue
+        visited += 1
+        if node == goal:
+            path = reconstruct_path(prev, goal) if prev is not None else None
+            return SearchResult(so_far, path, visited)
+        for neighbor in neighbors(node):
+            new_cost = so_far + cost(neighbor)
+            if new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                if prev is not None:
+                    prev[neighbor] = node
+                estimate = new_cost + heuristic(neighbor) if heuristic else new_cost
+                heappush(candidates, estimate * n_nodes + neighbor)
+    return SearchResult(None, None, visited)
+
+
+def shortest_grid_path(
+    grid,
+    start=0,
+    goal: Optional[int] = None,
+    heuristic: Optional[Callable[[int], int]] = None,
+    with_path=False,
+) -> SearchResult:
+    """
+    The cheapest way across grid (a ByteGrid, TiledGrid, or anything else with
+    width, height, and grid[index] as the cost of entering index), without
+    going diagonally; from start to goal (default: the bottom right) by flat index
+    """
+    n_nodes = grid.width * grid.height
+    return shortest_path(
+        start,
+        n_nodes - 1 if goal is None else goal,
+        n_nodes,
+        orthogonal_neighbors(grid.width, grid.height),
+        grid.__getitem__,
+        heuristic=heuristic,
+        with_path=with_path,
+    )
@@ -0,0 +1,62 @@
+"""
+#
+# test_baseline.py: Test comparing benchmarks to a saved baseline
+#
+"""
+
+import math
+
+from utils.baseline import (
+    compare_part,
+    compare_to_baseline,
+    format_comparison,
+    load_baseline,
+    mann_whitney_p,
+    ranks,
+    save_baseline,
+)
+
+
+def test_ranks():
+    assert ranks([3.0, 1.0, 2.0]) == [3.0, 1.0, 2.0]
+    assert ranks([1.0, 2.0, 2.0, 5.0]) == [1.0, 2.5, 2.5, 4.0]
+
+
+def test_mann_whitney_p():
+    before = [1.0, 1.1, 0.9, 1.05, 0.95, 1.02, 0.98, 1.01]
+    assert mann_whitney_p(before, [x * 2 for x in before]) < 0.01
+    assert mann_whitney_p(before, [x / 2 for x in before]) > 0.99
+    assert mann_whitney_p(before, before) > 0.4
+    assert mann_whitney_p([1.0, 1.0], [1.0, 1.0]) == 1.0
+
+
+def test_compare_part():
+    before = [1.0, 1.1, 0.9, 1.05, 0.95, 1.02, 0.98, 1.01]
+    assert compare_part("a", before, [x * 1.5 for x in before]).slower
+    # significant, but under the threshold
+    assert not compare_part("a", before, [x * 1.05 for x in before]).slower
+    # a single slow outlier isn't enough
+    assert not compare_part("a", before, before[:-1] + [10.0]).slower
+
+
+def test_compare_to_a_zero_baseline():
+    # e.g. cached parts, or a coarse timer
+    unchanged = compare_part("a", [0.0, 0.0, 0.0], [0.0, 0.0, 0.0])
+    assert unchanged.change == 0.0 and not unchanged.slower
+    assert "(+0%," in format_comparison(unchanged)
+    slower = compare_part("a", [0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+    assert math.isinf(slower.change)
+    assert "(from 0," in format_comparison(slower)
+
+
+def test_save_and_compare(tmp_path):
+    fname = str(tmp_path / "baseline.json")
+    results = [{"year": 2021, "day": 1, "parts": {"part_1": {"times": [1.0, 1.1, 0.9]}}}]
+    save_baseline(results, fname)
+    baseline = load_baseline(fname)
+    assert baseline == {"2021/1/part_1": [1.0, 1.1, 0.9]}
+
+    slower = [{"year": 2021, "day": 1, "parts": {"part_1": {"times": [3.0, 3.1, 2.9]}}}]
+    [comparison] = compare_to_baseline(slower, baseline)
+    assert comparison.key == "2021/1/part_1"
+    assert comparison.current_median == 3.0
@@ -0,0 +1,26 @@
+"""
+#
+# test_bench.py: Test timing each part of a day
+#
+"""
+
+from utils.bench import bench_day, percentile, summarize
+from aoc_2021.days import day05
+
+
+def test_percentile():
+    times = [float(t) for t in range(1, 21)]
+    assert percentile(times, 95) == 19.0
+    assert percentile(times, 50) == 10.0
+    assert percentile([3.0], 95) == 3.0
+    assert summarize([3.0, 1.0, 2.0])["median"] == 2.0
+
+
+def test_bench_day():
+    result = bench_day(2021, 5, day05.day_5, use_toy_data=True, reps=3, warmup=1)
+    assert list(result["parts"]) == ["part_1", "part_2"]
+    # day 5 has a parse() hook, so it's timed separately
+    assert result["parts"]["part_1"]["parse"] > 0
+    assert result["parts"]["part_1"]["answer"] == 5
+    assert result["parts"]["part_2"]["answer"] == 12
+    assert len(result["parts"]["part_2"]["times"]) == 3
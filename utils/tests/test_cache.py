@@ -0,0 +1,118 @@
+"""
+#
+# test_cache.py: Test the on-disk answer cache
+#
+"""
+import os
+import shutil
+import sys
+import time
+import types
+
+from utils.cache import AnswerCache
+from utils.loader import LazyDay, get_parts
+from utils import parsed
+from utils.parsed import hash_source, source_files
+from utils.registry import REGISTRY
+from aoc_2021.days import day01, day15
+
+
+def _parts():
+    return get_parts(2021, 1, day01.day_1)
+
+
+def test_cache_hit_and_miss(tmp_path):
+    cache = AnswerCache(str(tmp_path))
+    part_1, part_2 = _parts()
+    assert cache.solve(part_1, use_toy_data=True) == (7, False)
+    assert cache.solve(part_1, use_toy_data=True) == (7, True)
+    # a different part (or input) is a different key
+    assert cache.solve(part_2, use_toy_data=True) == (5, False)
+    assert cache.key(part_1, use_toy_data=True) != cache.key(part_2, use_toy_data=True)
+
+
+def test_key_changes_with_input(tmp_path, monkeypatch):
+    cache = AnswerCache(str(tmp_path))
+    part_1, _ = _parts()
+    key = cache.key(part_1, use_toy_data=True)
+    monkeypatch.setattr(day01, "toy_input", day01.toy_input + [300])
+    assert cache.key(part_1, use_toy_data=True) != key
+
+
+DAY_SOURCE = """
+from aoc_1999 import helpers
+from utils.registry import register
+
+toy_input = [1, 2]
+
+
+def part_1(numbers, verbose=False):
+    return helpers.total(numbers)
+
+
+@register(1999, 1)
+def day_1(use_toy_data=False, verbose=False):
+    return [part_1(toy_input)]
+"""
+
+
+def test_key_changes_with_the_modules_a_day_imports(tmp_path, monkeypatch):
+    # e.g. a fix to utils.search changes 2021 day 15's answers
+    names = {os.path.relpath(fname) for fname in source_files(day15)}
+    assert {"utils/search.py", "utils/parsed.py", "utils/registry.py"} <= names
+
+    package = tmp_path / "aoc_1999"
+    (package / "days").mkdir(parents=True)
+    (package / "__init__.py").touch()
+    (package / "days" / "__init__.py").touch()
+    (package / "days" / "day01.py").write_text(DAY_SOURCE)
+    (package / "helpers.py").write_text("def total(numbers):\n    return sum(numbers)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        cache = AnswerCache(str(tmp_path / "cache"))
+        part_1 = LazyDay("day01.py", "aoc_1999").parts[0]
+        key = cache.key(part_1, use_toy_data=True)
+        assert cache.key(part_1, use_toy_data=True) == key
+
+        (package / "helpers.py").write_text("def total(numbers):\n    return sum(numbers) + 1\n")
+        os.utime(package / "helpers.py", (2_000_000, 2_000_000))
+        assert cache.key(part_1, use_toy_data=True) != key
+    finally:
+        for name in ["aoc_1999", "aoc_1999.helpers", "aoc_1999.days", "aoc_1999.days.day01"]:
+            sys.modules.pop(name, None)
+        REGISTRY.pop((1999, 1), None)
+
+
+def test_day_15_key_changes_with_utils_search(tmp_path, monkeypatch):
+    # a copy of the project, so that we can change utils/search.py without touching ours
+    shutil.copytree("utils", tmp_path / "utils", ignore=shutil.ignore_patterns("__pycache__"))
+    (tmp_path / "aoc_2021" / "days").mkdir(parents=True)
+    shutil.copy(day15.__file__, tmp_path / "aoc_2021" / "days" / "day15.py")
+    monkeypatch.setattr(parsed, "PROJECT_DIR", str(tmp_path))
+    copy = types.ModuleType(day15.__name__)
+    copy.__file__ = str(tmp_path / "aoc_2021" / "days" / "day15.py")
+    copy.toy_input = day15.toy_input
+    part_1 = get_parts(2021, 15, day15.day_15)[0]
+    monkeypatch.setattr(part_1, "module", copy)
+
+    cache = AnswerCache(str(tmp_path / "cache"))
+    key = cache.key(part_1, use_toy_data=True)
+    with open(tmp_path / "utils" / "search.py", "a") as f:
+        f.write("\n# a fix\n")
+    os.utime(tmp_path / "utils" / "search.py", (2_000_000, 2_000_000))
+    assert hash_source(copy) != hash_source(day15)
+    assert cache.key(part_1, use_toy_data=True) != key
+
+
+def test_lru_eviction(tmp_path):
+    part_1, _ = _parts()
+    cache = AnswerCache(str(tmp_path), max_bytes=200)
+    for age, key in enumerate(["c", "b", "a"]):
+        cache.put(key, part_1, 7)
+        # mtimes are our LRU order: "a" is the oldest
+        then = time.time() - 100 - age
+        os.utime(cache.path(key), (then, then))
+    cache.get("a")  # ... until we use it, leaving "b" as the oldest
+    cache.put("d", part_1, 7)
+    remaining = sorted(fname[0] for fname in os.listdir(tmp_path))
+    assert remaining == ["a", "c", "d"]
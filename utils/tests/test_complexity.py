@@ -0,0 +1,83 @@
+"""
+#
+# test_complexity.py: Test fitting how parts scale
+#
+"""
+import sys
+import time
+
+import pytest
+
+from utils import generators
+from utils.complexity import fit_exponent, format_result, measure_days, measure_part
+from utils.loader import LazyDay, get_day_parts, get_lazy_year_modules
+
+# this module pretends to be a day (2021 day 99) whose part 1 never finishes
+# once its input has more than one line, and whose part 2 always fails
+input = []
+
+
+def part_1(data, verbose=False):
+    if len(data) > 1:
+        time.sleep(60)
+    return len(data)
+
+
+def part_2(data, verbose=False):
+    raise ValueError("oops")
+
+
+@pytest.fixture
+def day_99_parts(monkeypatch):
+    monkeypatch.setitem(
+        generators.GENERATORS, (2021, 99), lambda scale, seed: ["1"] * round(10 * scale)
+    )
+    return get_day_parts(sys.modules[__name__], 2021, 99)
+
+
+def test_fit_exponent():
+    sizes = [1, 2, 4, 8]
+    assert fit_exponent([(n, 3.0 * n) for n in sizes]) == pytest.approx(1.0)
+    assert fit_exponent([(n, 0.5 * n**2) for n in sizes]) == pytest.approx(2.0)
+    assert fit_exponent([(1, 1.0)]) is None
+
+
+def test_measure_part():
+    part_1, _ = get_lazy_year_modules()[2022][1].parts
+    result = measure_part(part_1, scale=0.05)
+    assert [size for size, _ in result["points"]] == pytest.approx([0.05, 0.1, 0.2, 0.4])
+    # summing calories is linear, give or take some noise
+    assert 0.5 < result["exponent"] < 1.5
+
+
+def test_a_size_that_takes_too_long_is_stopped(day_99_parts):
+    start = time.perf_counter()
+    result = measure_part(day_99_parts[0], scale=0.1, max_seconds=0.25)
+    assert time.perf_counter() - start < 10
+    assert [size for size, _ in result["points"]] == [0.1]
+    assert (result["timeout"], result["error"]) == (1.0, None)
+    assert ">  1.000s" in format_result(result)
+
+
+def test_a_part_that_fails_is_reported(day_99_parts):
+    result = measure_part(day_99_parts[1], scale=0.1)
+    assert result["points"] == []
+    assert result["error"] == "ERROR ValueError: oops"
+
+
+def test_a_day_that_does_not_import_is_reported(tmp_path, monkeypatch):
+    days_dir = tmp_path / "aoc_1999" / "days"
+    days_dir.mkdir(parents=True)
+    (tmp_path / "aoc_1999" / "__init__.py").touch()
+    (days_dir / "__init__.py").touch()
+    (days_dir / "day01.py").write_text("import no_such_module\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(generators.GENERATORS, (1999, 1), lambda scale, seed: ["1"])
+    try:
+        reports = list(measure_days([(1999, 1, LazyDay("day01.py", "aoc_1999"))]))
+    finally:
+        for name in ["aoc_1999", "aoc_1999.days", "aoc_1999.days.day01"]:
+            sys.modules.pop(name, None)
+    assert reports == [
+        (None, "1999  1: ERROR ModuleNotFoundError: No module named 'no_such_module'")
+    ]
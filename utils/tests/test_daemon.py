@@ -0,0 +1,189 @@
+"""
+#
+# test_daemon.py: Test the warm worker, and talking to it over a socket
+#
+"""
+import os
+import sys
+import threading
+
+import pytest
+
+from utils.daemon import Worker, ask, is_running, make_requests, make_server
+from utils.loader import LazyDay, get_int_args, get_opts
+from utils.registry import REGISTRY
+from utils.utils import get_input
+
+DAY_SOURCE = """
+from aoc_1999.days.common import FACTOR
+from utils.registry import register
+from utils.utils import LazyInput
+
+input = LazyInput(1999, 1)
+toy_input = ["1", "2"]
+
+
+def parse(input):
+    return [int(line) for line in input]
+
+
+def part_1(numbers, verbose=False):
+    return sum(numbers) * {factor} * FACTOR
+
+
+@register(1999, 1)
+def day_1(use_toy_data=False, verbose=False):
+    return [part_1(parse(toy_input if use_toy_data else input))]
+"""
+
+
+def write(fname, text, mtime):
+    with open(fname, "w") as f:
+        f.write(text)
+    os.utime(fname, (mtime, mtime))
+
+
+def write_day(fname, factor, mtime):
+    write(fname, DAY_SOURCE.format(factor=factor), mtime)
+
+
+@pytest.fixture
+def day_fname(tmp_path, monkeypatch):
+    """
+    A made-up aoc_1999 package, so that we can change a day's source (or its
+    input, or a module it imports) under the worker
+    """
+    days_dir = tmp_path / "aoc_1999" / "days"
+    days_dir.mkdir(parents=True)
+    (tmp_path / "aoc_1999" / "input").mkdir()
+    (tmp_path / "aoc_1999" / "__init__.py").touch()
+    (days_dir / "__init__.py").touch()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    write(days_dir / "common.py", "FACTOR = 1\n", 1_000_000)
+    write(tmp_path / "aoc_1999" / "input" / "01.txt", "1\n2\n3\n", 1_000_000)
+    write_day(days_dir / "day01.py", 1, 1_000_000)
+    yield days_dir / "day01.py"
+    for name in ["aoc_1999", "aoc_1999.days", "aoc_1999.days.day01", "aoc_1999.days.common"]:
+        sys.modules.pop(name, None)
+    REGISTRY.pop((1999, 1), None)
+    get_input.cache_clear()
+
+
+@pytest.fixture
+def worker(day_fname):
+    return Worker({1999: {1: LazyDay("day01.py", "aoc_1999")}})
+
+
+@pytest.fixture
+def socket_path(tmp_path, worker):
+    socket_path = str(tmp_path / "aoc.sock")
+    server = make_server(socket_path, worker)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+
+
+def test_worker_solves_parts(worker):
+    assert worker.handle({"year": 1999, "day": 1})["answers"] == [6]
+    assert worker.handle({"year": 1999, "day": 1, "part": 1, "toy": True})["answers"] == [3]
+
+
+def test_worker_reloads_changed_days(worker, day_fname):
+    first = worker.handle({"year": 1999, "day": 1})
+    assert (first["answers"], first["reloaded"]) == ([6], False)
+
+    write_day(day_fname, 10, 2_000_000)
+    second = worker.handle({"year": 1999, "day": 1})
+    assert (second["answers"], second["reloaded"]) == ([60], True)
+    assert REGISTRY[(1999, 1)].function() == [60]
+
+    third = worker.handle({"year": 1999, "day": 1})
+    assert (third["answers"], third["reloaded"]) == ([60], False)
+
+
+def test_worker_rereads_changed_inputs(worker, day_fname):
+    assert worker.handle({"year": 1999, "day": 1})["answers"] == [6]
+    write("aoc_1999/input/01.txt", "1\n2\n3\n4\n", 2_000_000)
+    assert worker.handle({"year": 1999, "day": 1})["answers"] == [10]
+
+
+def test_worker_reloads_what_a_day_imports(worker, day_fname):
+    assert worker.handle({"year": 1999, "day": 1})["answers"] == [6]
+    write("aoc_1999/days/common.py", "FACTOR = 10\n", 2_000_000)
+    response = worker.handle({"year": 1999, "day": 1})
+    assert (response["answers"], response["reloaded"]) == ([60], True)
+
+
+def test_worker_retries_failed_reloads(worker, day_fname):
+    worker.handle({"year": 1999, "day": 1})
+    write("aoc_1999/days/common.py", "FACTOR = (\n", 2_000_000)
+    response = worker.handle({"year": 1999, "day": 1})
+    assert response["error"].startswith(
+        "ERROR ImportError: couldn't reload aoc_1999.days.common: SyntaxError"
+    )
+    write("aoc_1999/days/common.py", "FACTOR = 2\n", 3_000_000)
+    assert worker.handle({"year": 1999, "day": 1})["answers"] == [12]
+
+
+def test_worker_reports_errors(worker):
+    response = worker.handle({"year": 1999, "day": 2})
+    assert response["answers"] is None
+    assert response["error"] == "ERROR KeyError: 2"
+
+
+@pytest.mark.parametrize("part", [0, -1, 3, "1"])
+def test_worker_rejects_parts_that_the_day_does_not_have(worker, part):
+    response = worker.handle({"year": 1999, "day": 1, "part": part})
+    assert response["answers"] is None
+    assert response["error"] == f"ERROR ValueError: 1999 day 1 has no part {part!r}"
+
+
+def test_make_requests():
+    argv = ["2021", "15", "--remote", "--part", "2", "--toy"]
+    assert get_int_args(argv) == [2021, 15]
+    options = get_opts(argv)
+    assert make_requests([(2021, 15)], options["--toy"], int(options["--part"])) == [
+        {"year": 2021, "day": 15, "toy": True, "part": 2}
+    ]
+    assert make_requests([(2021, 15), (2021, 16)]) == [
+        {"year": 2021, "day": 15, "toy": False},
+        {"year": 2021, "day": 16, "toy": False},
+    ]
+
+
+def test_ask(socket_path):
+    responses = ask(
+        [
+            {"year": 1999, "day": 1},
+            {"year": 1999, "day": 1, "part": 1, "toy": True},
+            {"year": 2000, "day": 1},
+        ],
+        socket_path,
+    )
+    assert [response["answers"] for response in responses] == [[6], [3], None]
+    assert responses[2]["error"] == "ERROR KeyError: 2000"
+
+
+def test_requests_must_be_objects(socket_path):
+    [response] = ask([[1]], socket_path)
+    assert response["error"] == "ERROR TypeError: a request is a JSON object, not list"
+    # ... and the connection is still there for the next one
+    responses = ask([[1], {"year": 1999, "day": 1}], socket_path)
+    assert responses[1]["answers"] == [6]
+
+
+def test_only_one_daemon_per_socket(socket_path, worker):
+    assert is_running(socket_path)
+    with pytest.raises(RuntimeError):
+        make_server(socket_path, worker)
+
+
+def test_stale_socket_is_replaced(tmp_path, worker):
+    socket_path = str(tmp_path / "stale.sock")
+    make_server(socket_path, worker).server_close()  # ... without removing its socket
+    assert os.path.exists(socket_path) and not is_running(socket_path)
+    with make_server(socket_path, worker):
+        assert is_running(socket_path)
@@ -0,0 +1,51 @@
+"""
+#
+# test_generators.py: Test that generated inputs are valid for their days
+#
+"""
+import pytest
+
+from utils.generators import GENERATORS, as_input, generate
+from utils.loader import get_lazy_year_modules
+from utils.parsed import freeze
+
+ADVENTS = get_lazy_year_modules()
+
+
+def test_every_day_has_a_generator():
+    days = {(year, day) for year, days in ADVENTS.items() for day in days}
+    assert days == set(GENERATORS)
+
+
+@pytest.mark.parametrize("year,day", sorted(GENERATORS))
+def test_generated_input(year, day):
+    lines = generate(year, day, scale=0.05, seed=1)
+    assert lines == generate(year, day, scale=0.05, seed=1)
+    assert lines != generate(year, day, scale=0.05, seed=2)
+    assert len("".join(generate(year, day, scale=1, seed=1))) > len("".join(lines))
+
+    lazy_day = ADVENTS[year][day]
+    data = as_input(lazy_day.module, lines)
+    for part in lazy_day.parts:
+        parsed = data if part.parse is None else freeze(part.parse(data))
+        assert part.solve(parsed) is not None
+
+
+def test_2021_12_caves_grow_with_log_scale():
+    # day 12's paths grow exponentially with its caves, so they mustn't grow linearly
+    def n_small_caves(scale):
+        lines = generate(2021, 12, scale=scale, seed=0)
+        caves = {cave for line in lines for cave in line.split("-")}
+        return sum(1 for cave in caves if cave.islower() and cave not in ("start", "end"))
+
+    counts = [n_small_caves(scale) for scale in [0.25, 0.5, 1, 2, 4, 8]]
+    assert counts == sorted(set(counts))  # each doubling adds some
+    assert counts[-1] <= 15
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_2021_02_stays_under_water(seed):
+    # an aim that wanders below zero makes part 2's answer 0 (or negative)
+    lazy_day = ADVENTS[2021][2]
+    data = as_input(lazy_day.module, generate(2021, 2, scale=1, seed=seed))
+    assert all(part.solve(data) > 0 for part in lazy_day.parts)
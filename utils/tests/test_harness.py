@@ -0,0 +1,52 @@
+"""
+#
+# test_harness.py: Test running parts with a time budget
+#
+"""
+import sys
+import time
+
+from utils.harness import ERROR, OK, TIMEOUT, run_part_with_budget
+from utils.loader import get_day_parts
+
+# this module pretends to be a day, with some badly behaved parts
+toy_input = ["1", "2", "3"]
+
+
+def parse(input):
+    return [int(line) for line in input]
+
+
+def part_1(data, verbose=False):
+    return sum(data)
+
+
+def part_2(data, verbose=False):
+    time.sleep(60)
+
+
+def part_3(data, verbose=False):
+    raise ValueError("oops")
+
+
+def _parts():
+    return get_day_parts(sys.modules[__name__], 2021, 99)
+
+
+def test_ok():
+    outcome = run_part_with_budget(_parts()[0], use_toy_data=True, budget=10)
+    assert outcome.status == OK
+    assert outcome.answer == 6
+
+
+def test_timeout():
+    start = time.perf_counter()
+    outcome = run_part_with_budget(_parts()[1], use_toy_data=True, budget=0.5)
+    assert outcome.status == TIMEOUT
+    assert time.perf_counter() - start < 5
+
+
+def test_error():
+    outcome = run_part_with_budget(_parts()[2], use_toy_data=True, budget=10)
+    assert outcome.status == ERROR
+    assert outcome.error.startswith("ERROR ValueError: oops")
@@ -0,0 +1,36 @@
+"""
+#
+# test_import_profile.py: Test the import time report
+#
+"""
+from utils.import_profile import ImportTime, format_report, parse_importtime, profile_imports
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       156 |        156 |   colors.palette
+import time:       341 |        497 | colors
+import time:      1000 |       1000 | json
+"""
+
+
+def test_parse_importtime():
+    assert parse_importtime(IMPORTTIME_OUTPUT) == [
+        ImportTime("colors.palette", 156, 156, 1),
+        ImportTime("colors", 341, 497, 0),
+        ImportTime("json", 1000, 1000, 0),
+    ]
+
+
+def test_format_report():
+    lines = format_report(parse_importtime(IMPORTTIME_OUTPUT), top=2)
+    assert lines[1].split() == ["1.0ms", "1.0ms", "json"]
+    assert lines[2].split() == ["0.5ms", "0.3ms", "colors"]
+    assert lines[-1] == "       1.5ms total, 3 modules"
+
+
+def test_day_modules_defer_heavy_imports():
+    names = {t.name for t in profile_imports(["aoc_2021.days.day09", "aoc_2021.days.day13"])}
+    assert "aoc_2021.days.day13" in names
+    assert "numpy" not in names
+    assert "colors" not in names
+    assert "pytest" not in names
@@ -4,10 +4,40 @@
 #
 """
 
-from utils.loader import get_all_year_modules
+from utils.loader import get_all_year_modules, get_lazy_year_modules, get_parts, LazyDay
 from aoc_2021.days.day01 import day_1
 
 
 def test_get_all_year_modules():
     all_modules = get_all_year_modules()
-    assert all_modules[2021][0] == day_1
+    assert all_modules[2021][1] == day_1
+
+
+def test_get_lazy_year_modules():
+    lazy_modules = get_lazy_year_modules()
+    assert lazy_modules[2021][1].day == 1
+    assert lazy_modules[2021][1].function == day_1
+
+
+def test_lazy_day_does_not_import_until_called():
+    # there is no day 99, but we shouldn't find out until we try to use it
+    lazy_day = LazyDay("day99.py", "aoc_2021")
+    assert lazy_day.day == 99
+
+
+def test_parts():
+    lazy_day = get_lazy_year_modules()[2021][5]
+    part_1, part_2 = lazy_day.parts
+    assert (part_1.year, part_1.day, part_1.name) == (2021, 5, "part_1")
+    # day 5 has a parse() hook, which the part is handed the results of
+    assert part_1.parse_input(use_toy_data=True)[0] == ((0, 9), (5, 9))
+    assert [part_1(use_toy_data=True), part_2(use_toy_data=True)] == [5, 12]
+
+
+def test_parts_with_their_own_toy_input():
+    from aoc_2023.days import day01
+
+    part_1, part_2 = get_parts(2023, 1, day01.day_1)
+    assert part_1.get_input(use_toy_data=True) is day01.toy_input
+    assert part_2.get_input(use_toy_data=True) is day01.toy_input_2
+    assert part_2(use_toy_data=True) == 281
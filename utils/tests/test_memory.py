@@ -0,0 +1,34 @@
+"""
+#
+# test_memory.py: Test measuring memory per part
+#
+"""
+
+from utils.memory import format_bytes, measure_day, measure_part
+
+
+def hoard(n):
+    # hold on to n small lists at once, then let them go
+    lists = [[i] for i in range(n)]
+    return len(lists)
+
+
+def test_measure_part():
+    small = measure_part(hoard, (1_000,), {})
+    big = measure_part(hoard, (100_000,), {})
+    assert small["answer"] == 1_000
+    assert big["peak"] > 10 * small["peak"]
+    assert big["top"][0]["site"].endswith("test_memory.py:12")
+
+
+def test_measure_day():
+    from aoc_2021.days.day12 import day_12
+
+    result = measure_day(2021, 12, day_12, use_toy_data=True)
+    assert result["parts"]["part_2"]["answer"] == 36
+    assert result["parts"]["part_2"]["peak"] > 0
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "  512.0B"
+    assert format_bytes(3 * 1024 * 1024) == "    3.0MiB"
@@ -0,0 +1,84 @@
+"""
+#
+# test_parsed.py: Test parsing each input once
+#
+"""
+import os
+
+from utils.loader import get_parts
+from utils.parsed import ParseCache, freeze, is_frozen
+from utils.utils import ByteGrid
+from aoc_2021.days import day05
+from aoc_2022.days import day07
+
+calls = []
+
+
+def parse(lines):
+    calls.append(lines)
+    return [[int(item) for item in line.split()] for line in lines]
+
+
+def test_freeze():
+    assert freeze([[1, 2], {3}, (4, [5])]) == ((1, 2), frozenset({3}), (4, (5,)))
+    # anything else is left alone
+    mapping = {"a": [1]}
+    assert freeze(mapping) is mapping
+
+
+def test_is_frozen():
+    assert is_frozen(freeze([[1, "a"], {(2, 3)}, None]))
+    assert is_frozen(freeze(ByteGrid.from_digit_strings(["12"])))
+    assert not is_frozen(ByteGrid.from_digit_strings(["12"]))
+    assert not is_frozen(freeze([1, {"a": 1}]))
+
+
+def test_parse_once():
+    calls.clear()
+    parse_cache = ParseCache()
+    first, hit = parse_cache.parse(parse, ["1 2", "3 4"])
+    assert (first, hit) == (((1, 2), (3, 4)), False)
+    second, hit = parse_cache.parse(parse, ["1 2", "3 4"])
+    assert second is first and hit
+    assert len(calls) == 1
+    # different input, parsed again
+    assert parse_cache.parse(parse, ["5"])[0] == ((5,),)
+    assert len(calls) == 2
+
+
+def test_persisted(tmp_path):
+    calls.clear()
+    cache_dir = str(tmp_path / "parsed")
+    ParseCache(cache_dir).parse(parse, ["1 2"])
+    assert len(os.listdir(cache_dir)) == 1
+    # e.g. the next run: loaded from disk instead of parsed
+    parsed, hit = ParseCache(cache_dir).parse(parse, ["1 2"])
+    assert (parsed, hit) == (((1, 2),), True)
+    assert len(calls) == 1
+
+
+def test_unpicklable_results_are_not_persisted(tmp_path):
+    cache_dir = str(tmp_path / "parsed")
+    parsed, hit = ParseCache(cache_dir).parse(lambda lines: lambda: lines, ["1"])
+    assert parsed() == ["1"] and not hit
+    assert not os.path.exists(cache_dir)
+
+
+def test_parts_share_their_parsed_input():
+    part_1, part_2 = get_parts(2021, 5, day05.day_5)
+    parse_cache = ParseCache()
+    data = part_1.parse_input(use_toy_data=True, parse_cache=parse_cache)
+    assert part_2.parse_input(use_toy_data=True, parse_cache=parse_cache) is data
+    assert isinstance(data, tuple)
+    assert [part_1.solve(data), part_2.solve(data)] == [5, 12]
+
+
+def test_parts_get_their_own_copy_of_what_cant_be_frozen():
+    part_1, part_2 = get_parts(2022, 7, day07.day_7)
+    parse_cache = ParseCache()
+    root = part_1.parse_input(use_toy_data=True, parse_cache=parse_cache)
+    assert part_1.solve(root) == 95437
+    # (part_1 cached its directories' sizes in the tree it was given)
+    other_root = part_2.parse_input(use_toy_data=True, parse_cache=parse_cache)
+    assert other_root is not root and other_root._size is None
+    assert part_2.solve(other_root) == 24933642
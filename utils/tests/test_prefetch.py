@@ -0,0 +1,107 @@
+"""
+#
+# test_prefetch.py: Test fetching inputs concurrently, from a local stand-in server
+#
+"""
+import threading
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.prefetch import input_url, missing_inputs, prefetch_inputs
+from utils.utils import input_path, save_input
+
+TOKEN = "not-a-real-token"
+
+
+class FakeAdventOfCode(BaseHTTPRequestHandler):
+    """
+    /2021/day/1/input:  "1\n2\n3\n"
+    /2021/day/2/input:  503 the first time, then "forward 5\n"
+    /2021/day/3/input:  bytes that aren't UTF-8
+    /2021/day/25/input: 404, since it isn't out yet
+    """
+
+    requests: Counter = Counter()
+
+    def do_GET(self):
+        self.requests[self.path] += 1
+        if self.headers["Cookie"] != f"session={TOKEN}":
+            self.send_error(400)
+        elif self.path == "/2021/day/1/input":
+            self.reply(b"1\n2\n3\n")
+        elif self.path == "/2021/day/2/input" and self.requests[self.path] > 1:
+            self.reply(b"forward 5\n")
+        elif self.path == "/2021/day/2/input":
+            self.send_error(503)
+        elif self.path == "/2021/day/3/input":
+            self.reply(b"\xff\xfe\n")
+        else:
+            self.send_error(404)
+
+    def reply(self, body: bytes):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    FakeAdventOfCode.requests = Counter()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAdventOfCode)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_input_url():
+    assert input_url("https://adventofcode.com/", 2021, 1) == (
+        "https://adventofcode.com/2021/day/1/input"
+    )
+
+
+def test_prefetch(base_url):
+    results = prefetch_inputs(
+        [(2021, 1), (2021, 2), (2021, 25)], base_url=base_url, token=TOKEN, backoff=0.01
+    )
+    assert [(r.year, r.day, r.path, r.attempts) for r in results] == [
+        (2021, 1, "aoc_2021/input/01.txt", 1),
+        (2021, 2, "aoc_2021/input/02.txt", 2),
+        (2021, 25, None, 1),
+    ]
+    assert "404" in results[2].error
+    with open(input_path(2021, 2)) as f:
+        assert f.read() == "forward 5\n"
+
+
+def test_prefetch_only_fetches_missing_inputs(base_url):
+    save_input(2021, 1, "1")
+    assert missing_inputs([(2021, 1), (2021, 2)]) == [(2021, 2)]
+    assert prefetch_inputs([(2021, 1)], base_url=base_url, token=TOKEN) == []
+    assert FakeAdventOfCode.requests == {}
+
+
+def test_prefetch_gives_up_eventually(base_url):
+    # day 2 keeps failing if we only try once
+    [result] = prefetch_inputs([(2021, 2)], base_url=base_url, token=TOKEN, retries=0)
+    assert result.path is None and result.attempts == 1
+    assert "503" in result.error
+
+
+def test_prefetch_reports_other_errors(base_url):
+    # one day failing in some other way doesn't lose the rest
+    results = prefetch_inputs([(2021, 1), (2021, 3)], base_url=base_url, token=TOKEN)
+    assert [(r.day, r.path, r.attempts) for r in results] == [
+        (1, "aoc_2021/input/01.txt", 1),
+        (3, None, 1),
+    ]
+    assert results[1].error.startswith("ERROR UnicodeDecodeError")
@@ -0,0 +1,35 @@
+"""
+#
+# test_profiling.py: Test profiling a day
+#
+"""
+import pstats
+
+import pytest
+
+from utils.profiling import StackSampler, profile_day
+from aoc_2021.days.day05 import day_5
+
+
+def busy_day(use_toy_data=False, verbose=False):
+    total = 0
+    for i in range(2_000_000):
+        total += i % 7
+    return [total, None]
+
+
+def test_profile_day(tmp_path):
+    result = profile_day(2021, 5, day_5, use_toy_data=True, profile_dir=str(tmp_path))
+    assert result["answers"] == [5, 12]
+    stats = pstats.Stats(str(tmp_path / "2021_05.pstats"))
+    assert any(func[2] == "part_1" for func in stats.stats)
+
+
+@pytest.mark.skipif(not StackSampler.is_supported(), reason="no SIGPROF / setitimer here")
+def test_stack_sampler(tmp_path):
+    profile_day(2021, 99, busy_day, profile_dir=str(tmp_path), interval=0.0005)
+    collapsed = (tmp_path / "2021_99.collapsed").read_text().splitlines()
+    assert collapsed
+    stack, count = collapsed[0].rsplit(" ", 1)
+    assert stack.startswith("busy_day (test_profiling.py:")
+    assert int(count) > 0
@@ -0,0 +1,59 @@
+"""
+#
+# test_registry.py: Test that days register themselves
+#
+"""
+import pytest
+
+from utils.loader import get_advents_to_run, get_lazy_year_modules
+from utils.registry import REGISTRY, SLOW_COST, get_registered_day, read_hints, register
+
+
+def test_days_register_themselves():
+    from aoc_2021.days import day12, day15
+
+    assert get_registered_day(2021, 15).function is day15.day_15
+    assert get_registered_day(2021, 15).module is day15
+    assert get_registered_day(2021, 12).slow
+    assert get_registered_day(2021, 12).expected_cost == SLOW_COST
+
+
+def test_registering_again_replaces_the_old_entry():
+    # which is what happens when a day's module is reloaded
+    def day_1(use_toy_data=False, verbose=False):
+        return [1, 1]
+
+    def day_1_again(use_toy_data=False, verbose=False):
+        return [2, 2]
+
+    try:
+        register(1999, 1)(day_1)
+        register(1999, 1, cost=2.5)(day_1_again)
+        assert get_registered_day(1999, 1).function is day_1_again
+        assert get_registered_day(1999, 1).expected_cost == 2.5
+    finally:
+        REGISTRY.pop((1999, 1), None)
+
+
+def test_read_hints(tmp_path):
+    assert read_hints("aoc_2021/days/day12.py") == (True, None)
+    assert read_hints("aoc_2021/days/day01.py") == (False, None)
+    path = tmp_path / "day01.py"
+    path.write_text("@register(1999, 1, False, 2.5)\ndef day_1(): ...\n")
+    assert read_hints(str(path)) == (False, 2.5)
+    path.write_text("@register(1999, 1, cost=COST)\ndef day_1(): ...\n")
+    assert read_hints(str(path)) == (False, None)
+
+
+def test_unregistered_day():
+    with pytest.raises(LookupError, match="1999 day 25"):
+        get_registered_day(1999, 25)
+
+
+def test_advents_are_keyed_by_day():
+    advents = get_lazy_year_modules()
+    to_run = get_advents_to_run(advents, ["2021", "15", "3"])
+    assert [(year, day, lazy_day.day) for year, day, lazy_day in to_run] == [
+        (2021, 15, 15),
+        (2021, 3, 3),
+    ]
@@ -0,0 +1,140 @@
+"""
+#
+# test_runner.py: Test running advents in parallel
+#
+"""
+import json
+import sys
+
+from utils.cache import AnswerCache
+from utils.loader import LazyDay, get_int_args, get_opts, get_parts
+from utils.parsed import hash_lines
+from utils.runner import (
+    expected_cost,
+    format_record,
+    run_advent_records,
+    run_advents_in_parallel,
+    solve_part,
+)
+from aoc_2021.days.day01 import day_1
+from aoc_2021.days.day02 import day_2
+
+
+def broken_day(use_toy_data=False, verbose=False):
+    raise ValueError("oops")
+
+
+def test_jobs_option_takes_a_value():
+    assert get_opts(["2021", "--jobs", "4", "--toy"]) == {"--jobs": "4", "--toy": True}
+    assert get_opts(["--jobs=4"])["--jobs"] == "4"
+    assert get_int_args(["2021", "--jobs", "4", "3"]) == [2021, 3]
+
+
+def test_run_advents_in_parallel():
+    advents_to_run = [(2021, 1, day_1), (2021, 2, broken_day), (2021, 3, day_2)]
+    results = list(run_advents_in_parallel(advents_to_run, use_toy_data=True, jobs=2))
+    assert results == [
+        (2021, 1, [7, 5], None),
+        (2021, 2, None, "ERROR ValueError: oops"),
+        (2021, 3, [150, 900], None),
+    ]
+
+
+class CostlyDay:
+    """Stands in for a LazyDay with a @register(..., cost=...) hint"""
+
+    def __init__(self, day_function, expected_cost):
+        self.day_function = day_function
+        self.expected_cost = expected_cost
+
+    def __call__(self, *args, **kwargs):
+        return self.day_function(*args, **kwargs)
+
+
+def test_slow_days_start_first_but_results_stay_in_order():
+    advents_to_run = [(2021, 1, day_1), (2021, 2, CostlyDay(day_2, 10.0))]
+    assert [expected_cost(day_function) for _, _, day_function in advents_to_run] == [0.0, 10.0]
+    results = list(run_advents_in_parallel(advents_to_run, use_toy_data=True, jobs=1))
+    assert results == [(2021, 1, [7, 5], None), (2021, 2, [150, 900], None)]
+
+
+BROKEN_DAY_SOURCE = """
+import no_such_module
+from utils.registry import register
+
+
+@register(1999, 1, cost=5.0)
+def day_1(use_toy_data=False, verbose=False):
+    return [1, 2]
+"""
+
+
+def test_a_day_that_does_not_import_does_not_stop_the_others(tmp_path, monkeypatch):
+    days_dir = tmp_path / "aoc_1999" / "days"
+    days_dir.mkdir(parents=True)
+    (tmp_path / "aoc_1999" / "__init__.py").touch()
+    (days_dir / "__init__.py").touch()
+    (days_dir / "day01.py").write_text(BROKEN_DAY_SOURCE)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    broken = LazyDay("day01.py", "aoc_1999")
+    try:
+        # scheduling it only reads its source
+        assert broken.expected_cost == 5.0
+        assert "aoc_1999.days.day01" not in sys.modules
+        advents_to_run = [(1999, 1, broken), (2021, 1, day_1)]
+        results = list(run_advents_in_parallel(advents_to_run, use_toy_data=True, jobs=2))
+        assert results == [
+            (1999, 1, None, "ERROR ModuleNotFoundError: No module named 'no_such_module'"),
+            (2021, 1, [7, 5], None),
+        ]
+    finally:
+        for name in ["aoc_1999", "aoc_1999.days", "aoc_1999.days.day01"]:
+            sys.modules.pop(name, None)
+
+
+def test_solve_part(tmp_path):
+    part_1, part_2 = get_parts(2021, 1, day_1)
+    record = solve_part(part_2, use_toy_data=True)
+    assert (record.year, record.day, record.part, record.answer) == (2021, 1, 2, 5)
+    assert record.error is None and record.cache_hit is None
+    assert record.wall >= 0 and record.cpu >= 0 and record.peak_rss_growth >= 0
+    assert record.input_hash == hash_lines(part_2.get_input(use_toy_data=True))
+
+    cache = AnswerCache(str(tmp_path))
+    assert solve_part(part_1, True, cache=cache).cache_hit is False
+    assert solve_part(part_1, True, cache=cache).cache_hit is True
+    assert solve_part(part_1, True, verbose=True, cache=cache).cache_hit is None
+
+
+def test_format_record():
+    part_1, _ = get_parts(2021, 1, day_1)
+    record = json.loads(format_record(solve_part(part_1, use_toy_data=True)))
+    assert list(record) == [
+        "year",
+        "day",
+        "part",
+        "answer",
+        "error",
+        "wall",
+        "cpu",
+        "peak_rss_growth",
+        "cache_hit",
+        "input_hash",
+    ]
+    assert record["answer"] == 7
+
+
+def test_run_advent_records_in_parallel():
+    advents_to_run = [(2021, 1, day_1), (2021, 2, day_2)]
+    results = list(
+        run_advents_in_parallel(advents_to_run, use_toy_data=True, jobs=2, run=run_advent_records)
+    )
+    assert [(year, day, error) for year, day, _, error in results] == [
+        (2021, 1, None),
+        (2021, 2, None),
+    ]
+    assert [[record.answer for record in records] for _, _, records, _ in results] == [
+        [7, 5],
+        [150, 900],
+    ]
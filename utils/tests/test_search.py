@@ -0,0 +1,109 @@
+"""
+#
+# test_search.py: Test cheapest paths, against a brute force search
+#
+"""
+import itertools
+import random
+
+from utils.search import shortest_grid_path, shortest_path
+from utils.utils import ByteGrid, TiledGrid, neighbor_table
+
+# 2021 day 15's example
+RISKS = [
+    "1163751742",
+    "1381373672",
+    "2136511328",
+    "3694931569",
+    "7463417111",
+    "1319128137",
+    "1359912421",
+    "3125421639",
+    "1293138521",
+    "2311944581",
+]
+
+
+def flat(lines):
+    return [int(risk) for line in lines for risk in line]
+
+
+def grid_search(risks, width, **kwargs):
+    table = neighbor_table(width, len(risks) // width, include_diagonals=False)
+    return shortest_path(
+        0, len(risks) - 1, len(risks), table.__getitem__, risks.__getitem__, **kwargs
+    )
+
+
+def brute_force(risks, width):
+    """Bellman-Ford-ish: relax every cell until nothing changes"""
+    height = len(risks) // width
+    table = neighbor_table(width, height, include_diagonals=False)
+    dist = [0] + [float("inf")] * (len(risks) - 1)
+    changed = True
+    while changed:
+        changed = False
+        for node, neighbor in itertools.product(range(len(risks)), repeat=2):
+            if neighbor in table[node] and dist[node] + risks[neighbor] < dist[neighbor]:
+                dist[neighbor] = dist[node] + risks[neighbor]
+                changed = True
+    return dist[-1]
+
+
+def test_day_15_example():
+    result = grid_search(flat(RISKS), 10)
+    assert result.cost == 40
+    assert result.path is None
+
+
+def test_path():
+    risks = flat(RISKS)
+    result = grid_search(risks, 10, with_path=True)
+    assert result.path[0] == 0 and result.path[-1] == len(risks) - 1
+    # each step is to a neighbor, and the steps add up to the cost
+    table = neighbor_table(10, 10, include_diagonals=False)
+    assert all(b in table[a] for a, b in zip(result.path, result.path[1:]))
+    assert sum(risks[node] for node in result.path[1:]) == result.cost
+
+
+def test_heuristic_gives_the_same_cost():
+    def manhattan(node):
+        row, col = divmod(node, 10)
+        return (9 - row) + (9 - col)
+
+    assert grid_search(flat(RISKS), 10, heuristic=manhattan).cost == 40
+
+
+def test_against_brute_force():
+    rng = random.Random(15)
+    for width, height in [(1, 1), (1, 5), (4, 3), (6, 6)]:
+        risks = [rng.randint(1, 9) for _ in range(width * height)]
+        expected = brute_force(risks, width)
+        # without a path, shortest_path() takes a quicker loop: they should agree
+        assert grid_search(risks, width).cost == expected
+        assert grid_search(risks, width, with_path=True).cost == expected
+
+
+def test_unreachable():
+    # 0 -> 1 -> 2, and 3 on its own
+    edges = {0: [1], 1: [2], 2: [], 3: []}
+    result = shortest_path(0, 3, 4, edges.__getitem__, lambda node: 1)
+    assert (result.cost, result.path, result.visited) == (None, None, 3)
+    assert shortest_path(0, 2, 4, edges.__getitem__, lambda node: 1).cost == 2
+
+
+def test_shortest_grid_path():
+    grid = ByteGrid.from_digit_strings(RISKS)
+    assert shortest_grid_path(grid).cost == 40
+    assert shortest_grid_path(grid, goal=grid.index(0, 2)).cost == 1 + 6
+    assert shortest_grid_path(TiledGrid(grid, 5)).cost == 315
+
+
+def test_shortest_grid_path_matches_shortest_path():
+    rng = random.Random(25)
+    grid = ByteGrid(7, 5, bytearray(rng.randint(1, 9) for _ in range(35)))
+    tiled = TiledGrid(grid, 3)
+    expected = grid_search([tiled[index] for index in range(len(tiled))], tiled.width)
+    result = shortest_grid_path(tiled, with_path=True)
+    assert result.cost == expected.cost
+    assert sum(tiled[node] for node in result.path[1:]) == result.cost
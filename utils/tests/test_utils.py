@@ -0,0 +1,249 @@
+"""
+#
+# test_utils.py: Test input loading helpers, and grids
+#
+"""
+import sys
+
+import pytest
+
+from utils import utils
+from utils.parsed import freeze
+from utils.utils import (
+    ByteGrid,
+    InputUnavailableError,
+    TiledGrid,
+    LazyInput,
+    digit_grid,
+    get_input,
+    get_line_items,
+    iter_input_lines,
+    lazy_import,
+    lower_than_neighbors,
+    mapped_input,
+    neighbor_table,
+    neighbors,
+    orthogonal_neighbors,
+    shifted,
+    tile_grid,
+    two_d_array_from_digit_strings,
+)
+
+
+@pytest.fixture
+def input_dir(tmp_path, monkeypatch):
+    """Run in an empty tree, with a fresh get_input cache"""
+    monkeypatch.chdir(tmp_path)
+    get_input.cache_clear()
+    yield tmp_path
+    get_input.cache_clear()
+
+
+def test_get_input_reads_cached_file(input_dir):
+    (input_dir / "aoc_2021" / "input").mkdir(parents=True)
+    (input_dir / "aoc_2021" / "input" / "01.txt").write_text("199\n  200  \n\n208\n")
+    # don't strip leading whitespace (2022 day 5)
+    assert get_input(2021, 1) == ["199", "  200", "", "208"]
+
+
+def test_get_input_fetches_once(input_dir, monkeypatch):
+    fetches = []
+
+    def fake_fetch(year, day):
+        fetches.append((year, day))
+        return "1\n2\n3"
+
+    monkeypatch.setattr(utils, "fetch_input", fake_fetch)
+    assert get_input(2022, 6) == ["1", "2", "3"]
+    get_input.cache_clear()
+    # second read comes from aoc_2022/input/06.txt
+    assert get_input(2022, 6) == ["1", "2", "3"]
+    assert fetches == [(2022, 6)]
+    assert (input_dir / "aoc_2022" / "input" / "06.txt").read_text() == "1\n2\n3\n"
+
+
+def test_offline_fails_fast(input_dir, monkeypatch):
+    monkeypatch.setenv("AOC_OFFLINE", "1")
+    with pytest.raises(InputUnavailableError):
+        get_input(2024, 1)
+
+
+def test_lazy_input(input_dir, monkeypatch):
+    monkeypatch.setenv("AOC_OFFLINE", "1")
+    # creating it doesn't read anything
+    lazy = LazyInput(2021, 1, transform=int)
+    (input_dir / "aoc_2021" / "input").mkdir(parents=True)
+    (input_dir / "aoc_2021" / "input" / "01.txt").write_text("199\n200\n208\n")
+    assert len(lazy) == 3
+    assert lazy[1:] == [200, 208]
+    assert list(lazy) == [199, 200, 208]
+
+
+def test_lazy_import(tmp_path, monkeypatch):
+    # a module that counts how many times it has really been loaded
+    (tmp_path / "lazy_probe.py").write_text("import sys\nsys.lazy_probe_loads += 1\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "lazy_probe_loads", 0, raising=False)
+    monkeypatch.delitem(sys.modules, "lazy_probe", raising=False)
+
+    lazy_probe = lazy_import("lazy_probe")
+    assert sys.lazy_probe_loads == 0
+    assert lazy_probe.VALUE == 42
+    assert sys.lazy_probe_loads == 1
+    assert lazy_import("lazy_probe") is lazy_probe
+    monkeypatch.delitem(sys.modules, "lazy_probe")
+
+
+def test_lazy_import_of_a_missing_module():
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("there_is_no_such_module")
+
+
+def test_iter_input_lines(tmp_path):
+    fname = tmp_path / "05.txt"
+    fname.write_bytes(b"    [D]    \r\n[N] [C]    \n\nmove 1 from 2 to 1")
+    assert list(iter_input_lines(fname)) == [b"    [D]", b"[N] [C]", b"", b"move 1 from 2 to 1"]
+    assert list(get_line_items(str(fname))) == ["    [D]", "[N] [C]", "", "move 1 from 2 to 1"]
+    with mapped_input(fname) as mapped:
+        assert mapped[:7] == b"    [D]"
+
+
+def test_mapped_empty_file(tmp_path):
+    fname = tmp_path / "empty.txt"
+    fname.write_bytes(b"")
+    assert list(iter_input_lines(fname)) == []
+    with mapped_input(fname) as mapped:
+        assert len(mapped) == 0
+
+
+def test_byte_grid():
+    lines = ["123", "456"]
+    grid = ByteGrid.from_digit_strings(lines)
+    assert (grid.width, grid.height, len(grid)) == (3, 2, 6)
+    assert grid.to_lists() == two_d_array_from_digit_strings(lines)
+    assert grid[1, 2] == grid[grid.index(1, 2)] == 6
+    assert grid.coord(5) == (1, 2)
+    assert list(grid.coords())[:4] == [(0, 0), (0, 1), (0, 2), (1, 0)]
+    assert list(grid.row(1)) == [4, 5, 6]
+    assert list(grid.column(1)) == [2, 5]
+
+    # views and copies
+    grid.column(0)[1] = 9
+    assert grid[1, 0] == 9
+    copy = grid.copy()
+    copy.fill(7)
+    assert set(copy) == {7} and grid[0, 0] == 1
+    assert grid != copy and grid == grid.copy()
+
+
+def test_byte_grid_must_be_rectangular():
+    with pytest.raises(ValueError):
+        ByteGrid.from_digit_strings(["123", "45"])
+    with pytest.raises(ValueError):
+        ByteGrid(3, 2, bytearray(5))
+
+
+@pytest.mark.parametrize(
+    "lines", [["1a3"], ["12\r", "345"], ["1/3"], ["1é"], ["1\t3", "456"], ["1\x003"]]
+)
+def test_byte_grid_must_be_all_digits(lines):
+    # like digit_grid(), instead of keeping each character's byte value
+    with pytest.raises(ValueError, match="not all digits"):
+        ByteGrid.from_digit_strings(lines)
+
+
+def test_frozen_byte_grid():
+    grid = freeze(ByteGrid.from_digit_strings(["12", "34"]))
+    with pytest.raises(TypeError):
+        grid[0, 0] = 5
+    copy = grid.copy()
+    copy[0, 0] = 5
+    assert (copy[0, 0], grid[0, 0]) == (5, 1)
+
+
+@pytest.mark.parametrize("width, height", [(5, 4), (1, 3), (3, 1), (1, 1)])
+@pytest.mark.parametrize("include_diagonals", [True, False])
+def test_neighbor_table(width, height, include_diagonals):
+    table = neighbor_table(width, height, include_diagonals)
+    assert len(table) == width * height
+    for index in range(width * height):
+        row, col = divmod(index, width)
+        expected = {
+            r * width + c
+            for r, c in neighbors((row, col), height - 1, width - 1, include_diagonals)
+            if (r, c) != (row, col)
+        }
+        assert sorted(table[index]) == list(table[index]) == sorted(expected)
+
+
+@pytest.mark.parametrize("width, height", [(5, 4), (1, 3), (3, 1), (1, 1)])
+def test_orthogonal_neighbors(width, height):
+    table = neighbor_table(width, height, include_diagonals=False)
+    neighbors_of = orthogonal_neighbors(width, height)
+    assert all(neighbors_of(index) == list(table[index]) for index in range(width * height))
+
+
+def test_neighbor_tables_are_shared():
+    assert neighbor_table(10, 10) is neighbor_table(10, 10)
+    assert neighbor_table(10, 10) is not neighbor_table(10, 10, include_diagonals=False)
+
+
+def test_digit_grid():
+    lines = ["2199943210", "3987894921", "9856789892"]
+    grid = digit_grid(lines)
+    assert (grid.dtype.name, grid.shape) == ("uint8", (3, 10))
+    assert grid.tolist() == two_d_array_from_digit_strings(lines)
+    with pytest.raises(ValueError):
+        digit_grid(["12", "3a"])
+    with pytest.raises(ValueError):
+        digit_grid(["12", "3"])
+
+
+def test_shifted():
+    grid = digit_grid(["123", "456"])
+    assert shifted(grid, 0, 1, 0).tolist() == [[2, 3, 0], [5, 6, 0]]
+    assert shifted(grid, -1, 0, 9).tolist() == [[9, 9, 9], [1, 2, 3]]
+    assert shifted(grid, 1, -1, 0).tolist() == [[0, 4, 5], [0, 0, 0]]
+
+
+def test_lower_than_neighbors():
+    grid = digit_grid(["2199943210", "3987894921", "9856789892", "8767896789", "9899965678"])
+    rows, cols = lower_than_neighbors(grid).nonzero()
+    assert list(zip(rows.tolist(), cols.tolist())) == [(0, 1), (0, 9), (2, 2), (4, 6)]
+    # 5 is only lower than all its neighbors if diagonals don't count
+    grid = digit_grid(["191", "959", "191"])
+    assert lower_than_neighbors(grid)[1, 1]
+    assert not lower_than_neighbors(grid, include_diagonals=True)[1, 1]
+
+
+def test_tile_grid():
+    assert tile_grid(digit_grid(["8"])).tolist() == [
+        [8, 9, 1, 2, 3],
+        [9, 1, 2, 3, 4],
+        [1, 2, 3, 4, 5],
+        [2, 3, 4, 5, 6],
+        [3, 4, 5, 6, 7],
+    ]
+    tiled = tile_grid(digit_grid(["12", "89"]), n_tiles=2)
+    assert tiled.tolist() == [[1, 2, 2, 3], [8, 9, 9, 1], [2, 3, 3, 4], [9, 1, 1, 2]]
+
+
+@pytest.mark.parametrize("lines, n_tiles", [(["8"], 5), (["12", "89"], 2), (["123", "456"], 7)])
+def test_tiled_grid(lines, n_tiles):
+    tiled = TiledGrid(ByteGrid.from_digit_strings(lines), n_tiles)
+    expected = tile_grid(digit_grid(lines), n_tiles).tolist()
+    assert (tiled.width, tiled.height, len(tiled)) == (
+        len(lines[0]) * n_tiles,
+        len(lines) * n_tiles,
+        len(lines) * len(lines[0]) * n_tiles**2,
+    )
+    assert tiled.to_lists() == expected
+    assert [tiled[index] for index in range(len(tiled))] == sum(expected, [])
+
+
+def test_huge_tiled_grid():
+    # 50 x 50 tiles of 100 x 100: nothing is made per cell, so this is as quick as 5 x 5
+    tiled = TiledGrid(ByteGrid(100, 100, bytearray([9]) * 10_000), n_tiles=50)
+    assert len(tiled) == 25_000_000
+    assert tiled[4999, 4999] == (9 + 49 + 49 - 1) % 9 + 1
+    assert tiled[tiled.index(4999, 4999)] == tiled[len(tiled) - 1]
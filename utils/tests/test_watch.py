@@ -0,0 +1,152 @@
+"""
+#
+# test_watch.py: Test re-running only the days that a change affects
+#
+"""
+import os
+import sys
+
+import pytest
+
+from utils.loader import LazyDay
+from utils.registry import REGISTRY
+from utils.utils import get_input
+from utils.watch import (
+    DependencyMap,
+    Watcher,
+    changed_files,
+    format_rerun,
+    imported_names,
+    module_name,
+    snapshot,
+)
+
+DAY_SOURCE = """
+from utils.registry import register
+from utils.utils import LazyInput
+{import_common}
+
+input = LazyInput(1999, {day}, transform=int)
+toy_input = [1, 2]
+
+
+def part_1(numbers, verbose=False):
+    return {expression}
+
+
+@register(1999, {day})
+def day_{day}(use_toy_data=False, verbose=False):
+    return [part_1(toy_input if use_toy_data else input)]
+"""
+
+# one day imports a name from common, the other imports common itself
+DAYS = {
+    1: ("from aoc_1999.days.common import FACTOR", "sum(numbers) * FACTOR"),
+    2: ("from aoc_1999.days import common", "len(numbers) * common.FACTOR"),
+}
+
+
+def write(path, text, mtime):
+    with open(path, "w") as f:
+        f.write(text)
+    # far enough apart that a reload can't mistake it for the cached .pyc
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def watcher(tmp_path, monkeypatch):
+    """A made-up aoc_1999, whose days (and inputs) we can change under the watcher"""
+    for dirname in ["aoc_1999/days", "aoc_1999/input"]:
+        (tmp_path / dirname).mkdir(parents=True)
+    (tmp_path / "aoc_1999" / "__init__.py").touch()
+    (tmp_path / "aoc_1999" / "days" / "__init__.py").touch()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    write("aoc_1999/days/common.py", "FACTOR = 1\n", 1_000_000)
+    for day, (import_common, expression) in DAYS.items():
+        source = DAY_SOURCE.format(day=day, import_common=import_common, expression=expression)
+        write(f"aoc_1999/days/day0{day}.py", source, 1_000_000)
+        write(f"aoc_1999/input/0{day}.txt", "1\n2\n3\n", 1_000_000)
+    advents_to_run = [(1999, day, LazyDay(f"day0{day}.py", "aoc_1999")) for day in DAYS]
+    yield Watcher(advents_to_run)
+    for name in list(sys.modules):
+        if name.startswith("aoc_1999"):
+            del sys.modules[name]
+    for day in DAYS:
+        REGISTRY.pop((1999, day), None)
+    get_input.cache_clear()
+
+
+def answers(reruns):
+    return {(rerun.year, rerun.day): rerun.answers for rerun in reruns}
+
+
+def test_changed_files():
+    before = {"a.py": 1, "b.py": 1, "c.py": 1}
+    after = {"a.py": 1, "b.py": 2, "d.py": 1}
+    assert changed_files(before, after) == {"b.py", "c.py", "d.py"}
+
+
+def test_module_name():
+    assert module_name("aoc_2021/days/day05.py") == "aoc_2021.days.day05"
+    assert module_name("utils/__init__.py") == "utils"
+
+
+def test_imported_names(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text(
+        "import os\n"
+        "from utils import utils\n"
+        "from utils.parsed import parse_once\n"
+        'np = lazy_import("numpy")\n'
+    )
+    assert imported_names(str(path)) >= {"os", "utils.utils", "utils.parsed", "numpy"}
+
+
+def test_dependency_map(watcher):
+    dependencies = DependencyMap(snapshot())
+    assert dependencies.affected({"aoc_1999/days/day01.py"}) == (
+        {"aoc_1999.days.day01"},
+        {(1999, 1)},
+    )
+    assert dependencies.affected({"aoc_1999/input/02.txt"}) == (
+        {"aoc_1999.days.day02"},
+        {(1999, 2)},
+    )
+    modules, days = dependencies.affected({"aoc_1999/days/common.py"})
+    assert days == {(1999, 1), (1999, 2)}
+    assert dependencies.reload_order(modules)[0] == "aoc_1999.days.common"
+
+
+def test_watcher_reruns_affected_days(watcher):
+    assert answers(watcher.run()) == {(1999, 1): [6], (1999, 2): [3]}
+    assert watcher.poll() == (set(), [])
+
+    write("aoc_1999/input/01.txt", "1\n2\n3\n4\n", 2_000_000)
+    changed, reruns = watcher.poll()
+    assert changed == {os.path.normpath("aoc_1999/input/01.txt")}
+    assert answers(reruns) == {(1999, 1): [10]}
+    assert reruns[0].previous is not None
+
+    write("aoc_1999/days/common.py", "FACTOR = 10\n", 3_000_000)
+    _, reruns = watcher.poll()
+    assert answers(reruns) == {(1999, 1): [100], (1999, 2): [30]}
+
+
+def test_watcher_reports_reload_errors(watcher):
+    watcher.run()
+    write("aoc_1999/days/common.py", "FACTOR = (\n", 2_000_000)
+    _, reruns = watcher.poll()
+    assert [rerun.answers for rerun in reruns] == [None, None]
+    assert all(rerun.error.startswith("ERROR SyntaxError") for rerun in reruns)
+
+    write("aoc_1999/days/common.py", "FACTOR = 2\n", 3_000_000)
+    _, reruns = watcher.poll()
+    assert answers(reruns) == {(1999, 1): [12], (1999, 2): [6]}
+
+
+def test_format_rerun(watcher):
+    first, _ = watcher.run()
+    assert format_rerun(first).startswith("1999  1: [6]  ")
+    first, _ = watcher.run()
+    assert format_rerun(first).endswith("s)")
@@ -1,36 +1,191 @@
 # ----------------------
 # advent infrastructure
 # ----------------------
-from typing import Any, Generator, List, Set, Tuple
+import contextlib
+import functools
+import importlib.util
+import mmap
+import os
+import sys
 
-from aocd import get_data
+from array import array
+from collections.abc import Sequence
+from types import ModuleType
+from typing import Any, Callable, Generator, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 
 BOLD = "\033[1m"
 CLEAR = "\033[0m"
 
+# Set AOC_OFFLINE=1 to fail fast instead of downloading missing input
+OFFLINE_ENV_VAR = "AOC_OFFLINE"
+
 
 # custom type
 Coord = Tuple[int, int]  # row, column
 Grid = List[List[int]]
 
 
+class InputUnavailableError(Exception):
+    pass
+
+
+def input_path(year: int, day: int) -> str:
+    return f"aoc_{year}/input/{day:02}.txt"
+
+
+def is_offline() -> bool:
+    return os.environ.get(OFFLINE_ENV_VAR, "") not in ("", "0")
+
+
+def fetch_input(year: int, day: int) -> str:
+    """Download a day's input with aocd (needs a session token)"""
+    if is_offline():
+        raise InputUnavailableError(
+            f"{input_path(year, day)} is missing, and {OFFLINE_ENV_VAR} is set"
+        )
+    # aocd is only needed when we actually have to go to the network
+    from aocd import get_data
+
+    return get_data(day=day, year=year)
+
+
+def save_input(year: int, day: int, data: str) -> str:
+    path = input_path(year, day)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # write + rename, so that nobody ever reads half of a file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(data if data.endswith("\n") else data + "\n")
+    os.replace(tmp_path, path)
+    return path
+
+
+@functools.cache
+def get_input(year: int, day: int) -> List[str]:
+    """
+    A day's puzzle input, as a list of lines.
+
+    aoc_{year}/input/{NN}.txt is our on-disk cache: if it's missing,
+    we fetch it once and save it there, so later runs never hit the network.
+    """
+    path = input_path(year, day)
+    if not os.path.exists(path):
+        save_input(year, day, fetch_input(year, day))
+    with open(path) as f:
+        # 2022, day 5: rstrip vs strip: don't strip leading whitespace!
+        return [line.rstrip() for line in f]
+
+
+class LazyInput(Sequence):
+    """
+    A day's input lines, which aren't read (or fetched) until something
+    looks at them. This lets day modules keep a module-level `input`
+    without doing any I/O when they're imported.
+
+        input = LazyInput(2021, 1, transform=int)
+    """
+
+    def __init__(self, year: int, day: int, transform: Optional[Callable] = None):
+        self.year = year
+        self.day = day
+        self.transform = transform
+        self._lines: Optional[List] = None
+
+    @property
+    def lines(self) -> List:
+        if self._lines is None:
+            lines = get_input(self.year, self.day)
+            if self.transform is not None:
+                lines = [self.transform(line) for line in lines]
+            self._lines = lines
+        return self._lines
+
+    def __getitem__(self, index):
+        return self.lines[index]
+
+    def __len__(self):
+        return len(self.lines)
+
+    def __iter__(self):
+        return iter(self.lines)
+
+    def __repr__(self):
+        return f"<LazyInput {self.year} day {self.day}>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    A module that isn't actually loaded until one of its attributes is used,
+    so that heavy imports (numpy, ...) only cost anything on the paths that
+    need them:
+
+        np = lazy_import("numpy")
+
+    (`from numpy import zeros` would load it right away, so use `np.zeros`.)
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition(".")
+    if parent:
+        # like a regular import, so `from utils import bench` finds it too
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+@contextlib.contextmanager
+def mapped_input(fname) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    A whole file as one read-only bytes-like object, without reading it into memory:
+    the OS pages it in as it's looked at (and can drop it again when memory is tight).
+
+        with mapped_input("aoc_2022/input/06.txt") as stream:
+            find_packet_start(stream)
+    """
+    with open(fname, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # (you can't mmap an empty file)
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def iter_input_lines(fname) -> Generator[bytes, None, None]:
+    """
+    A file's lines (as bytes, without trailing whitespace), read lazily from
+    a memory map: only the line being looked at is ever copied.
+    """
+    with mapped_input(fname) as mapped:
+        start = 0
+        while start < len(mapped):
+            end = mapped.find(b"\n", start)
+            if end == -1:
+                end = len(mapped)
+            # 2022, day 5: rstrip vs strip: don't strip leading whitespace!
+            yield mapped[start:end].rstrip()
+            start = end + 1
+
+
 def get_line_items(fname) -> Generator[str, Any, None]:
-    """Read all the lines from an input file into an array of strings"""
+    """The lines of an input file, one at a time, as strings"""
     # expected format
     # get_line_items("aoc_2022/input/07.txt")
     #                 0   4567
-    if fname:
+    if not os.path.exists(fname):
         year = int(fname[4:8])
         day = int(fname[15:17])
-    try:
-        with open(fname) as f:
-            # 2022, day 5: rstrip vs strip: don't strip leading whitespace!
-            return (item.rstrip() for item in f.readlines())
-    except:
-        input = get_data(day=day, year=year)
-        return (item.rstrip() for item in input.split("\n"))
-
+        # fetch (and save) it first
+        get_input(year, day)
+    return (line.decode() for line in iter_input_lines(fname))
 
 
 def parse_one_line_input(input: List[str]) -> List[int]:
@@ -56,6 +211,161 @@ def two_d_array_from_digit_strings(data: List[str]) -> Grid:
     return list(digits_array(number_str) for number_str in data)
 
 
+# b"0".."9" -> 0..9, a whole line at a time (instead of int() per character)
+DIGITS = b"0123456789"
+DIGIT_VALUES = bytes.maketrans(DIGITS, bytes(range(10)))
+
+
+class ByteGrid:
+    """
+    A rectangular grid of small ints (0-255), e.g. a map of digits, kept
+    row-major in one bytearray instead of as a list of lists of ints:
+    each cell is one byte, rather than a pointer to an int object.
+
+        grid = ByteGrid.from_digit_strings(["123", "456"])
+        grid[1, 2]              # 6
+        grid[grid.index(1, 2)]  # 6, for code that keeps flat indexes around
+        grid.row(1)             # memoryview of [4, 5, 6]; writes go to the grid
+    """
+
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(self, width: int, height: int, cells: Optional[Union[bytearray, bytes]] = None):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height) if cells is None else cells
+        if len(self.cells) != width * height:
+            raise ValueError(f"{len(self.cells)} cells don't make a {width}x{height} grid")
+
+    @classmethod
+    def from_digit_strings(cls, data: Iterable[str]) -> "ByteGrid":
+        """["010", "001"] -> a 3x2 grid of 0s and 1s"""
+        lines = list(data)
+        width = len(lines[0]) if lines else 0
+        if any(len(line) != width for line in lines):
+            raise ValueError("rows aren't all the same length")
+        raw = "".join(lines).encode()
+        # translate() keeps anything else (e.g. "a", a stray "\r", or "\t", which
+        # would pass for a 9) as its byte value, so check before translating
+        if raw.translate(None, DIGITS):
+            raise ValueError("not all digits")
+        return cls(width, len(lines), bytearray(raw).translate(DIGIT_VALUES))
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.width + col
+
+    def coord(self, index: int) -> Coord:
+        return divmod(index, self.width)
+
+    def coords(self) -> Iterator[Coord]:
+        return (divmod(index, self.width) for index in range(len(self.cells)))
+
+    def __getitem__(self, key: Union[int, Coord]) -> int:
+        if type(key) is int:
+            return self.cells[key]
+        row, col = key
+        return self.cells[row * self.width + col]
+
+    def __setitem__(self, key: Union[int, Coord], value: int):
+        if type(key) is int:
+            self.cells[key] = value
+        else:
+            row, col = key
+            self.cells[row * self.width + col] = value
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, ByteGrid)
+            and (self.width, self.height) == (other.width, other.height)
+            and self.cells == other.cells
+        )
+
+    def row(self, row: int) -> memoryview:
+        return memoryview(self.cells)[row * self.width : (row + 1) * self.width]
+
+    def column(self, col: int) -> memoryview:
+        return memoryview(self.cells)[col :: self.width]
+
+    def fill(self, value: int):
+        self.cells[:] = bytes((value,)) * len(self.cells)
+
+    def copy(self) -> "ByteGrid":
+        """A grid that can be changed, even if this one is frozen()"""
+        return ByteGrid(self.width, self.height, bytearray(self.cells))
+
+    def frozen(self) -> "ByteGrid":
+        """The same grid, which raises TypeError on any change"""
+        return ByteGrid(self.width, self.height, bytes(self.cells))
+
+    def to_lists(self) -> Grid:
+        return [list(self.row(row)) for row in range(self.height)]
+
+    def __repr__(self):
+        return f"<ByteGrid {self.width}x{self.height}>"
+
+
+class TiledGrid:
+    """
+    n_tiles x n_tiles copies of base (a ByteGrid, or anything with width,
+    height and flat indexes), each one 1 higher than the copy above or left
+    of it, with values above max_value wrapping around to 1 (2021 day 15).
+
+    Like tile_grid(), but the tiled grid is never made: each cell is worked
+    out from base's when it's looked up, so it takes as little memory for
+    50 x 50 tiles as for 5 x 5.
+
+        tiled = TiledGrid(ByteGrid.from_digit_strings(["8"]), n_tiles=5)
+        tiled[0, 1]              # 9
+        tiled[tiled.index(0, 2)]  # 1
+    """
+
+    __slots__ = ("base", "n_tiles", "width", "height", "values", "rows", "cols", "wrapped")
+
+    def __init__(self, base, n_tiles=5, max_value=9):
+        self.base = base
+        # one tile's worth, in a list: quicker to index than base itself
+        self.values = [base[index] for index in range(base.width * base.height)]
+        self.n_tiles = n_tiles
+        self.width = base.width * n_tiles
+        self.height = base.height * n_tiles
+        # (row, col) is base's (row % height, col % width), plus one per
+        # tile across and one per tile down: keep both halves of that for
+        # each row and column, rather than dividing for every lookup
+        self.rows = [
+            ((row % base.height) * base.width, row // base.height) for row in range(self.height)
+        ]
+        self.cols = [(col % base.width, col // base.width) for col in range(self.width)]
+        # value (0 .. max_value) + steps -> what that wraps around to
+        self.wrapped = [(value - 1) % max_value + 1 for value in range(max_value + 2 * n_tiles)]
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.width + col
+
+    def coord(self, index: int) -> Coord:
+        return divmod(index, self.width)
+
+    def __getitem__(self, key: Union[int, Coord]) -> int:
+        row, col = divmod(key, self.width) if type(key) is int else key
+        base_row, row_steps = self.rows[row]
+        base_col, col_steps = self.cols[col]
+        return self.wrapped[self.values[base_row + base_col] + row_steps + col_steps]
+
+    def __len__(self):
+        return self.width * self.height
+
+    def to_lists(self) -> Grid:
+        return [[self[row, col] for col in range(self.width)] for row in range(self.height)]
+
+    def __repr__(self):
+        return f"<TiledGrid {self.n_tiles}x{self.n_tiles} of {self.base!r}>"
+
+
 def vertical_slice(data: List[List[Any]], index: int) -> List[Any]:
     return [item[index] for item in data]
 
@@ -103,3 +413,153 @@ def neighbors(coord: Coord, max_row, max_col, include_diagonals=True) -> Set[Coo
         left(coord),
         right(coord, max_col),
     } ^ {coord}
+
+
+# (row, col) steps to each neighbor, in row-major order
+ORTHOGONAL_STEPS = ((-1, 0), (0, -1), (0, 1), (1, 0))
+ALL_STEPS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+class NeighborTable:
+    """
+    Every cell's neighbors in a width x height grid, by flat (row-major) index,
+    worked out once instead of on every call to neighbors(). Stored CSR-style:
+    cell i's neighbors are indices[offsets[i]:offsets[i + 1]].
+
+        table = neighbor_table(grid.width, grid.height, include_diagonals=False)
+        for neighbor in table[grid.index(row, col)]:
+            grid[neighbor] ...
+    """
+
+    def __init__(self, width: int, height: int, include_diagonals=True):
+        self.width = width
+        self.height = height
+        self.steps = ALL_STEPS if include_diagonals else ORTHOGONAL_STEPS
+        self.offsets = array("l", [0])
+        self.indices = array("l")
+        # rows only differ by whether they're at the top or bottom edge:
+        # work out each kind of row once, and shift it for every row like it
+        rows = {}
+        for row in range(height):
+            kind = (row > 0, row < height - 1)
+            if kind not in rows:
+                rows[kind] = self.row_neighbors(row)
+            relative, ends = rows[kind]
+            start, base = len(self.indices), row * width
+            self.indices.extend([base + index for index in relative])
+            self.offsets.extend([start + end for end in ends])
+        self._indices = memoryview(self.indices)
+
+    def row_neighbors(self, row: int) -> Tuple[List[int], List[int]]:
+        """(neighbors of each cell in row, relative to the row's first cell; where each cell's end)"""
+        relative: List[int] = []
+        ends = []
+        for col in range(self.width):
+            relative.extend(
+                d_row * self.width + col + d_col
+                for d_row, d_col in self.steps
+                if 0 <= row + d_row < self.height and 0 <= col + d_col < self.width
+            )
+            ends.append(len(relative))
+        return relative, ends
+
+    def __getitem__(self, index: int) -> memoryview:
+        return self._indices[self.offsets[index] : self.offsets[index + 1]]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+@functools.cache
+def neighbor_table(width: int, height: int, include_diagonals=True) -> NeighborTable:
+    """A (shared) NeighborTable for grids of this shape"""
+    return NeighborTable(width, height, include_diagonals)
+
+
+def orthogonal_neighbors(width: int, height: int) -> Callable[[int], List[int]]:
+    """
+    neighbors(index) for a width x height grid, not counting diagonals,
+    worked out on each call instead of kept in a NeighborTable: for grids too
+    big to keep every cell's neighbors around (e.g. a TiledGrid of 50 x 50 tiles)
+    """
+    last_row = (height - 1) * width
+
+    def neighbors(index: int) -> List[int]:
+        col = index % width
+        found = []
+        if index >= width:
+            found.append(index - width)
+        if col:
+            found.append(index - 1)
+        if col < width - 1:
+            found.append(index + 1)
+        if index < last_row:
+            found.append(index + width)
+        return found
+
+    return neighbors
+
+
+# -------------------------------------------------------------
+# numpy grids: numpy is only imported once one of these is used
+# -------------------------------------------------------------
+
+np = lazy_import("numpy")
+
+
+def digit_grid(data: List[str]) -> "np.ndarray":
+    """
+    ["010", "001"] -> a 2x3 uint8 array, straight from the bytes of the lines
+    (instead of int() per character, like two_d_array_from_digit_strings())
+    """
+    width = len(data[0]) if data else 0
+    if any(len(line) != width for line in data):
+        raise ValueError("rows aren't all the same length")
+    raw = np.frombuffer("".join(data).encode(), dtype=np.uint8)
+    grid = (raw - ord("0")).reshape(len(data), width)
+    # anything below "0" wrapped around, so this catches both sides
+    if (grid > 9).any():
+        raise ValueError("not all digits")
+    return grid
+
+
+def pad(grid: "np.ndarray", value, width=1) -> "np.ndarray":
+    """grid, with a border of value around it"""
+    return np.pad(grid, width, constant_values=value)
+
+
+def shifted(grid: "np.ndarray", d_row: int, d_col: int, fill) -> "np.ndarray":
+    """
+    Each cell's neighbor at (row + d_row, col + d_col), or fill where that's
+    off the edge: e.g. grid < shifted(grid, -1, 0, 10) is "lower than the cell above"
+    """
+    height, width = grid.shape
+    padded = pad(grid, fill, max(abs(d_row), abs(d_col)))
+    border = (padded.shape[0] - height) // 2
+    return padded[
+        border + d_row : border + d_row + height, border + d_col : border + d_col + width
+    ]
+
+
+def lower_than_neighbors(grid: "np.ndarray", include_diagonals=False) -> "np.ndarray":
+    """A bool array of the cells that are lower than all of their neighbors"""
+    steps = ALL_STEPS if include_diagonals else ORTHOGONAL_STEPS
+    inside = np.zeros(grid.shape, dtype=bool)
+    lower = np.ones(grid.shape, dtype=bool)
+    for d_row, d_col in steps:
+        # a neighbor that's off the edge doesn't count
+        off_edge = shifted(inside, d_row, d_col, True)
+        lower &= off_edge | (grid < shifted(grid, d_row, d_col, 0))
+    return lower
+
+
+def tile_grid(grid: "np.ndarray", n_tiles=5, max_value=9) -> "np.ndarray":
+    """
+    n_tiles x n_tiles copies of grid, each one 1 higher than the copy above or
+    left of it, with values above max_value wrapping around to 1 (2021 day 15)
+    """
+    height, width = grid.shape
+    tile_steps = np.add.outer(np.arange(n_tiles), np.arange(n_tiles))
+    steps = np.repeat(np.repeat(tile_steps, height, axis=0), width, axis=1)
+    tiled = np.tile(grid.astype(np.int64), (n_tiles, n_tiles)) + steps
+    return ((tiled - 1) % max_value + 1).astype(grid.dtype)
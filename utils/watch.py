@@ -0,0 +1,192 @@
+"""
+#
+# watch.py
+#
+# Re-run days as their files change, instead of re-running everything by hand:
+#
+#   aoc.py 2021 --watch --toy
+#
+# Days' sources, inputs and utils/*.py are polled for changes. A change to a
+# day (or its input) re-runs just that day; a change to a utils module re-runs
+# every day that imports it, directly or through other utils modules, found by
+# reading their imports (including lazy_import()s). Changed modules, and the
+# ones that import them, are importlib.reload()ed first, dependencies first.
+#
+"""
+import glob
+import graphlib
+import importlib
+import os
+import re
+import sys
+
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from utils import utils
+from utils.parsed import imported_names
+from utils.runner import format_error, run_advent
+
+WATCHED_PATTERNS = ("aoc_*/days/*.py", "aoc_*/input/*.txt", "utils/*.py")
+POLL_INTERVAL = 0.5  # seconds
+
+DAY_MODULE_PATTERN = re.compile(r"^aoc_(\d+)\.days\.day(\d+)$")  # "aoc_2021.days.day05"
+INPUT_PATTERN = re.compile(r"^aoc_(\d+)/input/(\d+)\.txt$")  # "aoc_2021/input/05.txt"
+
+
+class Rerun(NamedTuple):
+    year: int
+    day: int
+    answers: Optional[List[Any]]
+    error: Optional[str]
+    elapsed: float
+    previous: Optional[float]  # how long the last run of this day took, if there was one
+
+
+def snapshot(patterns: Iterable[str] = WATCHED_PATTERNS) -> Dict[str, int]:
+    """path -> mtime (in ns), for every file that matches patterns"""
+    mtimes = {}
+    for pattern in patterns:
+        for path in glob.glob(pattern):
+            try:
+                mtimes[os.path.normpath(path)] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                pass  # removed while we were looking
+    return mtimes
+
+
+def changed_files(before: Dict[str, int], after: Dict[str, int]) -> Set[str]:
+    """Files that were added, removed, or modified"""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def module_name(path: str) -> str:
+    name = os.path.splitext(os.path.normpath(path))[0].replace(os.sep, ".")
+    return name.removesuffix(".__init__")  # a package is named after its directory
+
+
+def day_of_module(name: str) -> Optional[Tuple[int, int]]:
+    m = DAY_MODULE_PATTERN.match(name)
+    return None if m is None else (int(m.group(1)), int(m.group(2)))
+
+
+def day_of_input(path: str) -> Optional[Tuple[int, int]]:
+    m = INPUT_PATTERN.match(path.replace(os.sep, "/"))
+    return None if m is None else (int(m.group(1)), int(m.group(2)))
+
+
+class DependencyMap:
+    """Which of the watched modules import which others"""
+
+    def __init__(self, paths: Iterable[str]):
+        modules = {module_name(path): path for path in paths if path.endswith(".py")}
+        self.imports: Dict[str, Set[str]] = {
+            name: imported_names(path) & modules.keys() - {name} for name, path in modules.items()
+        }
+
+    def dependents(self, names: Set[str]) -> Set[str]:
+        """names, and every module that imports any of them (however indirectly)"""
+        found = set(names)
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            for other, imports in self.imports.items():
+                if name in imports and other not in found:
+                    found.add(other)
+                    pending.append(other)
+        return found
+
+    def affected(self, changed: Iterable[str]) -> Tuple[Set[str], Set[Tuple[int, int]]]:
+        """(modules to reload, days to re-run) after changed files changed"""
+        names = set()
+        inputs = set()
+        for path in changed:
+            if path.endswith(".py"):
+                names.add(module_name(path))
+            elif (day := day_of_input(path)) is not None:
+                inputs.add(day)
+        # a day's module holds its LazyInput, which has read the old input
+        names.update(name for name in self.imports if day_of_module(name) in inputs)
+        modules = self.dependents(names)
+        days = {day_of_module(name) for name in modules} - {None}
+        return modules, days | inputs
+
+    def reload_order(self, names: Set[str]) -> List[str]:
+        """names, with each one after whatever (else in names) it imports"""
+        graph = {name: self.imports.get(name, set()) & names for name in names}
+        try:
+            return list(graphlib.TopologicalSorter(graph).static_order())
+        except graphlib.CycleError:
+            return sorted(names)
+
+
+def reload_modules(names: List[str]) -> Dict[str, str]:
+    """Reload whichever of names are loaded (in order); {name: error} for any that failed"""
+    errors = {}
+    for name in names:
+        if name not in sys.modules:
+            continue  # it'll be imported fresh if it's ever needed
+        try:
+            importlib.reload(sys.modules[name])
+        except Exception as e:
+            errors[name] = format_error(e)
+    return errors
+
+
+class Watcher:
+    def __init__(self, advents_to_run, use_toy_data=False, patterns=WATCHED_PATTERNS):
+        self.advents_to_run = advents_to_run
+        self.use_toy_data = use_toy_data
+        self.patterns = patterns
+        self.mtimes = snapshot(patterns)
+        self.elapsed: Dict[Tuple[int, int], float] = {}
+
+    def run(
+        self,
+        days: Optional[Set[Tuple[int, int]]] = None,
+        errors: Optional[Dict[Tuple[int, int], str]] = None,
+    ) -> List[Rerun]:
+        """Run days (default: all of ours), except ones that already have errors"""
+        reruns = []
+        for year, day, day_function in self.advents_to_run:
+            if days is not None and (year, day) not in days:
+                continue
+            previous = self.elapsed.get((year, day))
+            if errors and (year, day) in errors:
+                reruns.append(Rerun(year, day, None, errors[(year, day)], 0.0, previous))
+                continue
+            # (no AnswerCache: it doesn't know about every utils module, and we want timings)
+            start = perf_counter()
+            _, _, answers, error = run_advent(year, day, day_function, self.use_toy_data)
+            elapsed = perf_counter() - start
+            reruns.append(Rerun(year, day, answers, error, elapsed, previous))
+            self.elapsed[(year, day)] = elapsed
+        return reruns
+
+    def poll(self) -> Tuple[Set[str], List[Rerun]]:
+        """(changed files, reruns of the days they affect), since we last looked"""
+        mtimes = snapshot(self.patterns)
+        changed = changed_files(self.mtimes, mtimes)
+        self.mtimes = mtimes
+        if not changed:
+            return changed, []
+        dependencies = DependencyMap(mtimes)
+        modules, days = dependencies.affected(changed)
+        failed = reload_modules(dependencies.reload_order(modules))
+        # days that can't run, because they (or something they import) didn't reload
+        errors = {}
+        for name, error in failed.items():
+            for dependent in dependencies.dependents({name}):
+                if (day := day_of_module(dependent)) is not None:
+                    errors.setdefault(day, error)
+        if any(day_of_input(path) is not None for path in changed):
+            utils.get_input.cache_clear()
+        return changed, self.run(days, errors)
+
+
+def format_rerun(rerun: Rerun) -> str:
+    result = rerun.answers if rerun.error is None else rerun.error
+    line = f"{rerun.year} {rerun.day:>2}: {result}  {rerun.elapsed:.3f}s"
+    if rerun.previous is not None and rerun.error is None:
+        line += f" ({rerun.elapsed - rerun.previous:+.3f}s)"
+    return line